@@ -0,0 +1,258 @@
+# async Qdrant uploader
+"""
+Uploads processed data to Qdrant Cloud with asyncio.
+Keeps several upsert batches in flight and retries transient failures.
+"""
+
+import asyncio
+import itertools
+import logging
+import random
+import time
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+import pandas as pd
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
+from qdrant_client.models import Batch
+from collection_profiles import CollectionProfile, get_profile
+from embedded_records import EmbeddedRecords
+from qdrant_uploader import PAYLOAD_INDEXES, build_payloads, point_id
+from sparse_vectors import (AVG_DOC_LEN_KEY, DENSE_VECTOR, SPARSE_VECTOR, SparseEncoder,
+                            sparse_vectors_config)
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying
+TRANSIENT_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+def is_transient(error: Exception) -> bool:
+    """Whether an upsert error is worth retrying."""
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code in TRANSIENT_STATUSES
+    return isinstance(error, (ResponseHandlingException, asyncio.TimeoutError,
+                              ConnectionError, TimeoutError))
+
+
+class AsyncQdrantUploader:
+    """
+    Asyncio variant of ``QdrantUploader`` built on ``AsyncQdrantClient``.
+
+    Up to ``max_in_flight`` upsert batches run concurrently. Transient
+    failures are retried with jittered exponential backoff, and the batch
+    size adapts to the observed upsert latency. A batch that still fails
+    after all retries is recorded instead of aborting the upload.
+
+    Attributes:
+    client : AsyncQdrantClient
+        Qdrant client instance
+    collection_name : str
+        Name of the collection
+    vector_size : int
+        Size of embedding vectors
+    skip_fields : tuple
+        Payload fields not uploaded (e.g. ``HEAVY_FIELDS``)
+    batch_size : int
+        Current batch size (adapted during uploads)
+    failed_ids : list
+        Point IDs of batches that failed after all retries
+    sparse_encoder : SparseEncoder or None
+        Set for hybrid collections (named dense + BM25 sparse vectors); its
+        average document length is kept in the collection metadata
+    """
+
+    def __init__(self, url: str, api_key: str, collection_name: str, vector_size: int,
+                 max_in_flight: int = 4, max_retries: int = 5,
+                 base_delay: float = 0.5, max_delay: float = 30.0,
+                 target_latency: float = 1.0, min_batch_size: int = 16,
+                 max_batch_size: int = 1024, skip_fields: Iterable[str] = (),
+                 on_disk_payload: bool = False,
+                 profile: Union[str, CollectionProfile] = None, hybrid: bool = False,
+                 client: AsyncQdrantClient = None):
+        if client is None and not url:
+            raise ValueError("Qdrant URL not set (QDRANT_URL in .env file)")
+
+        self.collection_name = collection_name
+        self.vector_size = vector_size
+        self.skip_fields = tuple(skip_fields)
+        self.on_disk_payload = on_disk_payload
+        self.profile = get_profile(profile)
+        self.sparse_encoder = SparseEncoder() if hybrid else None
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.target_latency = target_latency
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.batch_size = min_batch_size
+        self.failed_ids = []
+
+        if client is not None:
+            # caller-provided client, e.g. an in-process stand-in in tests
+            self.client = client
+            return
+
+        logger.info(f"Connecting to Qdrant Cloud (async)...")
+        self.client = AsyncQdrantClient(url=url, api_key=api_key, timeout=60)
+
+    async def create_collection(self, recreate: bool = False, payload_indexes: bool = True):
+        """Create or recreate collection (with ``PAYLOAD_INDEXES`` unless disabled)."""
+        if await self.client.collection_exists(self.collection_name):
+            if not recreate:
+                print(f" Collection '{self.collection_name}' already exists!")
+                return
+            print(f" Collection '{self.collection_name}' exists. Deleting...")
+            await self.client.delete_collection(self.collection_name)
+
+        print(f" Creating collection '{self.collection_name}'...")
+        vectors_config = self.profile.vectors_config(self.vector_size)
+        await self.client.create_collection(
+            collection_name=self.collection_name,
+            vectors_config={DENSE_VECTOR: vectors_config} if self.sparse_encoder else vectors_config,
+            sparse_vectors_config=sparse_vectors_config() if self.sparse_encoder else None,
+            hnsw_config=self.profile.hnsw_config(),
+            quantization_config=self.profile.quantization_config(),
+            on_disk_payload=self.on_disk_payload
+        )
+        if payload_indexes:
+            for field, schema in PAYLOAD_INDEXES.items():
+                await self.client.create_payload_index(self.collection_name, field,
+                                                       field_schema=schema, wait=True)
+        if self.sparse_encoder:
+            # a new collection gets its own document length statistics
+            self.sparse_encoder.avg_doc_len = None
+        print(f" Collection created")
+
+    async def fit_sparse_encoder(self, texts: Sequence[str]):
+        """Async ``QdrantUploader.fit_sparse_encoder``: reuse or store the BM25 average length."""
+        if self.sparse_encoder is None or self.sparse_encoder.avg_doc_len is not None:
+            return
+
+        info = await self.client.get_collection(self.collection_name)
+        metadata = info.config.metadata or {}
+        if AVG_DOC_LEN_KEY in metadata:
+            self.sparse_encoder.avg_doc_len = float(metadata[AVG_DOC_LEN_KEY])
+            return
+
+        if self.sparse_encoder.fit(texts).avg_doc_len is None:
+            return
+        await self.client.update_collection(
+            self.collection_name, metadata={AVG_DOC_LEN_KEY: self.sparse_encoder.avg_doc_len})
+        print(f"   BM25 average document length: {self.sparse_encoder.avg_doc_len:.1f} tokens")
+
+    async def upload_data(self, data: Union[pd.DataFrame, EmbeddedRecords],
+                          batch_size: int = 100) -> int:
+        """Upload one DataFrame / EmbeddedRecords, starting at ``batch_size`` (clamped)."""
+        if isinstance(data, pd.DataFrame):
+            data = EmbeddedRecords.from_dataframe(data)
+        self.batch_size = min(self.max_batch_size, max(self.min_batch_size, batch_size))
+        return await self.upload_stream([data])
+
+    async def upload_stream(self, chunks: Iterable[EmbeddedRecords]) -> int:
+        """
+        Upload a stream of embedded chunks with bounded concurrency.
+
+        In hybrid mode, a collection without a stored BM25 average document
+        length gets it from the first chunk.
+
+        Returns:
+        int
+            Number of points uploaded successfully
+        """
+        print(f" Uploading data to Qdrant (async, in flight={self.max_in_flight})")
+
+        self.failed_ids = []
+        if self.sparse_encoder is not None:
+            chunks = iter(chunks)
+            first = next(chunks, None)
+            if first is not None:
+                await self.fit_sparse_encoder(first.payloads['combined_text'].tolist())
+                chunks = itertools.chain([first], chunks)
+
+        slots = asyncio.Semaphore(self.max_in_flight)
+        tasks = []
+        start = time.perf_counter()
+
+        batches = self._iter_batches(chunks)
+        while True:
+            # wait for a free slot before cutting the next batch, so the
+            # batch size can react to latencies of the batches in flight
+            await slots.acquire()
+            next_batch = next(batches, None)
+            if next_batch is None:
+                slots.release()
+                break
+            task = asyncio.create_task(self._upsert_with_retry(*next_batch))
+            task.add_done_callback(lambda _: slots.release())
+            tasks.append(task)
+
+        results = await asyncio.gather(*tasks)
+        uploaded = sum(results)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n Upload complete")
+        print(f"   Uploaded: {uploaded} points in {elapsed:.1f}s "
+              f"({uploaded / elapsed if elapsed else 0:.0f} points/s)")
+        print(f"   Failed: {len(self.failed_ids)} points")
+        print(f"   Final batch size: {self.batch_size}")
+
+        return uploaded
+
+    def _iter_batches(self, chunks: Iterable[EmbeddedRecords]) -> Iterator[Tuple[List, Batch]]:
+        """Cut chunks into upsert batches using the current adaptive size."""
+        for chunk in chunks:
+            ids = [point_id(rid) for rid in chunk.payloads['id']]
+            sparse = None
+            if self.sparse_encoder is not None:
+                sparse = self.sparse_encoder.encode_documents(
+                    chunk.payloads['combined_text'].tolist())
+            i = 0
+            while i < len(chunk):
+                j = i + self.batch_size
+                vectors = chunk.vectors[i:j].tolist()
+                if sparse is not None:
+                    vectors = {DENSE_VECTOR: vectors, SPARSE_VECTOR: sparse[i:j]}
+                yield ids[i:j], Batch(
+                    ids=ids[i:j],
+                    vectors=vectors,
+                    payloads=build_payloads(chunk.payloads.iloc[i:j], self.skip_fields)
+                )
+                i = j
+
+    async def _upsert_with_retry(self, ids: List, batch: Batch) -> int:
+        """Upsert one batch, retrying transient errors. Returns points written."""
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            try:
+                await self.client.upsert(collection_name=self.collection_name,
+                                         points=batch, wait=True)
+            except Exception as e:
+                if not is_transient(e) or attempt == self.max_retries:
+                    logger.error(f"Batch of {len(ids)} points failed: {e}")
+                    self.failed_ids.extend(ids)
+                    return 0
+
+                # full jitter: sleep uniformly up to the exponential cap
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                logger.warning(f"Transient upsert error ({e}), retry {attempt + 1} "
+                               f"in {delay:.2f}s")
+                self._adapt_batch_size(None)
+                await asyncio.sleep(delay)
+                continue
+
+            self._adapt_batch_size(time.perf_counter() - start)
+            return len(ids)
+
+        return 0
+
+    def _adapt_batch_size(self, latency: float):
+        """Grow the batch size while upserts are fast, halve it on slow or failed ones."""
+        if latency is None or latency > self.target_latency:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif latency < self.target_latency / 2:
+            self.batch_size = min(self.max_batch_size, int(self.batch_size * 1.25) + 1)
+
+    async def close(self):
+        """Close the underlying client."""
+        await self.client.close()
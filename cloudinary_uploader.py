@@ -5,14 +5,118 @@ Uploads images from HuggingFace dataset to Cloudinary.
 import logging
 import cloudinary
 import cloudinary.uploader
+import pyarrow.compute as pc
+from datasets import Image as ImageFeature
 from datasets import load_dataset
 from tqdm.auto import tqdm
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from io import BytesIO
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# magic bytes of formats Cloudinary accepts as-is
+IMAGE_SIGNATURES = [
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+    (b'BM', 'bmp'),
+    (b'II*\x00', 'tiff'),
+    (b'MM\x00*', 'tiff'),
+]
+
+
+def sniff_format(data: bytes) -> Optional[str]:
+    """Detect the image format from its leading bytes (None if unsupported)."""
+    for signature, fmt in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return fmt
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def transcode(image) -> BytesIO:
+    """Re-encode a PIL image: PNG if it has transparency, JPEG otherwise."""
+    buffer = BytesIO()
+    if image.mode in ('RGBA', 'LA', 'P'):
+        image.save(buffer, format='PNG')
+    else:
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        image.save(buffer, format='JPEG', quality=95)
+    buffer.seek(0)
+    return buffer
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter allowing at most ``rate`` calls per second.
+    """
+
+    def __init__(self, rate: float = None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call is allowed."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+class UploadManifest:
+    """
+    Append-only JSONL checkpoint of upload results.
+
+    One line per finished upload: ``{"id": ..., "status": "ok", "url": ...}``
+    or ``{"id": ..., "status": "failed", "error": ...}``. Lines are flushed as
+    they are written, so a crashed run loses nothing. The last line for an
+    ID wins when the manifest is read back.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, str]:
+        """Return {id: url} for every successful upload recorded so far."""
+        urls = {}
+        if not self.path.exists():
+            return urls
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # torn last line from a crash
+                    continue
+                if entry.get('status') == 'ok':
+                    urls[entry['id']] = entry['url']
+                else:
+                    urls.pop(entry['id'], None)
+        return urls
+
+    def append(self, entry: dict):
+        """Append one result line and flush it to disk."""
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+
 
 class CloudinaryUploader:
     """
@@ -33,76 +137,226 @@ class CloudinaryUploader:
         print(f"  Cloudinary uploader")
         print(f"   Cloud: {cloud_name}")
 
-    def upload_images(self, dataset_name: str, output_file: str = 'image_urls.json'):
-        """
-        Upload all images from dataset to Cloudinary.
-        """
-        print(f"\n Loading dataset: {dataset_name}")
-        dataset = load_dataset(dataset_name, split='train')
+    @staticmethod
+    def _to_upload_data(image):
+        """Convert a dataset image into something cloudinary can upload."""
+        # raw Arrow value (decode=False): send the original bytes untouched
+        if isinstance(image, dict):
+            data = image.get('bytes')
+            if data is None:
+                return image.get('path')
+            if sniff_format(data):
+                return BytesIO(data)
 
-        print(f" Dataset loaded: {len(dataset)} records")
-        print(f"\n Uploading images to Cloudinary...")
+            # unknown container - decode and transcode as a fallback
+            from PIL import Image
+            return transcode(Image.open(BytesIO(data)))
 
-        image_urls = {}
-        failed = []
+        # converting a PIL Image to Bytes
+        if hasattr(image, 'save'):
+            return transcode(image)
 
-        for i, rec in enumerate(tqdm(dataset, desc="Uploading")):
-            rec_id = rec.get('id', str(i))
-            image = rec.get('image')
+        # If it is a string (Base64 or URL)
+        return image
 
-            if not image:
-                continue
+    def _upload_one(self, public_id: str, image, limiter: RateLimiter) -> str:
+        """Upload one image and return its secure URL."""
+        upload_data = self._to_upload_data(image)
+        limiter.wait()
 
-            try:
-                # converting a PIL Image to Bytes
-                if hasattr(image, 'save'):  # Это PIL Image
-                    buffer = BytesIO()
-                    image.save(buffer, format='JPEG')
-                    buffer.seek(0)
-                    upload_data = buffer
-                else:
-                    # If it is a string (Base64 or URL)
-                    upload_data = image
+        result = cloudinary.uploader.upload(
+            upload_data,
+            public_id=public_id,
+            folder="georgian_attractions",
+            resource_type="auto"
+        )
+        return result['secure_url']
 
-                # upload to Cloudinary
-                result = cloudinary.uploader.upload(
-                    upload_data,
-                    public_id=f"georgian_attractions/{rec_id}",
-                    folder="georgian_attractions",
-                    resource_type="auto"
-                )
+    def _run_uploads(self, jobs: Iterable[Tuple[str, str, Any]], total: int,
+                     manifest: UploadManifest, urls: Dict[str, str],
+                     max_workers: int, rate_limit: float) -> List[Tuple[str, str]]:
+        """
+        Upload ``(key, public_id, image)`` jobs on a thread pool.
 
-                # save URL
-                image_urls[str(rec_id)] = result['secure_url']
+        Successful URLs are stored in ``urls[key]`` and every result is
+        appended to the manifest. Returns the failed (key, error) pairs.
+        """
+        print(f"\n Uploading {total} images to Cloudinary "
+              f"(workers={max_workers}, rate limit={rate_limit or 'none'})...")
 
-                # progress
-                if (i + 1) % 50 == 0:
-                    uploaded = len(image_urls)
-                    print(f"\n   Progress: {uploaded} images uploaded")
+        limiter = RateLimiter(rate_limit)
+        failed = []
+        # cap images waiting in the pool
+        slots = threading.Semaphore(max_workers * 2)
 
+        def upload(key, public_id, image):
+            try:
+                url = self._upload_one(public_id, image, limiter)
+                urls[key] = url
+                manifest.append({'id': key, 'status': 'ok', 'url': url})
             except Exception as e:
                 error_msg = str(e)
-                logger.error(f"Failed to upload {rec_id}: {error_msg}")
-                failed.append((rec_id, error_msg))
+                logger.error(f"Failed to upload {key}: {error_msg}")
+                failed.append((key, error_msg))
+                manifest.append({'id': key, 'status': 'failed', 'error': error_msg})
 
                 # show the first 5 errors
                 if len(failed) <= 5:
-                    print(f"\n    Error for {rec_id}: {error_msg}")
+                    print(f"\n    Error for {key}: {error_msg}")
+            finally:
+                slots.release()
+                progress.update(1)
 
-        # save mapping
-        print(f"\n Saving URL mapping to {output_file}...")
-        with open(output_file, 'w') as f:
-            json.dump(image_urls, f, indent=2)
+        with tqdm(total=total, desc="Uploading") as progress, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for key, public_id, image in jobs:
+                slots.acquire()
+                executor.submit(upload, key, public_id, image)
+
+        return failed
 
+    def _report(self, total: int, uploaded: int, failed: List[Tuple[str, str]]):
+        """Print upload summary."""
         print(f" Upload complete!")
-        print(f"   Total images: {len(dataset)}")
-        print(f"   Uploaded: {len(image_urls)}")
+        print(f"   Total images: {total}")
+        print(f"   Uploaded: {uploaded}")
         print(f"   Failed: {len(failed)}")
-        print(f"   Success rate: {len(image_urls)/(len(dataset) if len(dataset) > 0 else 1)*100:.1f}%")
+        print(f"   Success rate: {uploaded/(total if total > 0 else 1)*100:.1f}%")
 
         if failed:
             print(f"\n  First 5 failed uploads:")
-            for rec_id, error in failed[:5]:
-                print(f"   - {rec_id}: {error[:100]}")
+            for key, error in failed[:5]:
+                print(f"   - {key}: {error[:100]}")
+
+    def upload_images(self, dataset_name: str, output_file: str = 'image_urls.json',
+                      max_workers: int = 8, rate_limit: float = None,
+                      manifest_file: str = None, original_bytes: bool = True):
+        """
+        Upload all images from dataset to Cloudinary.
+
+        Uploads run on a thread pool of ``max_workers`` and are throttled to
+        ``rate_limit`` uploads per second. Every result is appended to a JSONL
+        manifest as it completes; a restarted run skips IDs already uploaded
+        and only retries failures.
+
+        Parameters:
+        dataset_name : str
+            HuggingFace dataset name
+        output_file : str
+            Where the final {id: url} JSON mapping is written
+        max_workers : int
+            Concurrent uploads
+        rate_limit : float, optional
+            Maximum uploads per second
+        manifest_file : str, optional
+            Checkpoint manifest (defaults to ``output_file`` with a .jsonl suffix)
+        original_bytes : bool
+            Load images with ``decode=False`` and upload the stored bytes as-is,
+            transcoding only formats Cloudinary does not accept. With False,
+            every image is decoded to PIL and re-encoded.
+        """
+        manifest = UploadManifest(manifest_file or Path(output_file).with_suffix('.jsonl'))
+        image_urls = manifest.load()
+        if image_urls:
+            print(f"\n Resuming: {len(image_urls)} images already uploaded ({manifest.path})")
+
+        print(f"\n Loading dataset: {dataset_name}")
+        dataset = load_dataset(dataset_name, split='train')
+        if original_bytes and 'image' in dataset.column_names:
+            dataset = dataset.cast_column('image', ImageFeature(decode=False))
+
+        print(f" Dataset loaded: {len(dataset)} records")
+
+        # pick pending records from the id column only (no image decoding)
+        if 'id' in dataset.column_names:
+            rec_ids = [str(rec_id) for rec_id in dataset['id']]
+        else:
+            rec_ids = [str(i) for i in range(len(dataset))]
+        pending = [i for i, rec_id in enumerate(rec_ids) if rec_id not in image_urls]
+
+        # list the pending records that have an image first, so the progress
+        # total is exact; only the Arrow validity bitmap is read, no image bytes
+        if 'image' in dataset.column_names:
+            valid = pc.is_valid(dataset.data.column('image')).to_numpy(zero_copy_only=False)
+            with_image = [i for i in pending if valid[i]]
+        else:
+            with_image = []
+
+        # images themselves are still loaded lazily, one job at a time
+        jobs = (
+            (rec_ids[i], f"georgian_attractions/{rec_ids[i]}", rec['image'])
+            for i, rec in zip(with_image, dataset.select(with_image))
+        )
+        failed = self._run_uploads(jobs, len(with_image), manifest, image_urls,
+                                   max_workers, rate_limit)
+
+        # save mapping
+        print(f"\n Saving URL mapping to {output_file}...")
+        with open(output_file, 'w') as f:
+            json.dump(image_urls, f, indent=2)
 
+        self._report(len(dataset), len(image_urls), failed)
         return image_urls
+
+    def upload_preprocessed(self, dataset_name: str, preprocessor,
+                            output_file: str = 'image_urls.json',
+                            thumbnails_file: str = 'thumbnail_urls.json',
+                            max_workers: int = 8, rate_limit: float = None,
+                            manifest_file: str = None):
+        """
+        Upload renditions from an ``ImagePreprocessor``, once per unique image.
+
+        Records whose photos have the same content hash (e.g. EN/RU
+        translations) share one upload and its URL. The manifest is keyed by
+        content hash, so reruns skip images already uploaded.
+
+        Parameters:
+        dataset_name : str
+            HuggingFace dataset name
+        preprocessor : ImagePreprocessor
+            Stage that produces renditions and content hashes
+        output_file : str
+            Where the {id: url} mapping of full renditions is written
+        thumbnails_file : str
+            Where the {id: url} mapping of thumbnails is written
+        manifest_file : str, optional
+            Checkpoint manifest keyed by content hash (defaults to
+            ``renditions.jsonl`` next to ``output_file``; it must not be
+            shared with ``upload_images``, whose manifest is keyed by record ID)
+
+        Returns:
+        Tuple[Dict, Dict]
+            Image URLs and thumbnail URLs by record ID
+        """
+        hashes = preprocessor.process(dataset_name)
+
+        manifest = UploadManifest(manifest_file or Path(output_file).with_name('renditions.jsonl'))
+        urls = manifest.load()
+
+        jobs = []
+        for content_hash in sorted(set(hashes.values())):
+            paths = preprocessor.renditions(content_hash)
+            if paths is None:
+                continue
+            full, thumb = paths
+            if content_hash not in urls:
+                jobs.append((content_hash, f"georgian_attractions/{content_hash}", str(full)))
+            if f"thumb/{content_hash}" not in urls:
+                jobs.append((f"thumb/{content_hash}",
+                             f"georgian_attractions/thumbs/{content_hash}", str(thumb)))
+
+        print(f"\n {len(hashes)} records share {len(set(hashes.values()))} unique images")
+        failed = self._run_uploads(jobs, len(jobs), manifest, urls, max_workers, rate_limit)
+
+        image_urls = {rec_id: urls[h] for rec_id, h in hashes.items() if h in urls}
+        thumbnail_urls = {rec_id: urls[f"thumb/{h}"] for rec_id, h in hashes.items()
+                          if f"thumb/{h}" in urls}
+
+        print(f"\n Saving URL mappings to {output_file} and {thumbnails_file}...")
+        with open(output_file, 'w') as f:
+            json.dump(image_urls, f, indent=2)
+        with open(thumbnails_file, 'w') as f:
+            json.dump(thumbnail_urls, f, indent=2)
+
+        self._report(len(hashes), len(image_urls), failed)
+        return image_urls, thumbnail_urls
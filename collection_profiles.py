@@ -0,0 +1,149 @@
+# collection profiles
+"""
+Named collection settings: vector storage, HNSW graph and quantization.
+Pick one with ``QdrantUploader(profile=...)`` or COLLECTION_PROFILE in .env.
+"""
+
+from typing import Dict, Optional, Union
+from qdrant_client.models import (BinaryQuantization, BinaryQuantizationConfig, CompressionRatio,
+                                  Distance, HnswConfigDiff, ProductQuantization,
+                                  ProductQuantizationConfig, QuantizationSearchParams,
+                                  ScalarQuantization, ScalarQuantizationConfig, ScalarType,
+                                  SearchParams, VectorParams)
+
+QUANTIZATIONS = (None, 'scalar', 'binary', 'product')
+
+
+class CollectionProfile:
+    """
+    Storage and index settings for a collection.
+
+    Attributes:
+    name : str
+        Profile name
+    quantization : str or None
+        None, 'scalar' (int8), 'binary' (1 bit) or 'product'
+    always_ram : bool
+        Keep quantized vectors in RAM (original vectors may live on disk)
+    on_disk : bool
+        Store original vectors on disk (memory-mapped)
+    hnsw_m : int
+        Links per node in the HNSW graph
+    hnsw_ef_construct : int
+        Candidate list size while building the graph
+    compression : str
+        Product quantization ratio ('x4' ... 'x64')
+    """
+
+    def __init__(self, name: str, quantization: str = None, always_ram: bool = True,
+                 on_disk: bool = False, hnsw_m: int = 16, hnsw_ef_construct: int = 100,
+                 compression: str = 'x16'):
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unknown quantization '{quantization}', use one of {QUANTIZATIONS}")
+
+        self.name = name
+        self.quantization = quantization
+        self.always_ram = always_ram
+        self.on_disk = on_disk
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construct = hnsw_ef_construct
+        self.compression = compression
+
+    def vectors_config(self, size: int) -> VectorParams:
+        """Dense vector settings for ``create_collection``."""
+        return VectorParams(size=size, distance=Distance.COSINE, on_disk=self.on_disk)
+
+    def hnsw_config(self) -> HnswConfigDiff:
+        """HNSW graph settings for ``create_collection``."""
+        return HnswConfigDiff(m=self.hnsw_m, ef_construct=self.hnsw_ef_construct)
+
+    def quantization_config(self):
+        """Quantization settings for ``create_collection`` (None = full precision only)."""
+        if self.quantization == 'scalar':
+            return ScalarQuantization(scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8, quantile=0.99, always_ram=self.always_ram))
+        if self.quantization == 'binary':
+            return BinaryQuantization(binary=BinaryQuantizationConfig(
+                always_ram=self.always_ram))
+        if self.quantization == 'product':
+            return ProductQuantization(product=ProductQuantizationConfig(
+                compression=CompressionRatio(self.compression), always_ram=self.always_ram))
+        return None
+
+    def estimated_ram(self, points: int, dim: int) -> int:
+        """
+        Rough resident bytes for vectors, quantized vectors and the HNSW graph.
+
+        Vectors on disk are counted as zero, although the OS page cache will
+        hold the hot part of them.
+        """
+        ram = 0 if self.on_disk else points * dim * 4
+        if self.quantization == 'scalar':
+            quantized = points * dim
+        elif self.quantization == 'binary':
+            quantized = points * dim // 8
+        elif self.quantization == 'product':
+            quantized = points * dim * 4 // int(self.compression[1:])
+        else:
+            quantized = 0
+        if quantized and self.always_ram:
+            ram += quantized
+        # layer 0 keeps 2*m links per node, 4 bytes each
+        ram += points * self.hnsw_m * 2 * 4
+        return ram
+
+    def __repr__(self) -> str:
+        return (f"CollectionProfile({self.name!r}, quantization={self.quantization}, "
+                f"always_ram={self.always_ram}, on_disk={self.on_disk}, "
+                f"m={self.hnsw_m}, ef_construct={self.hnsw_ef_construct})")
+
+
+PROFILES: Dict[str, CollectionProfile] = {
+    # full-precision vectors in RAM (what create_collection used before profiles)
+    'default': CollectionProfile('default'),
+    # int8 copy in RAM, originals on disk for rescoring: ~4x less RAM
+    'scalar': CollectionProfile('scalar', quantization='scalar', on_disk=True),
+    # 1-bit copy in RAM: ~32x less RAM, needs oversampling + rescore for recall
+    'binary': CollectionProfile('binary', quantization='binary', on_disk=True),
+    # product quantization: highest compression, slowest to build
+    'product': CollectionProfile('product', quantization='product', on_disk=True),
+    # everything on disk except the graph
+    'on-disk': CollectionProfile('on-disk', on_disk=True),
+    # sparser graph: less RAM and faster build, lower recall
+    'hnsw-small': CollectionProfile('hnsw-small', hnsw_m=8, hnsw_ef_construct=64),
+    # denser graph: more RAM, higher recall
+    'hnsw-large': CollectionProfile('hnsw-large', hnsw_m=32, hnsw_ef_construct=256),
+}
+
+
+def get_profile(profile: Union[str, CollectionProfile, None]) -> CollectionProfile:
+    """Resolve a profile name (or None for 'default')."""
+    if isinstance(profile, CollectionProfile):
+        return profile
+    name = profile or 'default'
+    if name not in PROFILES:
+        raise ValueError(f"Unknown collection profile '{name}', use one of {list(PROFILES)}")
+    return PROFILES[name]
+
+
+def search_params(hnsw_ef: int = None, rescore: bool = None,
+                  oversampling: float = None, exact: bool = False) -> Optional[SearchParams]:
+    """
+    Search-time accuracy/speed knobs (None if all are left at server defaults).
+
+    Parameters:
+    hnsw_ef : int, optional
+        Candidate list size while searching the graph (higher = better recall)
+    rescore : bool, optional
+        Re-rank quantized candidates with the original vectors
+    oversampling : float, optional
+        Fetch ``limit * oversampling`` quantized candidates before rescoring
+    exact : bool
+        Skip the index and do a full scan (ground truth)
+    """
+    quantization = None
+    if rescore is not None or oversampling is not None:
+        quantization = QuantizationSearchParams(rescore=rescore, oversampling=oversampling)
+    if hnsw_ef is None and quantization is None and not exact:
+        return None
+    return SearchParams(hnsw_ef=hnsw_ef, exact=exact, quantization=quantization)
@@ -0,0 +1,149 @@
+# collection stats
+"""
+Streaming export and server-side statistics for a Qdrant collection.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterator, List
+from qdrant_client import QdrantClient
+from qdrant_client.models import FieldCondition, Filter, MatchValue, Record
+from tqdm.auto import tqdm
+
+logger = logging.getLogger(__name__)
+
+
+def iter_points(client: QdrantClient, collection_name: str, fields: List[str] = None,
+                with_vectors: bool = False, scroll_filter: Filter = None,
+                page_size: int = 1000) -> Iterator[Record]:
+    """
+    Yield every point of a collection, one scroll page at a time.
+
+    Follows ``next_page_offset`` until the collection is exhausted, so there
+    is no upper limit on the number of points and only one page is held in
+    memory.
+
+    Parameters:
+    fields : List[str], optional
+        Payload fields to fetch (None = whole payload, [] = no payload)
+    with_vectors : bool
+        Also fetch vectors
+    scroll_filter : Filter, optional
+        Only points matching this filter
+    page_size : int
+        Points per scroll request
+    """
+    with_payload = True if fields is None else (list(fields) or False)
+    offset = None
+
+    while True:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            limit=page_size,
+            offset=offset,
+            with_payload=with_payload,
+            with_vectors=with_vectors
+        )
+        yield from points
+        if offset is None:
+            return
+
+
+class CollectionStats:
+    """
+    Counts, facets and exports without pulling full payloads.
+
+    Counts use ``count`` and value distributions use ``facet`` (needs the
+    keyword payload indexes created by ``QdrantUploader.create_collection``).
+    If the server cannot facet a field, the distribution falls back to a
+    scroll that fetches only that field.
+
+    Attributes:
+    client : QdrantClient
+        Qdrant client instance
+    collection_name : str
+        Name of the collection
+    """
+
+    def __init__(self, client: QdrantClient, collection_name: str):
+        self.client = client
+        self.collection_name = collection_name
+
+    def count(self, count_filter: Filter = None) -> int:
+        """Exact number of points (matching ``count_filter``)."""
+        return self.client.count(self.collection_name, count_filter=count_filter,
+                                 exact=True).count
+
+    def facet(self, key: str, limit: int = 100,
+              facet_filter: Filter = None) -> Dict[Any, int]:
+        """
+        Value -> point count for a payload field, most common first.
+
+        For list fields such as ``tags`` every value of a point is counted.
+        """
+        try:
+            response = self.client.facet(self.collection_name, key,
+                                         facet_filter=facet_filter, limit=limit, exact=True)
+            return {hit.value: hit.count for hit in response.hits}
+        except Exception as e:
+            logger.warning(f"Facet on '{key}' failed ({e}), counting from a scroll")
+
+        counts = {}
+        for point in iter_points(self.client, self.collection_name, fields=[key],
+                                 scroll_filter=facet_filter):
+            values = (point.payload or {}).get(key)
+            for value in values if isinstance(values, list) else [values]:
+                counts[value] = counts.get(value, 0) + 1
+        ranked = sorted(counts.items(), key=lambda item: -item[1])
+        return dict(ranked[:limit])
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals, category and language distributions, and image counts."""
+        total = self.count()
+        with_images = self.count(Filter(must=[
+            FieldCondition(key='has_processed_image', match=MatchValue(value=True))
+        ]))
+        return {
+            'total': total,
+            'categories': self.facet('category'),
+            'languages': self.facet('language'),
+            'with_images': with_images,
+            'without_images': total - with_images,
+        }
+
+    def export(self, path: str, fields: List[str] = None,
+               export_filter: Filter = None, page_size: int = 1000) -> int:
+        """
+        Stream points to a JSONL file, one ``{"point_id": ..., **payload}`` per line.
+
+        Returns:
+        int
+            Number of points written
+        """
+        written = 0
+        with open(path, 'w', encoding='utf-8') as f:
+            points = iter_points(self.client, self.collection_name, fields=fields,
+                                 scroll_filter=export_filter, page_size=page_size)
+            for point in tqdm(points, desc="Exporting"):
+                row = {'point_id': str(point.id), **(point.payload or {})}
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+                written += 1
+
+        print(f" Exported {written} points to {path}")
+        return written
+
+    @staticmethod
+    def print_summary(summary: Dict[str, Any]):
+        """Print a ``summary()`` result."""
+        print("\n Database Statistics:")
+        print(f"   Total records: {summary['total']}")
+        print(f"\n Categories:")
+        for category, count in summary['categories'].items():
+            print(f"   - {category}: {count}")
+        print(f"\n Languages:")
+        for language, count in summary['languages'].items():
+            print(f"   - {language}: {count}")
+        print(f"\n Images:")
+        print(f"   - With images: {summary['with_images']}")
+        print(f"   - Without images: {summary['without_images']}")
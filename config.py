@@ -19,23 +19,41 @@ class Config:
     EMBEDDING_MODEL = 'sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2'
     VECTOR_SIZE = 384
     DEVICE = 'cuda'  # or 'cpu'
+    # inference backend: 'torch', 'onnx' or 'onnx-int8'
+    EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'torch')
+    # CPU worker processes for encoding (0 = single process, 'auto' = one per physical core)
+    ENCODING_WORKERS = os.getenv('ENCODING_WORKERS', '0').strip().lower()
+    ENCODING_WORKERS = ENCODING_WORKERS if ENCODING_WORKERS == 'auto' else int(ENCODING_WORKERS)
     # processing
     BATCH_SIZE = 32
+    # collection profile: vector storage, HNSW and quantization (see collection_profiles.py)
+    COLLECTION_PROFILE = os.getenv('COLLECTION_PROFILE', 'default')
+    # payload fields not uploaded, comma separated (e.g. "combined_text")
+    PAYLOAD_SKIP_FIELDS = [f.strip() for f in os.getenv('PAYLOAD_SKIP_FIELDS', '').split(',') if f.strip()]
+    # keep payloads on disk in Qdrant (applies when the collection is created)
+    ON_DISK_PAYLOAD = os.getenv('ON_DISK_PAYLOAD', 'false').lower() == 'true'
+    # hybrid collection: named dense vector + BM25 sparse vector (applies when created)
+    HYBRID_SEARCH = os.getenv('HYBRID_SEARCH', 'false').lower() == 'true'
+    # one point per EN/RU translation pair with en/ru named vectors (applies when created)
+    PAIR_TRANSLATIONS = os.getenv('PAIR_TRANSLATIONS', 'false').lower() == 'true'
+    # embedding cache (optional - re-runs only encode new or changed text)
+    EMBEDDING_CACHE_DIR = os.getenv('EMBEDDING_CACHE_DIR')
     # cloudinary
     CLOUDINARY_CLOUD_NAME = os.getenv('CLOUDINARY_CLOUD_NAME')
     CLOUDINARY_API_KEY = os.getenv('CLOUDINARY_API_KEY')
     CLOUDINARY_API_SECRET = os.getenv('CLOUDINARY_API_SECRET')
 
     @classmethod
-    def validate(cls):
-        """Validate that all required config is present."""
-        # qdrant required
+    def validate_qdrant(cls):
+        """Validate Qdrant credentials (call before connecting)."""
         if not cls.QDRANT_URL:
             raise ValueError("QDRANT_URL not set in .env file")
         if not cls.QDRANT_API_KEY:
             raise ValueError("QDRANT_API_KEY not set in .env file")
 
-        # cloudinary optional (only if uploading images)
+    @classmethod
+    def validate_cloudinary(cls):
+        """Validate Cloudinary credentials (optional, only if uploading images)."""
         if cls.CLOUDINARY_CLOUD_NAME:
             if not cls.CLOUDINARY_API_KEY:
                 raise ValueError("CLOUDINARY_API_KEY not set in .env file")
@@ -43,8 +61,13 @@ class Config:
                 raise ValueError("CLOUDINARY_API_SECRET not set in .env file")
             print(" Cloudinary credentials loaded")
 
+    @classmethod
+    def validate(cls):
+        """Validate that all required config is present."""
+        cls.validate_qdrant()
+        cls.validate_cloudinary()
         print(" Configuration validated")
 
 
-# validate on import
-Config.validate()
+# validation is done at the point of use (e.g. Config.validate_qdrant()
+# before connecting), so embedding-only jobs need no Qdrant credentials
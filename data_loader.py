@@ -6,7 +6,10 @@ Images are NOT loaded to save memory - will be uploaded to Cloudinary separately
 """
 
 import logging
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
+import pyarrow as pa
+import pyarrow.compute as pc
+from datasets import Image as ImageFeature
 from datasets import load_dataset
 from tqdm.auto import tqdm
 import gc
@@ -25,6 +28,20 @@ def safe_str(value: Any) -> str:
     return str(value).strip()
 
 
+def _normalize_text_column(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Columnar equivalent of safe_str: null -> '', cast to string, strip."""
+    if not pa.types.is_string(column.type):
+        column = column.cast(pa.string())
+    return pc.utf8_trim_whitespace(pc.fill_null(column, ""))
+
+
+def _skip_image_decoding(dataset):
+    """Keep the image column as raw Arrow data so rows never decode to PIL."""
+    if dataset.features and 'image' in dataset.features:
+        dataset = dataset.cast_column('image', ImageFeature(decode=False))
+    return dataset
+
+
 class GeorgianAttractionsDataLoader:
     """
     Loads and normalizes the georgian-attractions dataset.
@@ -39,6 +56,34 @@ class GeorgianAttractionsDataLoader:
         self.dataset_name = dataset_name
         logger.info(f"Initialized DataLoader for: {dataset_name}")
 
+    @staticmethod
+    def _normalize_record(rec: Dict[str, Any], i: int) -> Dict[str, Any]:
+        """Normalize a single raw dataset row (image data is dropped)."""
+        return {
+            # core fields
+            'id': safe_str(rec.get('id', str(i))),
+            'name': safe_str(rec.get('name')),
+            'description': safe_str(rec.get('description')),
+            'location': safe_str(rec.get('location')),
+            'category': safe_str(rec.get('category')),
+
+            # additional fields
+            'tags': rec.get('tags', []),
+            'language': safe_str(rec.get('language', 'en')).upper(),
+
+            # image metadata (but NOT the image data itself!)
+            'photo_name': safe_str(rec.get('photo_name', '')),
+            'photo_author': safe_str(rec.get('photo_author', '')),
+            'license': safe_str(rec.get('license', '')),
+
+            # image flags (will be updated with Cloudinary URLs later)
+            'has_processed_image': bool(rec.get('image')),
+            'image_url': None,
+
+            # for compatibility - explicitly NOT loading image
+            'image': None
+        }
+
     def load(self, sample_size: int = None) -> List[Dict[str, Any]]:
         """
         Load dataset and return normalized records WITHOUT images.
@@ -55,7 +100,7 @@ class GeorgianAttractionsDataLoader:
         print(f" Loading the dataset (text only - no images))")
 
         # Load dataset
-        dataset = load_dataset(self.dataset_name, split='train')
+        dataset = _skip_image_decoding(load_dataset(self.dataset_name, split='train'))
 
         if sample_size:
             dataset = dataset.select(range(min(sample_size, len(dataset))))
@@ -65,33 +110,10 @@ class GeorgianAttractionsDataLoader:
         print(f" Normalizing records (skipping images to save RAM)...")
 
         # normalize records
-        records = []
-        for i, rec in enumerate(tqdm(dataset, desc="Processing")):
-            record = {
-                # core fields
-                'id': safe_str(rec.get('id', str(i))),
-                'name': safe_str(rec.get('name')),
-                'description': safe_str(rec.get('description')),
-                'location': safe_str(rec.get('location')),
-                'category': safe_str(rec.get('category')),
-
-                # additional fields
-                'tags': rec.get('tags', []),
-                'language': safe_str(rec.get('language', 'en')).upper(),
-
-                # image metadata (but NOT the image data itself!)
-                'photo_name': safe_str(rec.get('photo_name', '')),
-                'photo_author': safe_str(rec.get('photo_author', '')),
-                'license': safe_str(rec.get('license', '')),
-
-                # image flags (will be updated with Cloudinary URLs later)
-                'has_processed_image': bool(rec.get('image')),
-                'image_url': None,
-
-                # for compatibility - explicitly NOT loading image
-                'image': None
-            }
-            records.append(record)
+        records = [
+            self._normalize_record(rec, i)
+            for i, rec in enumerate(tqdm(dataset, desc="Processing"))
+        ]
 
         # clean memory
         del dataset
@@ -102,3 +124,157 @@ class GeorgianAttractionsDataLoader:
         print(f" Memory saved by NOT loading {sum(1 for r in records if r['has_processed_image'])} images")
 
         return records
+
+    @staticmethod
+    def _normalize_table(table: pa.Table, offset: int = 0) -> pa.Table:
+        """
+        Normalize a batch of raw rows with Arrow compute kernels.
+
+        Produces the same fields as ``_normalize_record`` but works on whole
+        columns. ``has_processed_image`` comes from the nullness of the
+        image column, so image bytes are never touched.
+        """
+        n = table.num_rows
+        columns = {}
+
+        if 'id' in table.column_names:
+            columns['id'] = _normalize_text_column(table.column('id'))
+        else:
+            columns['id'] = pa.array([str(i) for i in range(offset, offset + n)])
+
+        for name in ['name', 'description', 'location', 'category']:
+            if name in table.column_names:
+                columns[name] = _normalize_text_column(table.column(name))
+            else:
+                columns[name] = pa.array([""] * n)
+
+        if 'tags' in table.column_names:
+            columns['tags'] = table.column('tags')
+        else:
+            columns['tags'] = pa.array([[] for _ in range(n)], type=pa.list_(pa.string()))
+
+        if 'language' in table.column_names:
+            columns['language'] = pc.utf8_upper(_normalize_text_column(table.column('language')))
+        else:
+            columns['language'] = pa.array(["EN"] * n)
+
+        for name in ['photo_name', 'photo_author', 'license']:
+            if name in table.column_names:
+                columns[name] = _normalize_text_column(table.column(name))
+            else:
+                columns[name] = pa.array([""] * n)
+
+        if 'image' in table.column_names:
+            columns['has_processed_image'] = pc.is_valid(table.column('image'))
+        else:
+            columns['has_processed_image'] = pa.array([False] * n)
+
+        columns['image_url'] = pa.nulls(n, pa.string())
+        columns['image'] = pa.nulls(n, pa.string())
+
+        return pa.table(columns)
+
+    def load_columnar(self, sample_size: int = None,
+                      num_proc: int = None) -> List[Dict[str, Any]]:
+        """
+        Load dataset and normalize it column-wise WITHOUT images.
+
+        Same output as ``load`` but normalization runs as Arrow compute over
+        batched ``Dataset.map`` (optionally across ``num_proc`` processes)
+        instead of a Python loop over rows. The image column is only checked
+        for nullness and is never decoded.
+
+        Parameters:
+        sample_size : int, optional
+            Limit number of records for testing
+        num_proc : int, optional
+            Number of worker processes for ``Dataset.map``
+
+        Returns:
+        List[Dict]
+            Normalized records (text only, no images in memory)
+        """
+        logger.info(f"Loading dataset (columnar): {self.dataset_name}")
+        print(f" Loading the dataset (columnar, text only - no images)")
+
+        dataset = load_dataset(self.dataset_name, split='train')
+
+        if sample_size:
+            dataset = dataset.select(range(min(sample_size, len(dataset))))
+            logger.info(f"Limited to sample: {len(dataset)} records")
+
+        print(f" Dataset loaded: {len(dataset)} records")
+        print(f" Normalizing columns (num_proc={num_proc})...")
+
+        normalized = dataset.with_format('arrow').map(
+            lambda table, idx: self._normalize_table(table, offset=idx[0] if idx else 0),
+            batched=True,
+            batch_size=1000,
+            with_indices=True,
+            num_proc=num_proc,
+            remove_columns=dataset.column_names,
+            desc="Normalizing"
+        )
+        records = normalized.data.table.to_pylist()
+
+        # clean memory
+        del dataset, normalized
+        gc.collect()
+
+        logger.info(f" Normalized {len(records)} records (columnar)")
+        print(f" Normalized {len(records)} records")
+        print(f" Memory saved by NOT loading {sum(1 for r in records if r['has_processed_image'])} images")
+
+        return records
+
+    def iter_records(self, sample_size: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream normalized records one by one without materializing the dataset.
+
+        Backed by ``load_dataset(..., streaming=True)``, so memory stays
+        constant regardless of corpus size.
+
+        Parameters:
+        sample_size : int, optional
+            Limit number of records for testing
+
+        Yields:
+        Dict
+            Normalized record (text only, no images in memory)
+        """
+        logger.info(f"Streaming dataset: {self.dataset_name}")
+
+        dataset = load_dataset(self.dataset_name, split='train', streaming=True)
+        dataset = _skip_image_decoding(dataset)
+
+        if sample_size:
+            dataset = dataset.take(sample_size)
+            logger.info(f"Limited to sample: {sample_size} records")
+
+        for i, rec in enumerate(dataset):
+            yield self._normalize_record(rec, i)
+
+    def iter_batches(self, batch_size: int = 32,
+                     sample_size: int = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream normalized records in lists of ``batch_size``.
+
+        Parameters:
+        batch_size : int
+            Number of records per batch
+        sample_size : int, optional
+            Limit number of records for testing
+
+        Yields:
+        List[Dict]
+            Batch of normalized records (the last batch may be shorter)
+        """
+        batch = []
+        for record in self.iter_records(sample_size=sample_size):
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
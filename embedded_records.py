@@ -0,0 +1,43 @@
+# embedded records
+"""
+Container for generated embeddings: a contiguous float32 matrix plus payload columns.
+"""
+
+from typing import TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class EmbeddedRecords:
+    """
+    Embeddings stored as one contiguous float32 matrix plus payload columns.
+
+    Attributes:
+    vectors : np.ndarray
+        ``(n, vector_size)`` float32 matrix; row ``i`` belongs to ``payloads.iloc[i]``
+    payloads : pd.DataFrame
+        Record fields without the embedding
+    """
+
+    def __init__(self, vectors: np.ndarray, payloads: 'pd.DataFrame'):
+        if len(vectors) != len(payloads):
+            raise ValueError(f"Got {len(vectors)} vectors for {len(payloads)} payload rows")
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.payloads = payloads.drop(columns=['embedding'], errors='ignore')
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    @classmethod
+    def from_dataframe(cls, df: 'pd.DataFrame') -> 'EmbeddedRecords':
+        """Convert a legacy DataFrame with an ``embedding`` object column."""
+        vectors = np.stack(df['embedding'].to_numpy()) if len(df) else np.zeros((0, 0))
+        return cls(vectors, df)
+
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """Legacy layout: one DataFrame with an ``embedding`` object column."""
+        df = self.payloads.copy()
+        df['embedding'] = list(self.vectors)
+        return df
@@ -0,0 +1,179 @@
+# embedding cache
+"""
+Persistent, content-addressed cache for embedding vectors.
+Vectors live in a memory-mapped float32 file, the index in a small .npz file.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+KEY_BYTES = 16
+
+
+class EmbeddingCache:
+    """
+    On-disk cache of embeddings keyed by (model name, variant, hash of text).
+
+    Each model and variant (inference backend, e.g. 'onnx-int8-avx2', whose
+    vectors differ slightly from eager PyTorch) gets its own sub-directory holding ``vectors.f32`` (a
+    fixed-capacity float32 memmap) and ``index.npz`` (16-byte text digests,
+    their slot in the memmap and a last-used tick). When the cache is full
+    the least recently used entries are evicted.
+
+    Attributes:
+    model_name : str
+        Model the cached vectors belong to
+    variant : str
+        Backend that produced the vectors (see ``EmbeddingsGenerator.cache_variant``)
+    dim : int
+        Vector size
+    capacity : int
+        Maximum number of cached vectors (derived from ``max_bytes``)
+    hits, misses : int
+        Lookup counters since the cache was opened
+    """
+
+    def __init__(self, cache_dir: str, model_name: str, dim: int,
+                 max_bytes: int = 256 * 1024 * 1024, variant: str = 'torch'):
+        self.model_name = model_name
+        self.variant = variant
+        self.dim = dim
+        self.capacity = max(1, max_bytes // (dim * 4))
+        self.hits = 0
+        self.misses = 0
+
+        self.path = self.cache_path(cache_dir, model_name, variant)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = self.path / 'vectors.f32'
+        self._index_path = self.path / 'index.npz'
+
+        self._slots = {}
+        self._keys_by_slot = [None] * self.capacity
+        self._ticks = np.zeros(self.capacity, dtype=np.int64)
+        self._tick = 0
+        self._load_index()
+
+        mode = 'r+' if self._vectors_path.exists() else 'w+'
+        self._vectors = np.memmap(self._vectors_path, dtype=np.float32,
+                                  mode=mode, shape=(self.capacity, dim))
+
+        logger.info(f"Embedding cache: {len(self._slots)} vectors in {self.path}")
+
+    @staticmethod
+    def cache_path(cache_dir: str, model_name: str, variant: str = 'torch') -> Path:
+        """Sub-directory holding the vectors of one model and variant."""
+        model_key = hashlib.sha1(f"{model_name}|{variant}".encode('utf-8')).hexdigest()[:16]
+        return Path(cache_dir) / model_key
+
+    @classmethod
+    def stored_dim(cls, cache_dir: str, model_name: str, variant: str = 'torch') -> Optional[int]:
+        """Vector size recorded in an existing cache index, or None if there is none."""
+        index_path = cls.cache_path(cache_dir, model_name, variant) / 'index.npz'
+        if not index_path.exists():
+            return None
+        with np.load(index_path) as index:
+            return int(index['dim'])
+
+    def _load_index(self):
+        """Load the key -> slot index written by ``flush``."""
+        if not self._index_path.exists():
+            return
+
+        index = np.load(self._index_path)
+        if int(index['dim']) != self.dim or int(index['capacity']) != self.capacity:
+            # incompatible layout - start from an empty cache
+            logger.warning(f"Embedding cache layout changed, resetting {self.path}")
+            self._vectors_path.unlink(missing_ok=True)
+            return
+
+        for key, slot in zip(index['keys'], index['slots']):
+            self._slots[key.tobytes()] = int(slot)
+            self._keys_by_slot[int(slot)] = key.tobytes()
+        self._ticks[index['slots']] = index['ticks']
+        self._tick = int(index['ticks'].max()) if len(index['ticks']) else 0
+
+    def _key(self, text: str) -> bytes:
+        """Content hash of a text."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=KEY_BYTES).digest()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def get_many(self, texts: List[str]) -> Tuple[np.ndarray, List[int]]:
+        """
+        Look up cached vectors for ``texts``.
+
+        Returns:
+        Tuple[np.ndarray, List[int]]
+            ``(n, dim)`` float32 array with cached rows filled in, and the
+            positions of texts that were not found
+        """
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        missing = []
+
+        self._tick += 1
+        for i, text in enumerate(texts):
+            slot = self._slots.get(self._key(text))
+            if slot is None:
+                missing.append(i)
+            else:
+                out[i] = self._vectors[slot]
+                self._ticks[slot] = self._tick
+
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+        return out, missing
+
+    def put_many(self, texts: List[str], vectors: np.ndarray):
+        """Store vectors for ``texts``, evicting least recently used entries."""
+        self._tick += 1
+        for text, vector in zip(texts, vectors):
+            key = self._key(text)
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._free_slot()
+                self._slots[key] = slot
+                self._keys_by_slot[slot] = key
+            self._vectors[slot] = vector
+            self._ticks[slot] = self._tick
+
+    def _free_slot(self) -> int:
+        """Return an unused slot, evicting the oldest entry if full."""
+        # slots are filled densely and evicted slots are reused in place
+        if len(self._slots) < self.capacity:
+            return len(self._slots)
+
+        slot = int(np.argmin(self._ticks))
+        del self._slots[self._keys_by_slot[slot]]
+        return slot
+
+    def flush(self):
+        """Persist vectors and index to disk."""
+        self._vectors.flush()
+
+        # raw uint8 rows: numpy 'S' strings would drop trailing NUL bytes
+        keys = np.frombuffer(b''.join(self._slots.keys()), dtype=np.uint8)
+        keys = keys.reshape(-1, KEY_BYTES)
+        slots = np.array(list(self._slots.values()), dtype=np.int64)
+
+        tmp_path = self.path / 'index.tmp.npz'
+        np.savez(tmp_path, keys=keys, slots=slots, ticks=self._ticks[slots],
+                 dim=self.dim, capacity=self.capacity)
+        os.replace(tmp_path, self._index_path)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and occupancy."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': len(self._slots),
+            'capacity': self.capacity,
+        }
@@ -4,11 +4,15 @@ Creates embeddings for text data using SentenceTransformers.
 """
 
 import logging
-from typing import List, Dict, Any
-import pandas as pd
-import torch
-from sentence_transformers import SentenceTransformer
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Union
+import numpy as np
 from tqdm.auto import tqdm
+from embedded_records import EmbeddedRecords
+from embedding_cache import EmbeddingCache
+from encoding_pool import EncodingPool, physical_cores
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -22,20 +26,101 @@ class EmbeddingsGenerator:
         SentenceTransformer model name
     device : str
         'cuda' or 'cpu'
+    model : SentenceTransformer
+        Loaded lazily on first use (see ``warmup``)
+    cache : EmbeddingCache or None
+        Persistent vector cache, enabled by passing ``cache_dir``
+    backend : str
+        Inference backend: 'torch', 'onnx' or 'onnx-int8'
+    quantization : str
+        Dynamic quantization target for 'onnx-int8' (e.g. 'avx2', 'avx512_vnni')
+    num_workers : int
+        CPU worker processes for encoding (0 = encode in this process;
+        pass 'auto' for one per physical core / ``threads_per_worker``)
+    vector_size : int
+        Embedding dimension; taken from the argument, the cache index or,
+        as a last resort, the loaded model
     """
 
-    def __init__(self, model_name: str, device: str = 'cuda'):
+    def __init__(self, model_name: str, device: str = 'cuda',
+                 cache_dir: str = None, cache_max_bytes: int = 256 * 1024 * 1024,
+                 num_workers: Union[int, str] = 0, threads_per_worker: int = 1,
+                 backend: str = 'torch', quantization: str = 'avx2',
+                 vector_size: int = None):
         self.model_name = model_name
-        self.device = device if torch.cuda.is_available() else 'cpu'
+        self.backend = backend
+        self.quantization = quantization
+        if num_workers == 'auto':
+            num_workers = max(1, physical_cores() // threads_per_worker)
+        self.num_workers = int(num_workers)
+        self.threads_per_worker = threads_per_worker
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+
+        # model, cache and worker pool are created on first use
+        self._requested_device = device
+        self._device = None
+        self._model = None
+        self._vector_size = vector_size
+        self._cache = None
+        self._pool = None
+
+        logger.info(f"Embedding model {model_name} ({backend}) will load on first use")
+
+    @property
+    def device(self) -> str:
+        """Requested device, falling back to 'cpu' when CUDA is unavailable."""
+        if self._device is None:
+            import torch
+            self._device = self._requested_device if torch.cuda.is_available() else 'cpu'
+        return self._device
+
+    @property
+    def model(self):
+        """The SentenceTransformer, loaded on first access."""
+        if self._model is None:
+            from model_backends import load_model
 
-        logger.info(f"Loading embedding model: {model_name}")
-        print(f"Loading embedding model")
-        print(f"Model: {model_name}")
-        print(f"Device: {self.device}")
+            logger.info(f"Loading embedding model: {self.model_name}")
+            print(f"Loading embedding model")
+            print(f"Model: {self.model_name}")
+            print(f"Device: {self.device}")
+            print(f"Backend: {self.backend}")
 
-        self.model = SentenceTransformer(model_name, device=self.device)
+            self._model = load_model(self.model_name, device=self.device,
+                                     backend=self.backend, quantization=self.quantization)
+        return self._model
 
-        # test
+    @property
+    def vector_size(self) -> int:
+        """Embedding dimension of the model."""
+        if self._vector_size is None:
+            self._vector_size = self.model.get_sentence_embedding_dimension()
+        return self._vector_size
+
+    @property
+    def cache_variant(self) -> str:
+        """Cache key part for the backend: 'torch', 'onnx' or 'onnx-int8-<target>'."""
+        if self.backend == 'onnx-int8':
+            return f"{self.backend}-{self.quantization}"
+        return self.backend
+
+    @property
+    def cache(self):
+        """Persistent vector cache, or None if ``cache_dir`` was not given."""
+        if self._cache is None and self.cache_dir:
+            if self._vector_size is None:
+                # a fully cached run should not have to load the model
+                self._vector_size = EmbeddingCache.stored_dim(self.cache_dir, self.model_name,
+                                                              self.cache_variant)
+            self._cache = EmbeddingCache(self.cache_dir, self.model_name, self.vector_size,
+                                         max_bytes=self.cache_max_bytes,
+                                         variant=self.cache_variant)
+            print(f" Embedding cache: {len(self._cache)} vectors in {self._cache.path}")
+        return self._cache
+
+    def warmup(self):
+        """Load the model and run one throwaway encode so the first query is fast."""
         test_vector = self.model.encode("Test")
         print(f" Model loaded. Vector size: {len(test_vector)}")
 
@@ -64,19 +149,154 @@ class EmbeddingsGenerator:
 
         return " | ".join(parts)
 
-    def generate(self, records: List[Dict[str, Any]], batch_size: int = 32) -> pd.DataFrame:
+    def token_lengths(self, texts: List[str]) -> np.ndarray:
+        """Number of tokens the model will see for each text (after truncation)."""
+        encoded = self.model.tokenizer(
+            texts,
+            truncation=True,
+            max_length=self.model.max_seq_length
+        )
+        return np.array([len(ids) for ids in encoded['input_ids']], dtype=np.int64)
+
+    def _plan_batches(self, texts: List[str], batch_size: int,
+                      max_tokens: int = None) -> List[np.ndarray]:
         """
-        Generate embeddings for all records.
+        Split text positions into encoding batches.
+
+        Without ``max_tokens`` batches are consecutive slices in input order.
+        With ``max_tokens`` texts are sorted by token length and grouped so
+        that ``len(batch) * longest_text`` (the padded size of the batch)
+        stays within the budget, capped at ``batch_size`` texts.
+        """
+        if not max_tokens:
+            return [np.arange(i, min(i + batch_size, len(texts)))
+                    for i in range(0, len(texts), batch_size)]
+
+        lengths = self.token_lengths(texts)
+        order = np.argsort(-lengths, kind='stable')
+
+        batches = []
+        start = 0
+        while start < len(order):
+            # longest text comes first, so it sets the padded length
+            longest = max(int(lengths[order[start]]), 1)
+            size = max(1, min(batch_size, max_tokens // longest))
+            batches.append(order[start:start + size])
+            start += size
+
+        return batches
+
+    def _encode_batches(self, texts: List[str], batch_size: int,
+                        show_progress: bool = True,
+                        max_tokens: int = None) -> np.ndarray:
+        """Encode texts batch by batch and return vectors in input order."""
+        plan = self._plan_batches(texts, batch_size, max_tokens)
+
+        if self.num_workers and self.device == 'cpu':
+            # fan batches out to the worker pool, results come back in order;
+            # the model lives in the workers, so size the output from the first batch
+            embeddings = None
+            results = self._get_pool().map([[texts[i] for i in positions]
+                                            for positions in plan])
+            for positions, batch_embeddings in tqdm(zip(plan, results), total=len(plan),
+                                                    desc="Encoding batches",
+                                                    disable=not show_progress):
+                if embeddings is None:
+                    embeddings = np.zeros((len(texts), batch_embeddings.shape[1]),
+                                          dtype=np.float32)
+                    self._vector_size = batch_embeddings.shape[1]
+                embeddings[positions] = batch_embeddings
+            if embeddings is None:
+                embeddings = np.zeros((0, self._vector_size or 0), dtype=np.float32)
+            return embeddings
+
+        embeddings = np.zeros((len(texts), self.vector_size), dtype=np.float32)
+
+        for positions in tqdm(plan, desc="Encoding batches", disable=not show_progress):
+            embeddings[positions] = self.model.encode(
+                [texts[i] for i in positions],
+                batch_size=len(positions),
+                show_progress_bar=False,
+                convert_to_numpy=True
+            )
+
+        return embeddings
+
+    def _get_pool(self) -> EncodingPool:
+        """Start the CPU worker pool on first use."""
+        if self._pool is None:
+            print(f" Encoding pool: {self.num_workers} workers x "
+                  f"{self.threads_per_worker} threads")
+            self._pool = EncodingPool(self.model_name, num_workers=self.num_workers,
+                                      threads_per_worker=self.threads_per_worker,
+                                      backend=self.backend, quantization=self.quantization)
+        return self._pool
+
+    def close(self):
+        """Stop the encoding worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def encode_texts(self, texts: List[str], batch_size: int = 32,
+                     show_progress: bool = True,
+                     max_tokens: int = None) -> np.ndarray:
+        """
+        Encode texts, serving unchanged ones from the cache if enabled.
+
+        Parameters:
+        texts : List[str]
+            Texts to encode
+        batch_size : int
+            Batch size for encoding
+        show_progress : bool
+            Show a progress bar over batches
+        max_tokens : int, optional
+            Padded-token budget per batch. Enables length-bucketed batching:
+            texts of similar length are encoded together and ``batch_size``
+            becomes an upper bound.
+
+        Returns:
+        np.ndarray
+            ``(len(texts), vector_size)`` float32 array
+        """
+        if self.cache is None:
+            return self._encode_batches(texts, batch_size, show_progress, max_tokens)
+
+        embeddings, missing = self.cache.get_many(texts)
+
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            encoded = self._encode_batches(missing_texts, batch_size, show_progress,
+                                           max_tokens)
+            embeddings[missing] = encoded
+            self.cache.put_many(missing_texts, encoded)
+            self.cache.flush()
+
+        logger.info(f"Embedding cache: {len(texts) - len(missing)} hits, "
+                    f"{len(missing)} misses")
+        return embeddings
+
+    def generate_matrix(self, records: List[Dict[str, Any]], batch_size: int = 32,
+                        max_tokens: int = None) -> EmbeddedRecords:
+        """
+        Generate embeddings for all records as one contiguous float32 matrix.
+
+        Vectors are written in place, batch by batch, into a preallocated
+        ``(n, vector_size)`` array; record fields go to a separate payload
+        DataFrame, so no per-row vector objects are created.
 
         Parameters:
         records : List[Dict]
             Records to process
         batch_size : int
-            Batch size for encoding
+            Batch size for encoding (upper bound when ``max_tokens`` is set)
+        max_tokens : int, optional
+            Padded-token budget per batch; enables length-bucketed batching
 
         Returns:
-        pd.DataFrame
-            DataFrame with embeddings
+        EmbeddedRecords
+            Vector matrix plus payload columns
         """
         logger.info(f"Generating embeddings for {len(records)} records")
         print(f"Generating embeddings")
@@ -88,25 +308,84 @@ class EmbeddingsGenerator:
 
         # generate embeddings in batches
         print(f"Encoding text (batch_size={batch_size})...")
-        embeddings = []
+        cache_before = self.cache.stats() if self.cache is not None else None
+        vectors = self.encode_texts(
+            [rec['combined_text'] for rec in records],
+            batch_size=batch_size,
+            max_tokens=max_tokens
+        )
 
-        for i in tqdm(range(0, len(records), batch_size), desc="Encoding batches"):
-            batch_texts = [rec['combined_text'] for rec in records[i:i+batch_size]]
-            batch_embeddings = self.model.encode(
-                batch_texts,
-                show_progress_bar=False,
-                convert_to_numpy=True
-            )
-            embeddings.extend(batch_embeddings)
+        import pandas as pd
+
+        data = EmbeddedRecords(vectors, pd.DataFrame(records))
+
+        print(f" Generated {len(data)} embeddings")
+        print(f"   Vector size: {data.vectors.shape[1]}")
+        if cache_before is not None:
+            stats = self.cache.stats()
+            print(f"   Cache hits: {stats['hits'] - cache_before['hits']}, "
+                  f"misses: {stats['misses'] - cache_before['misses']}")
+
+        return data
+
+    def generate(self, records: List[Dict[str, Any]], batch_size: int = 32,
+                 max_tokens: int = None) -> 'pd.DataFrame':
+        """
+        Generate embeddings for all records.
+
+        Kept for compatibility; ``generate_matrix`` avoids the object column.
+
+        Parameters:
+        records : List[Dict]
+            Records to process
+        batch_size : int
+            Batch size for encoding (upper bound when ``max_tokens`` is set)
+        max_tokens : int, optional
+            Padded-token budget per batch; enables length-bucketed batching
+
+        Returns:
+        pd.DataFrame
+            DataFrame with embeddings
+        """
+        return self.generate_matrix(records, batch_size, max_tokens).to_dataframe()
+
+    def iter_generate(self, batches: Iterable[List[Dict[str, Any]]],
+                      batch_size: int = 32,
+                      max_tokens: int = None) -> Iterator[EmbeddedRecords]:
+        """
+        Generate embeddings for a stream of record batches.
+
+        Meant to be fed from ``GeorgianAttractionsDataLoader.iter_batches`` so
+        that loading, encoding and uploading run in constant memory.
+
+        Parameters:
+        batches : Iterable[List[Dict]]
+            Batches of records to process
+        batch_size : int
+            Batch size for encoding (upper bound when ``max_tokens`` is set)
+        max_tokens : int, optional
+            Padded-token budget per batch; enables length-bucketed batching
+
+        Yields:
+        EmbeddedRecords
+            One chunk per input batch. The payload index continues across
+            batches, so row positions stay unique over the whole stream.
+        """
+        import pandas as pd
+
+        offset = 0
 
-        # Add embeddings to records
-        for rec, emb in zip(records, embeddings):
-            rec['embedding'] = emb
+        for records in batches:
+            texts = []
+            for rec in records:
+                rec['combined_text'] = self.create_combined_text(rec)
+                texts.append(rec['combined_text'])
 
-        # Create DataFrame
-        df = pd.DataFrame(records)
+            vectors = self.encode_texts(texts, batch_size=batch_size,
+                                        show_progress=False,
+                                        max_tokens=max_tokens)
 
-        print(f" Generated {len(df)} embeddings")
-        print(f"   Vector size: {len(df.iloc[0]['embedding'])}")
+            payloads = pd.DataFrame(records, index=range(offset, offset + len(records)))
+            offset += len(records)
 
-        return df
+            yield EmbeddedRecords(vectors, payloads)
@@ -0,0 +1,114 @@
+# encoding pool
+"""
+Multi-process CPU encoding pool for SentenceTransformers.
+Each worker loads its own model copy with a pinned torch thread count.
+"""
+
+import logging
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# per-process state, set by _init_worker
+_worker_model = None
+
+
+def physical_cores() -> int:
+    """Number of physical CPU cores (logical count if psutil is missing)."""
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    return cores or os.cpu_count() or 1
+
+
+def _init_worker(model_name: str, backend: str, quantization: str, threads: int, counter,
+                 pin: bool):
+    """Load the model in a worker process and pin its torch threads."""
+    global _worker_model
+
+    import torch
+    from model_backends import load_model
+
+    with counter.get_lock():
+        worker_id = counter.value
+        counter.value += 1
+
+    if pin and hasattr(os, 'sched_setaffinity'):
+        cpus = sorted(os.sched_getaffinity(0))
+        own = cpus[worker_id * threads:(worker_id + 1) * threads]
+        if own:
+            os.sched_setaffinity(0, own)
+
+    torch.set_num_threads(threads)
+    _worker_model = load_model(model_name, device='cpu', backend=backend,
+                               quantization=quantization)
+
+
+def _encode_chunk(texts: List[str]) -> np.ndarray:
+    """Encode one chunk of texts in a worker process."""
+    return _worker_model.encode(
+        texts,
+        batch_size=len(texts),
+        show_progress_bar=False,
+        convert_to_numpy=True
+    ).astype(np.float32, copy=False)
+
+
+class EncodingPool:
+    """
+    Pool of CPU worker processes that encode text chunks in parallel.
+
+    Attributes:
+    model_name : str
+        SentenceTransformer model loaded by every worker
+    num_workers : int
+        Number of worker processes (defaults to physical cores)
+    threads_per_worker : int
+        torch intra-op threads per worker
+    backend : str
+        Inference backend loaded by every worker (see model_backends)
+    quantization : str
+        Dynamic quantization target of the 'onnx-int8' backend
+    """
+
+    def __init__(self, model_name: str, num_workers: int = None,
+                 threads_per_worker: int = 1, pin_threads: bool = True,
+                 backend: str = 'torch', quantization: str = 'avx2'):
+        self.model_name = model_name
+        self.backend = backend
+        self.quantization = quantization
+        self.num_workers = num_workers or max(1, physical_cores() // threads_per_worker)
+        self.threads_per_worker = threads_per_worker
+
+        logger.info(f"Starting encoding pool: {self.num_workers} workers x "
+                    f"{threads_per_worker} threads")
+
+        # spawn: torch and fork do not mix well
+        ctx = mp.get_context('spawn')
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(model_name, backend, quantization, threads_per_worker, ctx.Value('i', 0),
+                      pin_threads)
+        )
+
+    def map(self, chunks: Iterable[List[str]]) -> Iterator[np.ndarray]:
+        """Encode chunks in parallel, yielding results in input order."""
+        return self._executor.map(_encode_chunk, chunks)
+
+    def close(self):
+        """Shut down worker processes."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,173 @@
+"""
+Prepares dataset images for upload: bounded-size renditions, thumbnails
+and content hashes, computed in a process pool and cached on disk.
+"""
+
+import hashlib
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from datasets import Image as ImageFeature
+from datasets import load_dataset
+from tqdm.auto import tqdm
+
+logger = logging.getLogger(__name__)
+
+
+def _save(image, path_stem: Path, quality: int) -> Path:
+    """Save as PNG if the image has transparency, JPEG otherwise (atomic rename)."""
+    if image.mode in ('RGBA', 'LA', 'P'):
+        fmt, ext = 'PNG', '.png'
+    else:
+        fmt, ext = 'JPEG', '.jpg'
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+
+    path = path_stem.with_suffix(ext)
+    tmp_path = path.with_name(path.name + '.tmp')
+    options = {'quality': quality} if fmt == 'JPEG' else {}
+    with open(tmp_path, 'wb') as f:
+        image.save(f, format=fmt, **options)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _render(data: bytes, out_dir: str, max_size: int, thumb_size: int, quality: int) -> str:
+    """Worker: write ``full`` and ``thumb`` renditions of one image into ``out_dir``."""
+    from PIL import Image, ImageOps
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+
+    image = Image.open(BytesIO(data))
+    image = ImageOps.exif_transpose(image)
+
+    full = image.copy()
+    full.thumbnail((max_size, max_size))
+    _save(full, out / 'full', quality)
+
+    thumb = image.copy()
+    thumb.thumbnail((thumb_size, thumb_size))
+    _save(thumb, out / 'thumb', quality)
+
+    return out_dir
+
+
+class ImagePreprocessor:
+    """
+    Process-pool image preprocessing stage in front of ``CloudinaryUploader``.
+
+    Every image is identified by the SHA-256 of its original bytes. Records
+    sharing a photo (e.g. EN/RU translations) map to the same hash, so the
+    photo is rendered and uploaded once. Renditions are cached under
+    ``cache_dir/<hash[:2]>/<hash>/`` and reruns skip any hash already there.
+
+    Attributes:
+    cache_dir : Path
+        Root of the rendition cache
+    max_size : int
+        Longest side of the full rendition, in pixels
+    thumb_size : int
+        Longest side of the thumbnail, in pixels
+    num_workers : int
+        Worker processes (None = CPU count)
+    """
+
+    def __init__(self, cache_dir: str = '.cache/images', max_size: int = 1600,
+                 thumb_size: int = 320, quality: int = 85, num_workers: int = None):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.thumb_size = thumb_size
+        self.quality = quality
+        self.num_workers = num_workers or os.cpu_count()
+
+    def entry_dir(self, content_hash: str) -> Path:
+        """Cache directory for one content hash."""
+        return self.cache_dir / content_hash[:2] / content_hash
+
+    def renditions(self, content_hash: str) -> Optional[Tuple[Path, Path]]:
+        """(full, thumb) paths if both renditions are cached, else None."""
+        entry = self.entry_dir(content_hash)
+        found = []
+        for stem in ('full', 'thumb'):
+            paths = [entry / (stem + ext) for ext in ('.jpg', '.png')]
+            path = next((p for p in paths if p.exists()), None)
+            if path is None:
+                return None
+            found.append(path)
+        return found[0], found[1]
+
+    def process(self, dataset_name: str) -> Dict[str, str]:
+        """
+        Hash and render every image in the dataset.
+
+        Parameters:
+        dataset_name : str
+            HuggingFace dataset name
+
+        Returns:
+        Dict[str, str]
+            Record ID -> content hash, for records that have an image
+        """
+        print(f"\n Preprocessing images: {dataset_name}")
+        dataset = load_dataset(dataset_name, split='train')
+        dataset = dataset.cast_column('image', ImageFeature(decode=False))
+
+        hashes = {}
+        submitted = set()
+        in_flight = set()
+        cached = 0
+
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            for i, rec in enumerate(tqdm(dataset, desc="Preprocessing")):
+                image = rec.get('image')
+                if not image:
+                    continue
+
+                data = image.get('bytes')
+                if data is None and image.get('path'):
+                    data = Path(image['path']).read_bytes()
+                if not data:
+                    continue
+
+                content_hash = hashlib.sha256(data).hexdigest()
+                hashes[str(rec.get('id', i))] = content_hash
+
+                if content_hash in submitted:
+                    continue
+                submitted.add(content_hash)
+
+                if self.renditions(content_hash):
+                    cached += 1
+                    continue
+
+                # keep a bounded number of images in flight
+                if len(in_flight) >= self.num_workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    self._check(done)
+
+                in_flight.add(executor.submit(
+                    _render, data, str(self.entry_dir(content_hash)),
+                    self.max_size, self.thumb_size, self.quality
+                ))
+
+            self._check(wait(in_flight).done)
+
+        print(f" Preprocessing complete!")
+        print(f"   Records with images: {len(hashes)}")
+        print(f"   Unique images: {len(submitted)}")
+        print(f"   Rendered: {len(submitted) - cached}, cached: {cached}")
+
+        return hashes
+
+    @staticmethod
+    def _check(futures):
+        """Log renders that failed; those hashes simply have no renditions."""
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Failed to render image: {e}")
@@ -0,0 +1,215 @@
+# local exact-search index
+"""
+In-process exact cosine search over a memory-mapped embedding matrix.
+Serves the same results as the Qdrant collection without a network call.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Union
+import numpy as np
+import pandas as pd
+from qdrant_client.models import (FieldCondition, Filter, MatchAny, MatchValue,
+                                  PayloadSelectorExclude, PayloadSelectorInclude, ScoredPoint)
+from embedded_records import EmbeddedRecords
+from qdrant_uploader import build_payloads, point_id
+
+logger = logging.getLogger(__name__)
+
+# payload fields with precomputed boolean masks
+MASK_FIELDS = ('category', 'language', 'location', 'tags', 'has_processed_image')
+
+
+class LocalIndex:
+    """
+    Exact top-k search over L2-normalized vectors.
+
+    The index directory holds ``vectors.f32`` (row-major float32, memory-mapped
+    read-only), ``payloads.json`` (one payload per row, as stored in Qdrant)
+    and ``meta.json``. Cosine similarity is a single matrix product because
+    rows are normalized at build time.
+
+    Attributes:
+    path : Path
+        Index directory
+    vectors : np.memmap
+        ``(n, dim)`` normalized float32 matrix
+    payloads : list
+        Payload dicts by row
+    ids : list
+        Qdrant point IDs by row
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+        with open(self.path / 'meta.json', 'r') as f:
+            meta = json.load(f)
+        with open(self.path / 'payloads.json', 'r', encoding='utf-8') as f:
+            self.payloads = json.load(f)
+
+        self.vectors = np.memmap(self.path / 'vectors.f32', dtype=np.float32, mode='r',
+                                 shape=(meta['count'], meta['dim']))
+        self.ids = [point_id(p['id']) for p in self.payloads]
+        self._masks = self._build_masks()
+
+        logger.info(f"Local index: {len(self)} vectors x {meta['dim']} from {self.path}")
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    @staticmethod
+    def build(data: Union[pd.DataFrame, EmbeddedRecords], path: str) -> 'LocalIndex':
+        """
+        Write an index directory from embedded records and open it.
+
+        Parameters:
+        data : EmbeddedRecords or pd.DataFrame
+            Embeddings and payload columns (same input as ``upload_data``)
+        path : str
+            Output directory
+        """
+        if isinstance(data, pd.DataFrame):
+            data = EmbeddedRecords.from_dataframe(data)
+
+        out = Path(path)
+        out.mkdir(parents=True, exist_ok=True)
+
+        norms = np.linalg.norm(data.vectors, axis=1, keepdims=True)
+        vectors = data.vectors / np.maximum(norms, 1e-12)
+
+        tmp_path = out / 'vectors.f32.tmp'
+        vectors.astype(np.float32).tofile(tmp_path)
+        os.replace(tmp_path, out / 'vectors.f32')
+
+        with open(out / 'payloads.json', 'w', encoding='utf-8') as f:
+            json.dump(build_payloads(data.payloads), f, ensure_ascii=False)
+        with open(out / 'meta.json', 'w') as f:
+            json.dump({'count': len(data), 'dim': int(data.vectors.shape[1])}, f)
+
+        print(f" Local index written: {len(data)} vectors -> {out}")
+        return LocalIndex(path)
+
+    def _build_masks(self) -> Dict[str, Dict[Any, np.ndarray]]:
+        """field -> value -> row mask, for every value of the mask fields."""
+        masks = {}
+        for field in MASK_FIELDS:
+            rows = {}
+            for i, payload in enumerate(self.payloads):
+                values = payload.get(field)
+                if not isinstance(values, list):
+                    values = [values]
+                for value in values:
+                    rows.setdefault(value, []).append(i)
+
+            masks[field] = {}
+            for value, positions in rows.items():
+                mask = np.zeros(len(self), dtype=bool)
+                mask[positions] = True
+                masks[field][value] = mask
+        return masks
+
+    def _condition_mask(self, condition) -> np.ndarray:
+        """Row mask for one ``FieldCondition`` or nested ``Filter``."""
+        if isinstance(condition, Filter):
+            return self.filter_mask(condition)
+        if not isinstance(condition, FieldCondition) or condition.key not in self._masks:
+            raise ValueError(f"Unsupported condition for local search: {condition}")
+
+        by_value = self._masks[condition.key]
+        empty = np.zeros(len(self), dtype=bool)
+        if isinstance(condition.match, MatchValue):
+            return by_value.get(condition.match.value, empty)
+        if isinstance(condition.match, MatchAny):
+            mask = empty.copy()
+            for value in condition.match.any:
+                mask |= by_value.get(value, empty)
+            return mask
+        raise ValueError(f"Unsupported match for local search: {condition.match}")
+
+    def filter_mask(self, query_filter: Filter = None) -> np.ndarray:
+        """Row mask for a Qdrant ``Filter`` (keyword/bool matches on ``MASK_FIELDS``)."""
+        mask = np.ones(len(self), dtype=bool)
+        if query_filter is None:
+            return mask
+
+        for condition in query_filter.must or []:
+            mask &= self._condition_mask(condition)
+        if query_filter.should:
+            any_mask = np.zeros(len(self), dtype=bool)
+            for condition in query_filter.should:
+                any_mask |= self._condition_mask(condition)
+            mask &= any_mask
+        for condition in query_filter.must_not or []:
+            mask &= ~self._condition_mask(condition)
+        return mask
+
+    def search_vectors(self, vectors: np.ndarray, limit: int = 5,
+                       query_filter: Filter = None,
+                       with_payload=True) -> List[List[ScoredPoint]]:
+        """
+        Exact top-k for a batch of query vectors.
+
+        Parameters:
+        vectors : np.ndarray
+            ``(q, dim)`` query vectors (normalized here)
+        limit : int
+            Number of results per query
+        query_filter : Filter, optional
+            Keyword/bool payload filter
+        with_payload : bool, list or PayloadSelector
+            True, False, a list of fields to return, or an include/exclude selector
+
+        Returns:
+        List[List[ScoredPoint]]
+            Hits for each query, ordered by score
+        """
+        queries = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+
+        mask = self.filter_mask(query_filter)
+        candidates = np.flatnonzero(mask)
+        k = min(limit, len(candidates))
+        if k == 0:
+            return [[] for _ in queries]
+
+        if len(candidates) == len(self):
+            scores = queries @ self.vectors.T
+        else:
+            scores = queries @ self.vectors[candidates].T
+
+        # unordered top-k in O(n), then sort only those k
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        results = []
+        for rows, row_scores in zip(top, top_scores):
+            hits = []
+            for row, score in zip(rows, row_scores):
+                row = int(candidates[row])
+                hits.append(ScoredPoint(
+                    id=self.ids[row],
+                    version=0,
+                    score=float(score),
+                    payload=self._project(self.payloads[row], with_payload)
+                ))
+            results.append(hits)
+        return results
+
+    @staticmethod
+    def _project(payload: Dict[str, Any], with_payload) -> Dict[str, Any]:
+        """Apply a ``with_payload`` setting to one payload."""
+        if with_payload is True:
+            return payload
+        if not with_payload:
+            return None
+        if isinstance(with_payload, PayloadSelectorExclude):
+            return {k: v for k, v in payload.items() if k not in with_payload.exclude}
+        if isinstance(with_payload, PayloadSelectorInclude):
+            with_payload = with_payload.include
+        return {key: payload[key] for key in with_payload if key in payload}
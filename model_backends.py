@@ -0,0 +1,71 @@
+# model backends
+"""
+Loads the SentenceTransformer embedder with a selectable inference backend:
+eager PyTorch, an exported ONNX graph, or a dynamically int8-quantized ONNX graph.
+"""
+
+import logging
+from pathlib import Path
+from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('torch', 'onnx', 'onnx-int8')
+
+
+def load_model(model_name: str, device: str = 'cpu', backend: str = 'torch',
+               export_dir: str = '.cache/onnx',
+               quantization: str = 'avx2') -> SentenceTransformer:
+    """
+    Load a SentenceTransformer with the requested backend.
+
+    ONNX backends need ``sentence-transformers[onnx]`` (>= 3.2). The int8
+    model is exported once to ``export_dir`` and reused on later loads.
+
+    Parameters:
+    model_name : str
+        SentenceTransformer model name
+    device : str
+        'cuda' or 'cpu'
+    backend : str
+        One of 'torch', 'onnx', 'onnx-int8'
+    export_dir : str
+        Where quantized ONNX exports are stored
+    quantization : str
+        Dynamic quantization target: 'avx2', 'avx512', 'avx512_vnni' or 'arm64'
+
+    Returns:
+    SentenceTransformer
+        Model ready for ``encode``
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+
+    if backend == 'torch':
+        return SentenceTransformer(model_name, device=device)
+
+    if backend == 'onnx':
+        return SentenceTransformer(model_name, device=device, backend='onnx')
+
+    # onnx-int8: export the quantized graph once, then load it from disk
+    local_dir = Path(export_dir) / model_name.replace('/', '__')
+    file_name = f"onnx/model_qint8_{quantization}.onnx"
+
+    if not (local_dir / file_name).exists():
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        logger.info(f"Exporting int8 ONNX model to {local_dir}")
+        model = SentenceTransformer(model_name, device='cpu', backend='onnx')
+        model.save(str(local_dir))
+        export_dynamic_quantized_onnx_model(
+            model,
+            quantization_config=quantization,
+            model_name_or_path=str(local_dir)
+        )
+
+    return SentenceTransformer(
+        str(local_dir),
+        device=device,
+        backend='onnx',
+        model_kwargs={'file_name': file_name}
+    )
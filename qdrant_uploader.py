@@ -4,15 +4,99 @@
 Uploads processed data to Qdrant Cloud.
 """
 
+import hashlib
+import itertools
+import json
 import logging
-from typing import List
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Union
+import numpy as np
 import pandas as pd
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (PayloadSchemaType, PointIdsList, PointStruct, SetPayload,
+                                  SetPayloadOperation)
 from tqdm.auto import tqdm
+from collection_profiles import CollectionProfile, get_profile
+from collection_stats import iter_points
+from embedded_records import EmbeddedRecords
+from sparse_vectors import (AVG_DOC_LEN_KEY, DENSE_VECTOR, SPARSE_VECTOR, SparseEncoder,
+                            sparse_vectors_config)
+from translation_pairs import LANGUAGES, group_pairs, merge_payloads, pair_keys, vector_name
 
 logger = logging.getLogger(__name__)
 
+# payload fields stored with every point, in order
+STRING_FIELDS = ['id', 'name', 'description', 'location', 'category', 'language',
+                 'photo_name', 'photo_author', 'license', 'combined_text']
+
+# large text fields; candidates for skip_fields when search results only
+# need to render a card (combined_text repeats description, name, tags...)
+HEAVY_FIELDS = ('description', 'combined_text')
+
+# payload indexes created with the collection (filtered search fields)
+PAYLOAD_INDEXES = {
+    'category': PayloadSchemaType.KEYWORD,
+    'language': PayloadSchemaType.KEYWORD,
+    'location': PayloadSchemaType.KEYWORD,
+    'tags': PayloadSchemaType.KEYWORD,
+    'has_processed_image': PayloadSchemaType.BOOL,
+}
+
+# payload fields backfilled on the server (see update_qdrant_images.py);
+# sync keeps the stored value when the local record has none
+SERVER_FILLED_FIELDS = ('image_url', 'thumbnail_url')
+
+# fields left out of the content hash: server-filled fields change separately
+UNHASHED_FIELDS = {*SERVER_FILLED_FIELDS, 'content_hash'}
+
+# sent point IDs checked by upload_stream after the upload
+VERIFY_SAMPLE_SIZE = 1000
+
+# namespace for deterministic point IDs
+POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'georgian-attractions')
+
+
+def point_id(record_id: Any) -> str:
+    """Stable Qdrant point ID for a record: UUIDv5 of the record ``id``."""
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, str(record_id)))
+
+
+def content_hash(payload: Dict[str, Any]) -> str:
+    """Hash of a payload's content, used to detect changed records on sync."""
+    content = {k: v for k, v in payload.items() if k not in UNHASHED_FIELDS}
+    data = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def build_payloads(frame: pd.DataFrame, skip_fields: Iterable[str] = ()) -> List[Dict[str, Any]]:
+    """
+    Build point payloads column by column from a records DataFrame.
+
+    Fields in ``skip_fields`` are left out of the payload, but still go into
+    its ``content_hash``, so ``sync`` notices edits to them.
+    """
+    columns = {field: frame[field].astype(str).tolist() for field in STRING_FIELDS}
+    columns['tags'] = [list(t) if isinstance(t, (list, tuple, np.ndarray)) else []
+                       for t in frame['tags']]
+    columns['has_processed_image'] = frame['has_processed_image'].astype(bool).tolist()
+    for field in SERVER_FILLED_FIELDS:
+        # image_url is always a column; thumbnail_url only when carried over by sync
+        if field == 'image_url' or field in frame:
+            columns[field] = [str(u) if isinstance(u, str) and u else None
+                              for u in frame[field]]
+
+    names = list(columns)
+    payloads = [dict(zip(names, values)) for values in zip(*columns.values())]
+    skip_fields = [field for field in skip_fields if field in columns]
+    for payload in payloads:
+        payload['content_hash'] = content_hash(payload)
+        for field in skip_fields:
+            del payload[field]
+    return payloads
+
 
 class QdrantUploader:
     """
@@ -25,11 +109,43 @@ class QdrantUploader:
         Name of the collection
     vector_size : int
         Size of embedding vectors
+    skip_fields : tuple
+        Payload fields not uploaded (e.g. ``HEAVY_FIELDS``)
+    on_disk_payload : bool
+        Keep payloads on disk instead of in RAM (set at collection creation)
+    profile : CollectionProfile
+        Vector storage, HNSW and quantization settings (see collection_profiles)
+    sparse_encoder : SparseEncoder or None
+        Set for hybrid collections: points get a named ``dense`` vector and a
+        BM25 ``sparse`` vector built from ``combined_text``. Its average
+        document length is stored in the collection metadata (see
+        ``fit_sparse_encoder``)
+    paired : bool
+        One point per EN/RU translation pair, with ``en``/``ru`` named vectors
+        (see translation_pairs)
     """
 
-    def __init__(self, url: str, api_key: str, collection_name: str, vector_size: int):
+    def __init__(self, url: str, api_key: str, collection_name: str, vector_size: int,
+                 skip_fields: Iterable[str] = (), on_disk_payload: bool = False,
+                 profile: Union[str, CollectionProfile] = None,
+                 client: QdrantClient = None, hybrid: bool = False, paired: bool = False):
+        if client is None and not url:
+            raise ValueError("Qdrant URL not set (QDRANT_URL in .env file)")
+        if hybrid and paired:
+            raise ValueError("Hybrid and paired collections cannot be combined")
+
         self.collection_name = collection_name
         self.vector_size = vector_size
+        self.skip_fields = tuple(skip_fields)
+        self.on_disk_payload = on_disk_payload
+        self.profile = get_profile(profile)
+        self.sparse_encoder = SparseEncoder() if hybrid else None
+        self.paired = paired
+
+        if client is not None:
+            # caller-provided client, e.g. QdrantClient(':memory:') in benchmarks
+            self.client = client
+            return
 
         logger.info(f"Connecting to Qdrant Cloud...")
         print(f"Connecting to Qdrant Cloud")
@@ -39,8 +155,8 @@ class QdrantUploader:
         print(f" Connected to Qdrant!")
         print(f"   URL: {url[:50]}...")
 
-    def create_collection(self, recreate: bool = False):
-        """Create or recreate collection."""
+    def create_collection(self, recreate: bool = False, payload_indexes: bool = True):
+        """Create or recreate collection (with ``PAYLOAD_INDEXES`` unless disabled)."""
         print(f"Create collection")
 
         # check if collection exists
@@ -57,82 +173,493 @@ class QdrantUploader:
                 return
 
         # create collection
-        print(f" Creating collection '{self.collection_name}'...")
+        print(f" Creating collection '{self.collection_name}' (profile: {self.profile.name})...")
 
+        vectors_config = self.profile.vectors_config(self.vector_size)
+        if self.paired:
+            vectors_config = {vector_name(language): vectors_config for language in LANGUAGES}
+        elif self.sparse_encoder:
+            vectors_config = {DENSE_VECTOR: vectors_config}
         self.client.create_collection(
             collection_name=self.collection_name,
-            vectors_config=VectorParams(
-                size=self.vector_size,
-                distance=Distance.COSINE
-            )
+            vectors_config=vectors_config,
+            sparse_vectors_config=sparse_vectors_config() if self.sparse_encoder else None,
+            hnsw_config=self.profile.hnsw_config(),
+            quantization_config=self.profile.quantization_config(),
+            on_disk_payload=self.on_disk_payload
         )
 
         print(f" Collection created")
 
+        if self.sparse_encoder:
+            # a new collection gets its own document length statistics
+            self.sparse_encoder.avg_doc_len = None
+
+        if payload_indexes:
+            self.create_payload_indexes()
+
         # verify
         collection_info = self.client.get_collection(self.collection_name)
         print(f"\n Collection info:")
         print(f"   Name: {self.collection_name}")
-        print(f"   Vector size: {collection_info.config.params.vectors.size}")
-        print(f"   Distance: {collection_info.config.params.vectors.distance}")
+        vectors = collection_info.config.params.vectors
+        if isinstance(vectors, dict):
+            print(f"   Named vectors: {list(vectors)}")
+            vectors = next(iter(vectors.values()))
+        print(f"   Vector size: {vectors.size}")
+        print(f"   Distance: {vectors.distance}")
+        print(f"   Sparse vectors: {list(collection_info.config.params.sparse_vectors or {})}")
+        print(f"   Payload on disk: {collection_info.config.params.on_disk_payload}")
+        print(f"   HNSW: m={collection_info.config.hnsw_config.m}, "
+              f"ef_construct={collection_info.config.hnsw_config.ef_construct}")
+        print(f"   Quantization: {self.profile.quantization or 'none'}")
         print(f"   Points: {collection_info.points_count}")
 
-    def upload_data(self, df: pd.DataFrame, batch_size: int = 100):
-        """Upload data in batches."""
+    def create_payload_indexes(self):
+        """
+        Index the filter fields in ``PAYLOAD_INDEXES``.
+
+        Safe to call on an existing collection; Qdrant builds each index in
+        the background over points already stored.
+        """
+        print(f" Creating payload indexes...")
+        for field, schema in PAYLOAD_INDEXES.items():
+            self.client.create_payload_index(
+                collection_name=self.collection_name,
+                field_name=field,
+                field_schema=schema,
+                wait=True
+            )
+            print(f"   {field}: {schema.value}")
+
+    def fit_sparse_encoder(self, texts: Sequence[str]):
+        """
+        Fix the BM25 average document length once per collection.
+
+        Reuses the value stored in the collection metadata; if there is none,
+        fits it on ``texts`` and stores it. Streamed chunks, syncs and later
+        single-record upserts are then all weighted with the same value.
+        """
+        if self.sparse_encoder is None or self.sparse_encoder.avg_doc_len is not None:
+            return
+
+        metadata = self.client.get_collection(self.collection_name).config.metadata or {}
+        if AVG_DOC_LEN_KEY in metadata:
+            self.sparse_encoder.avg_doc_len = float(metadata[AVG_DOC_LEN_KEY])
+            return
+
+        if self.sparse_encoder.fit(texts).avg_doc_len is None:
+            return
+        self.client.update_collection(self.collection_name,
+                                      metadata={AVG_DOC_LEN_KEY: self.sparse_encoder.avg_doc_len})
+        print(f"   BM25 average document length: {self.sparse_encoder.avg_doc_len:.1f} tokens")
+
+    def upload_data(self, data: Union[pd.DataFrame, EmbeddedRecords], batch_size: int = 100,
+                    parallel: int = 1):
+        """
+        Upload data in batches.
+
+        Accepts ``EmbeddedRecords`` or a legacy DataFrame with an
+        ``embedding`` column. Point IDs are derived from the record ``id``
+        (see ``point_id``), so re-uploading overwrites instead of duplicating.
+        """
         print(f" Uploading data to Qdrant")
 
-        print(f"   Total records: {len(df)}")
+        if isinstance(data, pd.DataFrame):
+            data = EmbeddedRecords.from_dataframe(data)
+
+        print(f"   Total records: {len(data)}")
         print(f"   Batch size: {batch_size}")
 
-        # prepare points
-        points = []
-
-        for idx, row in tqdm(df.iterrows(), total=len(df), desc="Preparing points"):
-            # prepare payload (metadata)
-            payload = {
-                'id': str(row['id']),
-                'name': str(row['name']),
-                'description': str(row['description']),
-                'location': str(row['location']),
-                'category': str(row['category']),
-                'language': str(row['language']),
-                'tags': row['tags'] if isinstance(row['tags'], list) else [],
-                'photo_name': str(row['photo_name']),
-                'photo_author': str(row['photo_author']),
-                'license': str(row['license']),
-                'has_processed_image': bool(row['has_processed_image']),
-                'image_url': str(row['image_url']) if row['image_url'] else None,
-                'combined_text': str(row['combined_text'])
-            }
-
-            # create point
-            point = PointStruct(
-                id=idx,
-                vector=row['embedding'].tolist(),
-                payload=payload
-            )
+        self.upload_stream([data], batch_size=batch_size, parallel=parallel)
 
-            points.append(point)
+    def upload_stream(self, chunks: Iterable[EmbeddedRecords], batch_size: int = 100,
+                      parallel: int = 1, verify_timeout: float = 60.0) -> int:
+        """
+        Upload a stream of embedded chunks (e.g. from ``iter_generate``).
 
-        # upload in batches
-        print(f"\n Uploading in batches...")
+        Points are built lazily from the chunk's vector matrix and payload
+        columns and sent through ``upload_points`` with ``wait=False``, so
+        batches are pipelined and ``parallel`` worker processes can upload
+        concurrently. At the end, a check confirms that a uniform sample of
+        the sent point IDs is stored (the collection may already hold other
+        points); memory for the check stays constant however long the stream.
 
-        for i in tqdm(range(0, len(points), batch_size), desc="Uploading batches"):
-            batch = points[i:i+batch_size]
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=batch
-            )
+        In paired mode, a record whose translation has not arrived yet is
+        held back until a later chunk completes its pair (see
+        ``_iter_paired_points``), so pairs may span chunk boundaries. In hybrid mode, a collection without
+        a stored BM25 average document length gets it from the first chunk.
+
+        Parameters:
+        chunks : Iterable[EmbeddedRecords]
+            Chunks to upload
+        batch_size : int
+            Points per upsert request
+        parallel : int
+            Number of upload worker processes
+        verify_timeout : float
+            Seconds to wait for all sent points to become visible
+
+        Returns:
+        int
+            Number of points sent
+        """
+        sent = [0]
+        # reservoir sample of sent IDs, checked once the upload is done
+        sample = []
+        rng = random.Random(0)
+
+        def counted(points: Iterator[PointStruct]) -> Iterator[PointStruct]:
+            for point in points:
+                sent[0] += 1
+                if len(sample) < VERIFY_SAMPLE_SIZE:
+                    sample.append(point.id)
+                else:
+                    slot = rng.randrange(sent[0])
+                    if slot < VERIFY_SAMPLE_SIZE:
+                        sample[slot] = point.id
+                yield point
+
+        print(f"\n Uploading (parallel={parallel}, wait=False)...")
+
+        if self.sparse_encoder is not None:
+            chunks = iter(chunks)
+            first = next(chunks, None)
+            if first is not None:
+                self.fit_sparse_encoder(first.payloads['combined_text'].tolist())
+                chunks = itertools.chain([first], chunks)
+
+        if self.paired:
+            points = self._iter_paired_points(chunks, self.skip_fields)
+        else:
+            points = self._iter_points(chunks, self.skip_fields, self.sparse_encoder)
+
+        self.client.upload_points(
+            collection_name=self.collection_name,
+            points=tqdm(counted(points), desc="Uploading points"),
+            batch_size=batch_size,
+            parallel=parallel,
+            wait=False
+        )
 
         print(f"\n Upload complete")
+        print(f"   Points sent: {sent[0]}")
+        self.verify_ids(sample, timeout=verify_timeout)
+
+        return sent[0]
+
+    @staticmethod
+    def _iter_points(chunks: Iterable[EmbeddedRecords], skip_fields: Iterable[str] = (),
+                     sparse_encoder: SparseEncoder = None) -> Iterator[PointStruct]:
+        """
+        Lazily build points from column arrays, one chunk at a time.
+
+        With ``sparse_encoder`` each point carries named vectors: the dense
+        embedding and the chunk's ``combined_text`` encoded in one batch.
+        """
+        for chunk in chunks:
+            ids = [point_id(rid) for rid in chunk.payloads['id']]
+            payloads = build_payloads(chunk.payloads, skip_fields)
+            vectors = chunk.vectors.tolist()
+            if sparse_encoder is not None:
+                sparse = sparse_encoder.encode_documents(chunk.payloads['combined_text'].tolist())
+                vectors = [{DENSE_VECTOR: dense, SPARSE_VECTOR: s}
+                           for dense, s in zip(vectors, sparse)]
+            for pid, vector, payload in zip(ids, vectors, payloads):
+                yield PointStruct(id=pid, vector=vector, payload=payload)
+
+    @staticmethod
+    def _iter_paired_points(chunks: Iterable[EmbeddedRecords],
+                            skip_fields: Iterable[str] = ()) -> Iterator[PointStruct]:
+        """
+        Lazily build one point per translation group (see ``group_pairs``).
+
+        The point ID derives from the group's first record ID, and each
+        translation's embedding goes to its language's named vector.
+
+        A record whose photo has not been seen in every language yet may
+        still get its translation from a later chunk, so it is carried over
+        and grouped again with the next chunk. Records still unmatched when
+        the stream ends are uploaded on their own. Memory grows with the
+        number of records waiting for a translation, not with the stream.
+        """
+        def points(chunk: EmbeddedRecords, groups: List[List[int]]) -> Iterator[PointStruct]:
+            payloads = build_payloads(chunk.payloads, skip_fields)
+            vectors = chunk.vectors.tolist()
+            for rows in groups:
+                payload = merge_payloads([payloads[i] for i in rows])
+                payload['content_hash'] = content_hash(payload)
+                yield PointStruct(
+                    id=point_id(payload['id'][0]),
+                    vector={vector_name(payloads[i]['language']): vectors[i] for i in rows},
+                    payload=payload
+                )
+
+        carry = None
+        for chunk in chunks:
+            if carry is not None:
+                chunk = EmbeddedRecords(
+                    np.vstack([carry.vectors, chunk.vectors]),
+                    pd.concat([carry.payloads, chunk.payloads], ignore_index=True)
+                )
+
+            keys = pair_keys(chunk.payloads).to_numpy()
+            ready, waiting = [], []
+            for rows in group_pairs(chunk.payloads):
+                incomplete = len(rows) < len(LANGUAGES) and keys[rows[0]].startswith('photo:')
+                (waiting if incomplete else ready).append(rows)
+
+            yield from points(chunk, ready)
+
+            waiting = sorted(i for rows in waiting for i in rows)
+            carry = (EmbeddedRecords(chunk.vectors[waiting], chunk.payloads.iloc[waiting])
+                     if waiting else None)
+
+        if carry is not None:
+            yield from points(carry, group_pairs(carry.payloads))
+
+    def verify_count(self, expected: int, timeout: float = 60.0) -> bool:
+        """
+        Check that the collection holds ``expected`` points.
+
+        Uploads are sent with ``wait=False``, so the count is polled until it
+        matches or ``timeout`` seconds pass.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            count = self.client.count(self.collection_name, exact=True).count
+            if count == expected or time.monotonic() >= deadline:
+                break
+            time.sleep(0.5)
 
-        # verify
-        collection_info = self.client.get_collection(self.collection_name)
         print(f"\n Final collection stats:")
-        print(f"   Points uploaded: {collection_info.points_count}")
-        print(f"   Expected: {len(df)}")
+        print(f"   Points uploaded: {count}")
+        print(f"   Expected: {expected}")
 
-        if collection_info.points_count == len(df):
+        if count == expected:
             print(f"   All points uploaded successfully")
-        else:
-            print(f"   Mismatch in point count")
+            return True
+
+        print(f"   Mismatch in point count")
+        return False
+
+    def verify_ids(self, ids: List[Any], timeout: float = 60.0,
+                   batch_size: int = 1000) -> bool:
+        """
+        Check that every point in ``ids`` is stored.
+
+        Unlike ``verify_count`` this also holds when the collection already
+        had points before the upload. Each poll only retrieves the IDs that
+        were still missing, without payloads or vectors.
+        """
+        missing = list(dict.fromkeys(ids))
+        deadline = time.monotonic() + timeout
+        while True:
+            still_missing = []
+            for i in range(0, len(missing), batch_size):
+                batch = missing[i:i+batch_size]
+                found = {str(point.id) for point in self.client.retrieve(
+                    collection_name=self.collection_name,
+                    ids=batch,
+                    with_payload=False,
+                    with_vectors=False
+                )}
+                still_missing.extend(pid for pid in batch if str(pid) not in found)
+            missing = still_missing
+            if not missing or time.monotonic() >= deadline:
+                break
+            time.sleep(0.5)
+
+        print(f"\n Final collection stats:")
+        print(f"   Point IDs checked: {len(set(ids))}")
+        print(f"   Points in collection: {self.client.count(self.collection_name, exact=True).count}")
+
+        if not missing:
+            print(f"   All points uploaded successfully")
+            return True
+
+        print(f"   Missing points: {len(missing)}")
+        return False
+
+    def _scroll_hashes(self, page_size: int = 1000) -> Dict[str, Dict[str, Any]]:
+        """Point ID -> {content_hash, *SERVER_FILLED_FIELDS} for every stored point."""
+        return {str(point.id): point.payload or {}
+                for point in iter_points(self.client, self.collection_name,
+                                         fields=['content_hash', *SERVER_FILLED_FIELDS],
+                                         page_size=page_size)}
+
+    def sync(self, data: Union[pd.DataFrame, EmbeddedRecords], batch_size: int = 100,
+             parallel: int = 1) -> Dict[str, int]:
+        """
+        Incrementally sync the collection with the full local dataset.
+
+        Compares local content hashes with the ones stored on each point,
+        upserts only new or changed records and deletes points whose record
+        no longer exists. Server-filled fields (``SERVER_FILLED_FIELDS``:
+        ``image_url``, ``thumbnail_url``) already stored on a point are kept
+        when the local record has none.
+
+        Returns:
+        Dict[str, int]
+            Counts of 'added', 'changed', 'deleted' and 'unchanged' points
+        """
+        if self.paired:
+            raise ValueError("sync() does not support paired collections, "
+                             "use create_collection(recreate=True) and upload_data()")
+
+        print(f" Syncing data with Qdrant")
+
+        if isinstance(data, pd.DataFrame):
+            data = EmbeddedRecords.from_dataframe(data)
+
+        ids = [point_id(rid) for rid in data.payloads['id']]
+        hashes = [p['content_hash'] for p in build_payloads(data.payloads, self.skip_fields)]
+
+        print(f"   Local records: {len(data)}")
+        stored = self._scroll_hashes()
+        print(f"   Stored points: {len(stored)}")
+
+        is_new = np.array([pid not in stored for pid in ids], dtype=bool)
+        upsert_mask = np.array([stored.get(pid, {}).get('content_hash') != h
+                                for pid, h in zip(ids, hashes)], dtype=bool)
+        vanished = list(set(stored) - set(ids))
+
+        stats = {
+            'added': int(is_new.sum()),
+            'changed': int((upsert_mask & ~is_new).sum()),
+            'deleted': len(vanished),
+            'unchanged': int((~upsert_mask).sum()),
+        }
+
+        if upsert_mask.any():
+            self.fit_sparse_encoder(data.payloads['combined_text'].tolist())
+            payloads = data.payloads[upsert_mask].copy()
+            # keep image and thumbnail URLs that were backfilled on the server
+            upsert_ids = np.array(ids)[upsert_mask]
+            for field in SERVER_FILLED_FIELDS:
+                local = payloads[field] if field in payloads else [None] * len(payloads)
+                payloads[field] = [
+                    url if isinstance(url, str) and url
+                    else stored.get(pid, {}).get(field)
+                    for pid, url in zip(upsert_ids, local)
+                ]
+            self.client.upload_points(
+                collection_name=self.collection_name,
+                points=self._iter_points([EmbeddedRecords(data.vectors[upsert_mask], payloads)],
+                                         self.skip_fields, self.sparse_encoder),
+                batch_size=batch_size,
+                parallel=parallel,
+                wait=False
+            )
+
+        if vanished:
+            for i in range(0, len(vanished), batch_size):
+                self.client.delete(
+                    collection_name=self.collection_name,
+                    points_selector=PointIdsList(points=vanished[i:i+batch_size]),
+                    wait=False
+                )
+
+        print(f"\n Sync complete")
+        print(f"   Added: {stats['added']}")
+        print(f"   Changed: {stats['changed']}")
+        print(f"   Deleted: {stats['deleted']}")
+        print(f"   Unchanged: {stats['unchanged']}")
+
+        self.verify_count(len(data))
+        return stats
+
+    def point_index(self, page_size: int = 1000) -> Dict[str, Any]:
+        """
+        Record ``id`` -> point ID lookup, built from a scroll of the collection.
+
+        Works for collections with deterministic UUID point IDs as well as
+        for older ones that used integer row positions. In paired collections
+        both record IDs of a point map to it.
+        """
+        index = {}
+        for point in iter_points(self.client, self.collection_name, fields=['id'],
+                                 page_size=page_size):
+            if point.payload and 'id' in point.payload:
+                ids = point.payload['id']
+                for record_id in ids if isinstance(ids, list) else [ids]:
+                    index[str(record_id)] = point.id
+        return index
+
+    def update_payloads(self, mapping: Dict[Any, Dict[str, Any]], chunk_size: int = 100,
+                        max_workers: int = 4) -> Dict[str, Any]:
+        """
+        Patch payloads of many points with batched, concurrent requests.
+
+        Record IDs are resolved to point IDs through ``point_index``. Each
+        chunk of ``SetPayloadOperation``s is sent as one
+        ``batch_update_points`` call and up to ``max_workers`` chunks run
+        concurrently. A failed chunk is reported and the run continues.
+
+        Parameters:
+        mapping : Dict[record_id, Dict]
+            Payload fields to set for each record, e.g. ``{'817': {'image_url': url}}``
+        chunk_size : int
+            Operations per ``batch_update_points`` request
+        max_workers : int
+            Concurrent requests
+
+        Returns:
+        Dict
+            'updated', 'failed' and 'unresolved' counts plus 'failed_chunks'
+            as a list of (record IDs, error message)
+        """
+        print(f" Updating payloads of {len(mapping)} records")
+
+        index = self.point_index()
+        operations = []
+        record_ids = []
+        unresolved = []
+
+        for record_id, payload in mapping.items():
+            pid = index.get(str(record_id))
+            if pid is None:
+                unresolved.append(record_id)
+                continue
+            operations.append(SetPayloadOperation(
+                set_payload=SetPayload(payload=payload, points=[pid])
+            ))
+            record_ids.append(record_id)
+
+        chunks = [(record_ids[i:i+chunk_size], operations[i:i+chunk_size])
+                  for i in range(0, len(operations), chunk_size)]
+
+        def send(ops):
+            self.client.batch_update_points(
+                collection_name=self.collection_name,
+                update_operations=ops,
+                wait=True
+            )
+
+        updated = 0
+        failed_chunks = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(send, ops): ids for ids, ops in chunks}
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Updating"):
+                ids = futures[future]
+                try:
+                    future.result()
+                    updated += len(ids)
+                except Exception as e:
+                    logger.error(f"Failed to update chunk of {len(ids)} records: {e}")
+                    failed_chunks.append((ids, str(e)))
+
+        failed = sum(len(ids) for ids, _ in failed_chunks)
+
+        print(f"\n Update complete")
+        print(f"   Updated: {updated}")
+        print(f"   Failed: {failed} ({len(failed_chunks)} chunks)")
+        print(f"   Unresolved record IDs: {len(unresolved)}")
+
+        return {
+            'updated': updated,
+            'failed': failed,
+            'unresolved': len(unresolved),
+            'failed_chunks': failed_chunks,
+        }
@@ -0,0 +1,166 @@
+# search evaluation
+"""
+Measures how closely Qdrant's approximate search matches exact nearest
+neighbours: recall@k, MRR and latency per search configuration.
+"""
+
+import logging
+import time
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import SearchParams
+from tqdm.auto import tqdm
+from collection_stats import iter_points
+
+logger = logging.getLogger(__name__)
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """
+    Row indices of the exact cosine top-k for every query.
+
+    One matrix product over L2-normalized vectors, ``argpartition`` for the
+    top k, then a sort of those k only.
+
+    Returns:
+    np.ndarray
+        ``(len(queries), k)`` corpus row indices, best first
+    """
+    queries = np.atleast_2d(queries)
+    k = min(k, len(corpus))
+    if k <= 0:
+        # empty corpus (or k=0): no neighbours for any query
+        return np.zeros((len(queries), 0), dtype=np.int64)
+
+    corpus = corpus / np.maximum(np.linalg.norm(corpus, axis=1, keepdims=True), 1e-12)
+    queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+
+    scores = queries @ corpus.T
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(top, order, axis=1)
+
+
+def recall_at_k(found: Sequence[Sequence], truth: Sequence[Sequence], k: int) -> float:
+    """Mean fraction of the exact top-k present in the returned top-k."""
+    return float(np.mean([len(set(f[:k]) & set(t[:k])) / len(t[:k])
+                          for f, t in zip(found, truth) if len(t)]))
+
+
+def mean_reciprocal_rank(found: Sequence[Sequence], truth: Sequence[Sequence]) -> float:
+    """Mean of 1 / rank of the exact nearest neighbour in the results (0 if missing)."""
+    ranks = []
+    for f, t in zip(found, truth):
+        f = list(f)
+        ranks.append(1.0 / (f.index(t[0]) + 1) if len(t) and t[0] in f else 0.0)
+    return float(np.mean(ranks))
+
+
+class SearchEvaluator:
+    """
+    Compares Qdrant search results against exact ground truth.
+
+    The corpus is read back from the collection itself (vectors and IDs via
+    a paginated scroll), so the ground truth matches exactly what was
+    uploaded.
+
+    Attributes:
+    client : QdrantClient
+        Qdrant client instance
+    collection_name : str
+        Name of the collection
+    using : str or None
+        Named vector to evaluate (e.g. ``dense`` in hybrid collections,
+        ``en`` in paired ones)
+    ids : list
+        Point IDs of the corpus, by row
+    vectors : np.ndarray
+        ``(n, dim)`` corpus matrix
+    """
+
+    def __init__(self, client: QdrantClient, collection_name: str, using: str = None):
+        self.client = client
+        self.collection_name = collection_name
+        self.using = using
+        self.ids = []
+        self.vectors = None
+
+    def load_corpus(self, page_size: int = 1000):
+        """Scroll every point's vector out of the collection."""
+        ids, vectors = [], []
+        for point in iter_points(self.client, self.collection_name, fields=[],
+                                 with_vectors=True, page_size=page_size):
+            if self.using and self.using not in point.vector:
+                # e.g. a paired point without this language
+                continue
+            ids.append(str(point.id))
+            vectors.append(point.vector[self.using] if self.using else point.vector)
+
+        self.ids = ids
+        self.vectors = np.asarray(vectors, dtype=np.float32)
+        print(f" Corpus loaded: {len(ids)} vectors")
+
+    def ground_truth(self, queries: np.ndarray, k: int) -> List[List[str]]:
+        """Exact top-k point IDs for every query."""
+        if self.vectors is None:
+            self.load_corpus()
+        rows = exact_top_k(self.vectors, queries, k)
+        return [[self.ids[i] for i in row] for row in rows]
+
+    def run(self, queries: np.ndarray, params: Optional[SearchParams],
+            k: int) -> Dict[str, object]:
+        """Search every query with ``params``; return result IDs and latencies (ms)."""
+        found, latencies = [], []
+        for vector in queries:
+            start = time.perf_counter()
+            hits = self.client.query_points(
+                collection_name=self.collection_name,
+                query=np.asarray(vector).tolist(),
+                using=self.using,
+                search_params=params,
+                limit=k,
+                with_payload=False
+            ).points
+            latencies.append((time.perf_counter() - start) * 1000)
+            found.append([str(h.id) for h in hits])
+        return {'found': found, 'latencies': np.array(latencies)}
+
+    def evaluate(self, queries: np.ndarray, configs: Dict[str, Optional[SearchParams]],
+                 k: int = 10) -> Dict[str, Dict[str, float]]:
+        """
+        Recall@k, MRR and latency for each search configuration.
+
+        Parameters:
+        queries : np.ndarray
+            ``(q, dim)`` query vectors
+        configs : Dict[str, SearchParams]
+            Configuration name -> search params (None = server defaults)
+        k : int
+            Cut-off for recall and the number of results requested
+
+        Returns:
+        Dict[str, Dict[str, float]]
+            Per configuration: recall, mrr, p50_ms, p99_ms
+        """
+        truth = self.ground_truth(queries, k)
+
+        report = {}
+        for name, params in tqdm(configs.items(), desc="Configurations"):
+            result = self.run(queries, params, k)
+            report[name] = {
+                'recall': recall_at_k(result['found'], truth, k),
+                'mrr': mean_reciprocal_rank(result['found'], truth),
+                'p50_ms': float(np.percentile(result['latencies'], 50)),
+                'p99_ms': float(np.percentile(result['latencies'], 99)),
+            }
+        return report
+
+    @staticmethod
+    def print_report(report: Dict[str, Dict[str, float]], k: int = 10):
+        """Print an evaluation report as a table."""
+        print(f"\n {'configuration':<22} {f'recall@{k}':>10} {'MRR':>7} "
+              f"{'p50 ms':>8} {'p99 ms':>8}")
+        for name, row in report.items():
+            print(f" {name:<22} {row['recall']:>10.3f} {row['mrr']:>7.3f} "
+                  f"{row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f}")
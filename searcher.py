@@ -0,0 +1,428 @@
+# attraction searcher
+"""
+Semantic search over the Qdrant collection.
+Owns the embedding model and the client, and caches query vectors.
+"""
+
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Union
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import (FieldCondition, Filter, Fusion, FusionQuery, MatchAny,
+                                  MatchValue, Prefetch, QueryRequest, ScoredPoint, SearchParams)
+from async_qdrant_uploader import is_transient
+from collection_profiles import search_params
+from config import Config
+from embeddings import EmbeddingsGenerator
+from local_index import LocalIndex
+from sparse_vectors import DENSE_VECTOR, SPARSE_VECTOR, SparseEncoder
+from translation_pairs import LANGUAGES, vector_name
+
+logger = logging.getLogger(__name__)
+
+# payload needed to render a result card; pass as ``with_payload`` to skip
+# description/combined_text, the bulk of every payload
+CARD_FIELDS = ['id', 'name', 'category', 'location', 'language',
+               'has_processed_image', 'image_url']
+
+
+def normalize_query(query: str) -> str:
+    """
+    Cache key and model input for a query: NFC, trimmed, single-spaced.
+
+    Case is kept: the model is cased, so "Borjomi" and "borjomi" get
+    different vectors and must not share a cache entry.
+    """
+    return " ".join(unicodedata.normalize('NFC', query).split())
+
+
+class AttractionFilter:
+    """
+    Typed search filter over the indexed payload fields.
+
+    Each field takes one value or a list of alternatives; fields that are
+    set must all match. ``tags`` matches points having any of the given tags.
+
+    Example: ``AttractionFilter(category='Church', language=['EN', 'RU'])``
+    """
+
+    KEYWORD_FIELDS = ('category', 'language', 'location', 'tags')
+
+    def __init__(self, category: Union[str, Sequence[str]] = None,
+                 language: Union[str, Sequence[str]] = None,
+                 location: Union[str, Sequence[str]] = None,
+                 tags: Union[str, Sequence[str]] = None,
+                 has_image: bool = None):
+        self.category = category
+        self.language = language
+        self.location = location
+        self.tags = tags
+        self.has_image = has_image
+
+    def to_filter(self) -> Optional[Filter]:
+        """Compile to a Qdrant ``Filter`` (None if nothing is set)."""
+        conditions = []
+        for field in self.KEYWORD_FIELDS:
+            value = getattr(self, field)
+            if value is None:
+                continue
+            if isinstance(value, str):
+                match = MatchValue(value=value)
+            else:
+                match = MatchAny(any=list(value))
+            conditions.append(FieldCondition(key=field, match=match))
+
+        if self.has_image is not None:
+            conditions.append(FieldCondition(key='has_processed_image',
+                                             match=MatchValue(value=bool(self.has_image))))
+
+        return Filter(must=conditions) if conditions else None
+
+
+def compile_filter(query_filter: Union[Filter, AttractionFilter, None]) -> Optional[Filter]:
+    """Accept a raw Qdrant ``Filter`` or an ``AttractionFilter``."""
+    if isinstance(query_filter, AttractionFilter):
+        return query_filter.to_filter()
+    return query_filter
+
+
+class QueryVectorCache:
+    """
+    Thread-safe bounded LRU of query text -> embedding vector.
+
+    Attributes:
+    max_size : int
+        Maximum number of cached queries
+    hits : int
+        Lookups served from the cache
+    misses : int
+        Lookups that needed encoding
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._vectors = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Cached vector for ``key`` (marking it recently used), or None."""
+        with self._lock:
+            vector = self._vectors.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._vectors.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, key: str, vector: np.ndarray):
+        """Store a vector, evicting the least recently used one when full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._vectors[key] = vector
+            self._vectors.move_to_end(key)
+            while len(self._vectors) > self.max_size:
+                self._vectors.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+
+class AttractionSearcher:
+    """
+    Searches attractions by free-text query.
+
+    Queries are normalized (Unicode NFC, whitespace) before encoding, so
+    "Wine  tasting" and "Wine tasting" share one cached vector.
+
+    With ``local_index`` and no URL/client, searches run in-process against
+    the exact local index. With both, Qdrant is queried and the local index
+    answers instead when Qdrant is unreachable.
+
+    ``hybrid=True`` is for collections uploaded with
+    ``QdrantUploader(hybrid=True)``: dense searches use the named ``dense``
+    vector, and ``search_hybrid`` fuses dense and BM25 sparse results.
+
+    ``paired=True`` is for collections uploaded with
+    ``QdrantUploader(paired=True)``: every search queries the ``en`` and
+    ``ru`` vectors of each point in one request and fuses them with RRF, so
+    an attraction appears once whichever translation matched.
+
+    Attributes:
+    client : QdrantClient or None
+        Qdrant client instance (None in local-only mode)
+    local_index : LocalIndex or None
+        Exact in-process index (local-only mode or offline fallback)
+    collection_name : str
+        Name of the collection
+    embedder : EmbeddingsGenerator
+        Query encoder (model loads on first search)
+    cache : QueryVectorCache
+        LRU of recent query vectors
+    search_params : SearchParams or None
+        Default ``hnsw_ef`` / rescore / oversampling for Qdrant searches
+    vector_name : str or None
+        Named dense vector to search (None for single-vector collections)
+    sparse_encoder : SparseEncoder or None
+        Query encoder for the sparse vector (hybrid collections only)
+    prefetch_vectors : list
+        Dense vectors queried by fused searches (``dense``, or ``en`` and ``ru``)
+    """
+
+    def __init__(self, url: str = None, api_key: str = None,
+                 collection_name: str = 'georgian_attractions',
+                 model_name: str = Config.EMBEDDING_MODEL,
+                 device: str = 'cuda', backend: str = 'torch',
+                 cache_size: int = 1024, client: QdrantClient = None,
+                 local_index: LocalIndex = None, hnsw_ef: int = None,
+                 rescore: bool = None, oversampling: float = None, hybrid: bool = False,
+                 paired: bool = False):
+        if client is None and url:
+            client = QdrantClient(url=url, api_key=api_key, timeout=60)
+        if client is None and local_index is None:
+            raise ValueError("Qdrant URL not set (QDRANT_URL in .env file)")
+        if hybrid and paired:
+            raise ValueError("Hybrid and paired collections cannot be combined")
+
+        self.client = client
+        self.local_index = local_index
+        self.collection_name = collection_name
+        self.embedder = EmbeddingsGenerator(model_name, device=device, backend=backend)
+        self.cache = QueryVectorCache(cache_size)
+        self.search_params = search_params(hnsw_ef, rescore, oversampling)
+        self.vector_name = DENSE_VECTOR if hybrid else None
+        self.sparse_encoder = SparseEncoder() if hybrid else None
+        self.paired = paired
+        if paired:
+            self.prefetch_vectors = [vector_name(language) for language in LANGUAGES]
+        else:
+            self.prefetch_vectors = [DENSE_VECTOR] if hybrid else []
+
+    def encode_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        Query vectors for ``queries``, encoding only cache misses.
+
+        All misses are encoded in a single forward pass. The model encodes
+        the normalized text, so a query's vector does not depend on which
+        spelling of it was seen first.
+        """
+        keys = [normalize_query(q) for q in queries]
+        vectors = [self.cache.get(key) for key in keys]
+
+        # one encode call for the distinct uncached queries
+        missing = list(dict.fromkeys(key for key, v in zip(keys, vectors) if v is None))
+        if missing:
+            encoded = self.embedder.model.encode(
+                missing,
+                batch_size=len(missing),
+                show_progress_bar=False,
+                convert_to_numpy=True
+            ).astype(np.float32, copy=False)
+            fresh = dict(zip(missing, encoded))
+            for key, vector in fresh.items():
+                self.cache.put(key, vector)
+            vectors = [fresh[key] if v is None else v for key, v in zip(keys, vectors)]
+
+        return np.stack(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+
+    def search(self, query: str, limit: int = 5,
+               query_filter: Union[AttractionFilter, Filter] = None,
+               with_payload=True, params: SearchParams = None) -> List[ScoredPoint]:
+        """
+        Search one query.
+
+        Parameters:
+        query : str
+            Free-text query in any supported language
+        limit : int
+            Number of results
+        query_filter : AttractionFilter or Filter, optional
+            Typed filter or raw Qdrant payload filter
+        with_payload : bool, list or PayloadSelector
+            Payload to return with each hit: True, False, a list of fields
+            (e.g. ``CARD_FIELDS``) or ``PayloadSelectorExclude``
+        params : SearchParams, optional
+            Overrides the searcher's ``search_params`` (ignored by the local index)
+
+        Returns:
+        List[ScoredPoint]
+            Hits ordered by score
+        """
+        vectors = self.encode_queries([query])
+        query_filter = compile_filter(query_filter)
+        if self.paired:
+            return self._fused(vectors, None, limit, query_filter, with_payload, params)[0]
+
+        def remote():
+            return [self.client.query_points(
+                collection_name=self.collection_name,
+                query=vectors[0].tolist(),
+                using=self.vector_name,
+                query_filter=query_filter,
+                search_params=params or self.search_params,
+                limit=limit,
+                with_payload=with_payload
+            ).points]
+
+        return self._run(remote, vectors, limit, query_filter, with_payload)[0]
+
+    def search_batch(self, queries: List[str], limit: int = 5,
+                     query_filter: Union[AttractionFilter, Filter] = None,
+                     with_payload=True, params: SearchParams = None) -> List[List[ScoredPoint]]:
+        """
+        Search many queries: one encode call and one ``query_batch_points`` request.
+
+        Takes the same ``limit``, ``query_filter``, ``with_payload`` and ``params``
+        as ``search``.
+
+        Returns:
+        List[List[ScoredPoint]]
+            Hits for each query, in input order
+        """
+        if not queries:
+            return []
+
+        vectors = self.encode_queries(queries)
+        query_filter = compile_filter(query_filter)
+        if self.paired:
+            return self._fused(vectors, None, limit, query_filter, with_payload, params)
+
+        def remote():
+            requests = [
+                QueryRequest(query=vector.tolist(), using=self.vector_name, filter=query_filter,
+                             limit=limit, params=params or self.search_params,
+                             with_payload=with_payload)
+                for vector in vectors
+            ]
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests
+            )
+            return [response.points for response in responses]
+
+        return self._run(remote, vectors, limit, query_filter, with_payload)
+
+    def _prefetch(self, vector: np.ndarray, sparse, query_filter: Filter, limit: int,
+                  params: SearchParams) -> List[Prefetch]:
+        """Candidate queries for one fused search: each dense vector, plus sparse if given."""
+        prefetch = [Prefetch(query=vector.tolist(), using=name, filter=query_filter,
+                             params=params or self.search_params, limit=limit)
+                    for name in self.prefetch_vectors]
+        if sparse is not None:
+            prefetch.append(Prefetch(query=sparse, using=SPARSE_VECTOR, filter=query_filter,
+                                     limit=limit))
+        return prefetch
+
+    def _fused(self, vectors: np.ndarray, sparse, limit: int, query_filter: Filter,
+               with_payload, params: SearchParams,
+               prefetch_limit: int = None) -> List[List[ScoredPoint]]:
+        """
+        Prefetch from several vectors and fuse with RRF on the server.
+
+        One ``query_points`` request for a single query, one
+        ``query_batch_points`` request for several. ``prefetch_limit``
+        defaults to ``4 * limit`` candidates per vector.
+        """
+        prefetch_limit = prefetch_limit or 4 * limit
+        sparse = sparse if sparse is not None else [None] * len(vectors)
+
+        def remote():
+            if len(vectors) == 1:
+                return [self.client.query_points(
+                    collection_name=self.collection_name,
+                    prefetch=self._prefetch(vectors[0], sparse[0], query_filter,
+                                            prefetch_limit, params),
+                    query=FusionQuery(fusion=Fusion.RRF),
+                    limit=limit,
+                    with_payload=with_payload
+                ).points]
+
+            requests = [
+                QueryRequest(prefetch=self._prefetch(vector, s, query_filter,
+                                                     prefetch_limit, params),
+                             query=FusionQuery(fusion=Fusion.RRF), limit=limit,
+                             with_payload=with_payload)
+                for vector, s in zip(vectors, sparse)
+            ]
+            responses = self.client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=requests
+            )
+            return [response.points for response in responses]
+
+        return self._run(remote, vectors, limit, query_filter, with_payload)
+
+    def search_hybrid(self, query: str, limit: int = 5,
+                      query_filter: Union[AttractionFilter, Filter] = None,
+                      with_payload=True, params: SearchParams = None,
+                      prefetch_limit: int = None) -> List[ScoredPoint]:
+        """
+        Dense + keyword search fused server-side in one ``query_points`` request.
+
+        The dense and BM25 sparse vectors each fetch ``prefetch_limit``
+        candidates (default ``4 * limit``), which Qdrant merges with
+        Reciprocal Rank Fusion. Exact names such as "Svetitskhoveli" rank
+        through the sparse side even when the dense vector misses them.
+        Takes the same other arguments as ``search``; ``params`` applies to
+        the dense prefetch. Offline, the local index answers with dense
+        results only.
+
+        Returns:
+        List[ScoredPoint]
+            Hits ordered by fused score
+        """
+        return self.search_hybrid_batch([query], limit, query_filter, with_payload,
+                                        params, prefetch_limit)[0]
+
+    def search_hybrid_batch(self, queries: List[str], limit: int = 5,
+                            query_filter: Union[AttractionFilter, Filter] = None,
+                            with_payload=True, params: SearchParams = None,
+                            prefetch_limit: int = None) -> List[List[ScoredPoint]]:
+        """
+        ``search_hybrid`` for many queries in one ``query_batch_points`` request.
+
+        Returns:
+        List[List[ScoredPoint]]
+            Hits for each query, in input order
+        """
+        if self.sparse_encoder is None:
+            raise ValueError("Hybrid search needs AttractionSearcher(hybrid=True) "
+                             "and a collection uploaded with QdrantUploader(hybrid=True)")
+        if not queries:
+            return []
+
+        vectors = self.encode_queries(queries)
+        sparse = self.sparse_encoder.encode_queries(queries)
+        return self._fused(vectors, sparse, limit, compile_filter(query_filter),
+                           with_payload, params, prefetch_limit)
+
+    def _run(self, remote, vectors: np.ndarray, limit: int, query_filter: Filter,
+             with_payload) -> List[List[ScoredPoint]]:
+        """Run ``remote()`` against Qdrant, or the local index when offline."""
+        if self.client is not None:
+            try:
+                return remote()
+            except Exception as e:
+                if self.local_index is None or not is_transient(e):
+                    raise
+                logger.warning(f"Qdrant unreachable ({e}), using local index")
+
+        return self.local_index.search_vectors(vectors, limit=limit,
+                                               query_filter=query_filter,
+                                               with_payload=with_payload)
+
+    def cache_stats(self) -> dict:
+        """Query cache size and hit counts."""
+        lookups = self.cache.hits + self.cache.misses
+        return {
+            'size': len(self.cache),
+            'hits': self.cache.hits,
+            'misses': self.cache.misses,
+            'hit_rate': self.cache.hits / lookups if lookups else 0.0,
+        }
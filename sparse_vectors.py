@@ -0,0 +1,121 @@
+# sparse vectors
+"""
+BM25-style sparse vectors for keyword matching next to the dense embeddings.
+
+Documents get saturated term frequencies with length normalization; the
+IDF part of BM25 is applied by Qdrant (``Modifier.IDF``), so it always
+reflects the whole collection and needs no corpus statistics at query time.
+The average document length is fitted once and stored in the collection
+metadata, so every upload into a collection uses the same value.
+"""
+
+import re
+import zlib
+from typing import Dict, List, Sequence
+import numpy as np
+from qdrant_client.models import Modifier, SparseVector, SparseVectorParams
+
+# vector names in hybrid collections
+DENSE_VECTOR = 'dense'
+SPARSE_VECTOR = 'sparse'
+
+# collection metadata key holding the fitted average document length
+AVG_DOC_LEN_KEY = 'bm25_avg_doc_len'
+
+# words of 2+ letters/digits, any script (Georgian, Cyrillic, Latin)
+TOKEN_PATTERN = re.compile(r'\w\w+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of a text."""
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def sparse_vectors_config() -> Dict[str, SparseVectorParams]:
+    """Sparse vector settings for ``create_collection`` (IDF computed by Qdrant)."""
+    return {SPARSE_VECTOR: SparseVectorParams(modifier=Modifier.IDF)}
+
+
+class SparseEncoder:
+    """
+    Encodes texts as BM25 term weights keyed by hashed token IDs.
+
+    Token IDs are CRC32 hashes of the token, so there is no vocabulary to
+    fit or ship with the searcher; collisions are rare enough to ignore at
+    this corpus size.
+
+    Attributes:
+    k1 : float
+        Term frequency saturation
+    b : float
+        Document length normalization (0 = none, 1 = full)
+    avg_doc_len : float or None
+        Average document length in tokens; must be set (or ``fit``) before
+        ``encode_documents``
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, avg_doc_len: float = None):
+        self.k1 = k1
+        self.b = b
+        self.avg_doc_len = avg_doc_len
+
+    def fit(self, texts: Sequence[str]) -> 'SparseEncoder':
+        """Fix ``avg_doc_len`` from a corpus, so later batches are weighted alike."""
+        lengths = [len(tokenize(text)) for text in texts]
+        self.avg_doc_len = max(float(np.mean(lengths)), 1.0) if lengths else None
+        return self
+
+    @staticmethod
+    def _token_ids(texts: Sequence[str]):
+        """Flat token IDs of all texts and the number of tokens per text."""
+        tokens = [tokenize(text) for text in texts]
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+        flat = np.array([t for doc in tokens for t in doc], dtype=str)
+        if not len(flat):
+            return np.zeros(0, dtype=np.uint32), lengths
+
+        # hash each distinct token once
+        vocab, inverse = np.unique(flat, return_inverse=True)
+        hashes = np.fromiter((zlib.crc32(t.encode('utf-8')) for t in vocab),
+                             dtype=np.uint32, count=len(vocab))
+        return hashes[inverse], lengths
+
+    @staticmethod
+    def _split(docs: np.ndarray, terms: np.ndarray, values: np.ndarray,
+               n: int) -> List[SparseVector]:
+        """Cut flat (doc, term, value) arrays, sorted by doc, into one vector per doc."""
+        bounds = np.searchsorted(docs, np.arange(n + 1))
+        return [SparseVector(indices=terms[i:j].tolist(), values=values[i:j].tolist())
+                for i, j in zip(bounds[:-1], bounds[1:])]
+
+    def _term_counts(self, texts: Sequence[str]):
+        """
+        (document, token ID, count) triples, sorted by document, and text lengths.
+
+        Counts come from one ``np.unique`` over packed (document, token) keys
+        for the whole batch instead of a Counter per document.
+        """
+        ids, lengths = self._token_ids(texts)
+        docs = np.repeat(np.arange(len(texts), dtype=np.uint64), lengths)
+
+        keys, tf = np.unique((docs << np.uint64(32)) | ids.astype(np.uint64),
+                             return_counts=True)
+        docs = (keys >> np.uint64(32)).astype(np.int64)
+        terms = (keys & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        return docs, terms, tf, lengths
+
+    def encode_documents(self, texts: Sequence[str]) -> List[SparseVector]:
+        """BM25 document weights ``tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))``."""
+        if self.avg_doc_len is None:
+            raise ValueError("SparseEncoder is not fitted: call fit() or pass avg_doc_len")
+        docs, terms, tf, lengths = self._term_counts(texts)
+
+        norm = self.k1 * (1 - self.b + self.b * lengths[docs] / self.avg_doc_len)
+        weights = (tf * (self.k1 + 1) / (tf + norm)).astype(np.float32)
+
+        return self._split(docs, terms, weights, len(texts))
+
+    def encode_queries(self, texts: Sequence[str]) -> List[SparseVector]:
+        """Query vectors: weight 1 for every distinct token (Qdrant adds the IDF)."""
+        docs, terms, _, _ = self._term_counts(texts)
+        return self._split(docs, terms, np.ones(len(terms), dtype=np.float32), len(texts))
@@ -0,0 +1,99 @@
+# BENCHMARK: inference backends
+"""
+Compares torch, ONNX and int8-quantized ONNX backends on CPU:
+cosine parity with torch vectors, corpus throughput, single-query latency
+and top-10 retrieval agreement.
+"""
+
+import logging
+import time
+import numpy as np
+from config import Config
+from data_loader import GeorgianAttractionsDataLoader
+from embeddings import EmbeddingsGenerator
+from model_backends import BACKENDS
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+test_queries = [
+    "пляжи в Батуми",
+    "ancient churches in Georgia",
+    "горы и природа",
+    "museums in Tbilisi",
+    "wine tasting",
+    "Borjomi National Park",
+]
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def top_k(queries: np.ndarray, corpus: np.ndarray, k: int = 10) -> np.ndarray:
+    return np.argsort(-(queries @ corpus.T), axis=1)[:, :k]
+
+
+def benchmark_backends():
+    """Encode the corpus and the test queries with every backend."""
+    print(" BENCHMARK: inference backends (CPU)")
+
+    loader = GeorgianAttractionsDataLoader(Config.DATASET_NAME)
+    records = loader.load_columnar()
+
+    results = {}
+    for backend in BACKENDS:
+        print(f"\n Backend: {backend}")
+        embedder = EmbeddingsGenerator(model_name=Config.EMBEDDING_MODEL,
+                                       device='cpu', backend=backend)
+        embedder.warmup()
+        texts = [embedder.create_combined_text(rec) for rec in records]
+
+        start = time.perf_counter()
+        corpus = embedder.encode_texts(texts, batch_size=Config.BATCH_SIZE,
+                                       show_progress=False)
+        elapsed = time.perf_counter() - start
+
+        latencies = []
+        for _ in range(5):
+            for query in test_queries:
+                start = time.perf_counter()
+                embedder.model.encode(query)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        results[backend] = {
+            'corpus': normalize(corpus),
+            'queries': normalize(embedder.model.encode(test_queries)),
+            'throughput': len(texts) / elapsed,
+            'p50': np.percentile(latencies, 50),
+            'p99': np.percentile(latencies, 99),
+        }
+
+    reference = results['torch']
+    reference_top = top_k(reference['queries'], reference['corpus'])
+
+    print(f"\n{'backend':<10} {'texts/s':>8} {'p50 ms':>7} {'p99 ms':>7} "
+          f"{'min cos':>8} {'mean cos':>8} {'top10 overlap':>13}")
+    for backend, res in results.items():
+        cosine = np.sum(res['corpus'] * reference['corpus'], axis=1)
+        overlap = np.mean([
+            len(set(a) & set(b)) / len(a)
+            for a, b in zip(top_k(res['queries'], res['corpus']), reference_top)
+        ])
+        print(f"{backend:<10} {res['throughput']:>8.1f} {res['p50']:>7.2f} "
+              f"{res['p99']:>7.2f} {cosine.min():>8.4f} {cosine.mean():>8.4f} "
+              f"{overlap:>13.2%}")
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_backends()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
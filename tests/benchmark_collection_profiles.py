@@ -0,0 +1,121 @@
+# BENCHMARK: collection profiles
+"""
+Builds one collection per profile (see collection_profiles.py) from a
+synthetic corpus and reports estimated RAM, p50/p99 search latency and
+recall@k against exact NumPy ground truth, for a few search-time settings.
+
+Needs a Qdrant server; by default a local one
+(docker run -p 6333:6333 qdrant/qdrant). Set BENCH_QDRANT_URL to use
+another and BENCH_PROFILES to pick profiles (comma separated). The corpus
+must be large enough for Qdrant to build the HNSW index (10x by default),
+otherwise every profile does a full scan. Collections are deleted at the end.
+"""
+
+import logging
+import os
+import time
+import numpy as np
+from collection_profiles import PROFILES, search_params
+from qdrant_uploader import QdrantUploader, point_id
+from search_eval import exact_top_k, recall_at_k
+from synthetic_corpus import BASE_SIZE, iter_synthetic, synthetic_records
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+QDRANT_URL = os.getenv('BENCH_QDRANT_URL', 'http://localhost:6333')
+QDRANT_API_KEY = os.getenv('BENCH_QDRANT_API_KEY')
+SCALE = float(os.getenv('BENCH_SCALE', '10'))
+PROFILE_NAMES = os.getenv('BENCH_PROFILES', ','.join(PROFILES)).split(',')
+NUM_QUERIES = 200
+K = 10
+
+# search-time settings tried on every profile
+SEARCH_SETTINGS = {
+    'server default': search_params(),
+    'hnsw_ef=128': search_params(hnsw_ef=128),
+    'rescore x2': search_params(hnsw_ef=128, rescore=True, oversampling=2.0),
+    'no rescore': search_params(hnsw_ef=128, rescore=False),
+}
+
+
+def wait_indexed(uploader: QdrantUploader, timeout: float = 900.0):
+    """Wait until the optimizer has finished building the index."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        info = uploader.client.get_collection(uploader.collection_name)
+        if info.status.value == 'green':
+            return info
+        time.sleep(2)
+    return uploader.client.get_collection(uploader.collection_name)
+
+
+def run_queries(uploader: QdrantUploader, queries: np.ndarray, params):
+    """Top-K point IDs and latencies (ms) for every query."""
+    ids, latencies = [], []
+    for vector in queries:
+        start = time.perf_counter()
+        hits = uploader.client.query_points(
+            collection_name=uploader.collection_name,
+            query=vector.tolist(),
+            search_params=params,
+            limit=K,
+            with_payload=False
+        ).points
+        latencies.append((time.perf_counter() - start) * 1000)
+        ids.append([str(h.id) for h in hits])
+    return ids, np.array(latencies)
+
+
+def benchmark_collection_profiles():
+    """Build every profile and report memory, latency and recall."""
+    print(" BENCHMARK: collection profiles")
+
+    chunks = list(iter_synthetic(SCALE))
+    vectors = np.concatenate([c.vectors for c in chunks])
+    ids = [point_id(rid) for c in chunks for rid in c.payloads['id']]
+    points, dim = vectors.shape
+    print(f"   Corpus: {points} points x {dim} ({SCALE}x of {BASE_SIZE})")
+
+    queries = synthetic_records(NUM_QUERIES, seed=1).vectors
+    truth = [[ids[i] for i in row] for row in exact_top_k(vectors, queries, K)]
+
+    rows = []
+    for name in PROFILE_NAMES:
+        uploader = QdrantUploader(url=QDRANT_URL, api_key=QDRANT_API_KEY,
+                                  collection_name=f"bench_profile_{name}",
+                                  vector_size=dim, profile=name)
+        try:
+            uploader.create_collection(recreate=True, payload_indexes=False)
+            uploader.upload_stream(chunks, batch_size=256, verify_timeout=600)
+            info = wait_indexed(uploader)
+            print(f"   Indexed vectors: {info.indexed_vectors_count}")
+
+            ram_mb = uploader.profile.estimated_ram(points, dim) / 1024 ** 2
+            for setting, params in SEARCH_SETTINGS.items():
+                if uploader.profile.quantization is None and 'rescore' in setting:
+                    continue
+                found, ms = run_queries(uploader, queries, params)
+                rows.append((name, setting, ram_mb, np.percentile(ms, 50),
+                             np.percentile(ms, 99), recall_at_k(found, truth, K)))
+        finally:
+            uploader.client.delete_collection(uploader.collection_name)
+
+    print(f"\n {'profile':<12} {'search':<16} {'est. RAM MB':>11} {'p50 ms':>8} "
+          f"{'p99 ms':>8} {f'recall@{K}':>10}")
+    for name, setting, ram_mb, p50, p99, rec in rows:
+        print(f" {name:<12} {setting:<16} {ram_mb:>11.1f} {p50:>8.2f} {p99:>8.2f} {rec:>10.3f}")
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_collection_profiles()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,68 @@
+# BENCHMARK: multi-process CPU encoding
+"""
+Measures embedding throughput with 1..N CPU worker processes.
+"""
+
+import logging
+import time
+import numpy as np
+from config import Config
+from data_loader import GeorgianAttractionsDataLoader
+from embeddings import EmbeddingsGenerator
+from encoding_pool import physical_cores
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+def benchmark_encoding_pool():
+    """Encode the full corpus with an increasing number of workers."""
+    print(" BENCHMARK: multi-process CPU encoding")
+
+    loader = GeorgianAttractionsDataLoader(Config.DATASET_NAME)
+    records = loader.load_columnar()
+
+    embedder = EmbeddingsGenerator(model_name=Config.EMBEDDING_MODEL, device='cpu')
+    embedder.warmup()
+    texts = [embedder.create_combined_text(rec) for rec in records]
+
+    print(f"\n Single process baseline ({len(texts)} texts)...")
+    start = time.perf_counter()
+    baseline = embedder.encode_texts(texts, batch_size=Config.BATCH_SIZE,
+                                     show_progress=False)
+    baseline_time = time.perf_counter() - start
+    print(f"   Time: {baseline_time:.2f}s ({len(texts) / baseline_time:.1f} texts/s)")
+
+    max_workers = physical_cores()
+    worker_counts = sorted({1, 2, 4, max_workers} & set(range(1, max_workers + 1)))
+
+    for num_workers in worker_counts:
+        embedder.num_workers = num_workers
+
+        # start the pool and load models outside the timed region
+        embedder.encode_texts(texts[:num_workers], batch_size=1, show_progress=False)
+
+        start = time.perf_counter()
+        vectors = embedder.encode_texts(texts, batch_size=Config.BATCH_SIZE,
+                                        show_progress=False)
+        elapsed = time.perf_counter() - start
+        embedder.close()
+
+        print(f"\n Workers: {num_workers}")
+        print(f"   Time: {elapsed:.2f}s ({len(texts) / elapsed:.1f} texts/s)")
+        print(f"   Speedup vs single process: {baseline_time / elapsed:.2f}x")
+        print(f"   Max abs diff vs baseline: {np.abs(vectors - baseline).max():.2e}")
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_encoding_pool()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
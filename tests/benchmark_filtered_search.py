@@ -0,0 +1,108 @@
+# BENCHMARK: filtered search with and without payload indexes
+"""
+Filtered-search latency on a synthetic corpus 100x the real one, in two
+collections that differ only in payload indexes.
+
+Needs a Qdrant server; by default a local one
+(docker run -p 6333:6333 qdrant/qdrant). Set BENCH_QDRANT_URL to use
+another. The benchmark collections are deleted at the end.
+"""
+
+import logging
+import os
+import time
+import numpy as np
+from qdrant_client.models import Filter
+from qdrant_uploader import QdrantUploader
+from searcher import AttractionFilter
+from synthetic_corpus import BASE_SIZE, iter_synthetic, synthetic_records
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+QDRANT_URL = os.getenv('BENCH_QDRANT_URL', 'http://localhost:6333')
+QDRANT_API_KEY = os.getenv('BENCH_QDRANT_API_KEY')
+SCALE = int(os.getenv('BENCH_SCALE', '100'))
+NUM_QUERIES = 100
+LIMIT = 10
+
+FILTERS = {
+    'none': None,
+    'category': AttractionFilter(category='Church'),
+    'rare category': AttractionFilter(category='Winery'),
+    'language + location': AttractionFilter(language='EN', location='Svaneti'),
+    'tags (any)': AttractionFilter(tags=['unesco', 'wine']),
+    'has image': AttractionFilter(has_image=True),
+    'combined': AttractionFilter(category=['Church', 'Monastery'], language='RU',
+                                 location='Mtskheta', has_image=True),
+}
+
+
+def build(name: str, indexed: bool) -> QdrantUploader:
+    """Create and fill one benchmark collection."""
+    uploader = QdrantUploader(url=QDRANT_URL, api_key=QDRANT_API_KEY,
+                              collection_name=name, vector_size=384)
+    uploader.create_collection(recreate=True, payload_indexes=indexed)
+    uploader.upload_stream(iter_synthetic(SCALE), batch_size=256, parallel=2,
+                           verify_timeout=600)
+    return uploader
+
+
+def latencies(uploader: QdrantUploader, queries: np.ndarray, query_filter: Filter):
+    """Per-query latency in milliseconds."""
+    result = []
+    for vector in queries:
+        start = time.perf_counter()
+        uploader.client.query_points(
+            collection_name=uploader.collection_name,
+            query=vector.tolist(),
+            query_filter=query_filter,
+            limit=LIMIT,
+            with_payload=False
+        )
+        result.append((time.perf_counter() - start) * 1000)
+    return np.array(result)
+
+
+def benchmark_filtered_search():
+    """Compare filtered-search latency with and without payload indexes."""
+    print(" BENCHMARK: filtered search")
+    print(f"   Corpus: {SCALE}x = {BASE_SIZE * SCALE} points")
+
+    collections = {
+        'indexed': build('bench_filters_indexed', indexed=True),
+        'no index': build('bench_filters_plain', indexed=False),
+    }
+    queries = synthetic_records(NUM_QUERIES, seed=1).vectors
+
+    try:
+        print(f"\n {'filter':<20} {'matches':>8} "
+              + ''.join(f"{name + ' p50':>16}{name + ' p99':>16}" for name in collections))
+        for name, typed in FILTERS.items():
+            query_filter = typed.to_filter() if typed else None
+            matches = collections['indexed'].client.count(
+                collections['indexed'].collection_name, count_filter=query_filter, exact=True
+            ).count
+
+            row = f" {name:<20} {matches:>8} "
+            for uploader in collections.values():
+                ms = latencies(uploader, queries, query_filter)
+                row += f"{np.percentile(ms, 50):>13.2f} ms{np.percentile(ms, 99):>13.2f} ms"
+            print(row)
+    finally:
+        for uploader in collections.values():
+            uploader.client.delete_collection(uploader.collection_name)
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_filtered_search()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
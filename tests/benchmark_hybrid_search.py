@@ -0,0 +1,122 @@
+# BENCHMARK: hybrid dense + sparse search
+"""
+Exact-name lookups on a synthetic hybrid collection, three ways:
+dense only, dense + a separate keyword query merged on the client
+(two round trips), and one ``query_points`` request with dense and sparse
+prefetches fused by RRF on the server.
+
+Dense query vectors are the target's vector with heavy noise, standing in
+for a model that does not know a rare name. Needs a Qdrant server; by
+default a local one (docker run -p 6333:6333 qdrant/qdrant). Set
+BENCH_QDRANT_URL to use another. The benchmark collection is deleted at
+the end.
+"""
+
+import logging
+import os
+import time
+import numpy as np
+from qdrant_client.models import Fusion, FusionQuery, Prefetch
+from qdrant_uploader import QdrantUploader
+from sparse_vectors import DENSE_VECTOR, SPARSE_VECTOR, SparseEncoder
+from synthetic_corpus import BASE_SIZE, iter_synthetic, synthetic_records
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+QDRANT_URL = os.getenv('BENCH_QDRANT_URL', 'http://localhost:6333')
+QDRANT_API_KEY = os.getenv('BENCH_QDRANT_API_KEY')
+SCALE = int(os.getenv('BENCH_SCALE', '10'))
+NUM_QUERIES = 100
+LIMIT = 5
+PREFETCH = 4 * LIMIT
+NOISE = 1.5
+
+
+def dense_only(client, name, vector, sparse):
+    """Dense vector alone (what search() does)."""
+    return client.query_points(name, query=vector, using=DENSE_VECTOR, limit=LIMIT,
+                               with_payload=['photo_name']).points
+
+
+def two_requests(client, name, vector, sparse):
+    """Dense and keyword results fetched separately and fused on the client."""
+    dense = client.query_points(name, query=vector, using=DENSE_VECTOR, limit=PREFETCH,
+                                with_payload=['photo_name']).points
+    keyword = client.query_points(name, query=sparse, using=SPARSE_VECTOR, limit=PREFETCH,
+                                  with_payload=['photo_name']).points
+    scores, points = {}, {}
+    for hits in (dense, keyword):
+        for rank, hit in enumerate(hits):
+            scores[hit.id] = scores.get(hit.id, 0.0) + 1.0 / (rank + 1)
+            points[hit.id] = hit
+    ranked = sorted(scores, key=lambda pid: -scores[pid])[:LIMIT]
+    return [points[pid] for pid in ranked]
+
+
+def fused(client, name, vector, sparse):
+    """One request: dense and sparse prefetches, RRF on the server."""
+    return client.query_points(
+        name,
+        prefetch=[Prefetch(query=vector, using=DENSE_VECTOR, limit=PREFETCH),
+                  Prefetch(query=sparse, using=SPARSE_VECTOR, limit=PREFETCH)],
+        query=FusionQuery(fusion=Fusion.RRF),
+        limit=LIMIT,
+        with_payload=['photo_name']
+    ).points
+
+
+METHODS = {
+    'dense only': dense_only,
+    'dense + keyword (2 requests)': two_requests,
+    'hybrid RRF (1 request)': fused,
+}
+
+
+def benchmark_hybrid_search():
+    """Compare name-lookup hit rate and latency of dense, two-request and fused search."""
+    print(" BENCHMARK: hybrid search")
+    print(f"   Corpus: {SCALE}x = {BASE_SIZE * SCALE} points")
+
+    uploader = QdrantUploader(url=QDRANT_URL, api_key=QDRANT_API_KEY,
+                              collection_name='bench_hybrid', vector_size=384, hybrid=True)
+    uploader.create_collection(recreate=True)
+    uploader.upload_stream(iter_synthetic(SCALE), batch_size=256, verify_timeout=600)
+
+    # EN records of the first chunk as lookup targets
+    targets = synthetic_records(min(10000, BASE_SIZE * SCALE))
+    rng = np.random.default_rng(1)
+    rows = rng.choice(np.arange(0, len(targets), 2), NUM_QUERIES, replace=False)
+    names = targets.payloads['name'].iloc[rows].tolist()
+    photos = targets.payloads['photo_name'].iloc[rows].tolist()
+    noise = rng.normal(0, NOISE, (NUM_QUERIES, targets.vectors.shape[1]))
+    vectors = targets.vectors[rows] + noise
+    sparse = SparseEncoder().encode_queries(names)
+
+    try:
+        print(f"\n {'method':<30} {f'hit@{LIMIT}':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for method, search in METHODS.items():
+            hits, ms = 0, []
+            for vector, s, photo in zip(vectors, sparse, photos):
+                start = time.perf_counter()
+                points = search(uploader.client, uploader.collection_name, vector.tolist(), s)
+                ms.append((time.perf_counter() - start) * 1000)
+                hits += any(p.payload['photo_name'] == photo for p in points)
+            print(f" {method:<30} {hits / NUM_QUERIES:>8.2f} "
+                  f"{np.percentile(ms, 50):>8.2f} {np.percentile(ms, 99):>8.2f}")
+    finally:
+        uploader.client.delete_collection(uploader.collection_name)
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_hybrid_search()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,78 @@
+# BENCHMARK: length-bucketed batching
+"""
+Compares dataset-order batching with length-bucketed batching on CPU,
+using the real corpus's combined_text length distribution.
+"""
+
+import logging
+import time
+import numpy as np
+from config import Config
+from data_loader import GeorgianAttractionsDataLoader
+from embeddings import EmbeddingsGenerator
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+TOKEN_BUDGETS = [2048, 4096, 8192]
+
+
+def timed_encode(embedder, texts, **kwargs):
+    """Encode texts and return (vectors, seconds)."""
+    start = time.perf_counter()
+    vectors = embedder.encode_texts(texts, show_progress=False, **kwargs)
+    return vectors, time.perf_counter() - start
+
+
+def benchmark_length_bucketing():
+    """Time fixed vs bucketed batching on the full corpus."""
+    print(" BENCHMARK: length-bucketed batching (CPU)")
+
+    loader = GeorgianAttractionsDataLoader(Config.DATASET_NAME)
+    records = loader.load_columnar()
+
+    embedder = EmbeddingsGenerator(model_name=Config.EMBEDDING_MODEL, device='cpu')
+    embedder.warmup()
+    texts = [embedder.create_combined_text(rec) for rec in records]
+
+    lengths = embedder.token_lengths(texts)
+    print(f"\n Token lengths ({len(texts)} texts):")
+    for q in [10, 50, 90, 99]:
+        print(f"   p{q}: {int(np.percentile(lengths, q))}")
+    print(f"   max: {lengths.max()} (model limit {embedder.model.max_seq_length})")
+
+    # padded tokens actually processed by each strategy
+    def padded_tokens(batch_size, max_tokens):
+        plan = embedder._plan_batches(texts, batch_size, max_tokens)
+        return sum(len(b) * int(lengths[b].max()) for b in plan)
+
+    print(f"\n Fixed batches (batch_size={Config.BATCH_SIZE})...")
+    baseline, baseline_time = timed_encode(embedder, texts, batch_size=Config.BATCH_SIZE)
+    print(f"   Time: {baseline_time:.2f}s, padded tokens: {padded_tokens(Config.BATCH_SIZE, None)}")
+
+    for budget in TOKEN_BUDGETS:
+        print(f"\n Bucketed (max_tokens={budget}, batch_size<={Config.BATCH_SIZE * 4})...")
+        vectors, elapsed = timed_encode(
+            embedder, texts, batch_size=Config.BATCH_SIZE * 4, max_tokens=budget
+        )
+
+        cosine = np.sum(vectors * baseline, axis=1) / (
+            np.linalg.norm(vectors, axis=1) * np.linalg.norm(baseline, axis=1)
+        )
+        print(f"   Time: {elapsed:.2f}s, speedup: {baseline_time / elapsed:.2f}x")
+        print(f"   Padded tokens: {padded_tokens(Config.BATCH_SIZE * 4, budget)}")
+        print(f"   Min cosine vs baseline: {cosine.min():.6f}")
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_length_bucketing()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
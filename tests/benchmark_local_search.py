@@ -0,0 +1,108 @@
+# BENCHMARK: local exact search vs Qdrant Cloud
+"""
+Per-query latency of the in-process exact index (LocalIndex) against a
+round trip to Qdrant Cloud, on the uploaded embeddings. Query vectors are
+taken from the corpus with noise added, so no model is loaded.
+"""
+
+import logging
+import pickle
+import time
+import numpy as np
+from qdrant_client.models import FieldCondition, Filter, MatchValue
+from config import Config
+from embedded_records import EmbeddedRecords
+from local_index import LocalIndex
+from qdrant_uploader import QdrantUploader
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+NUM_QUERIES = 200
+LIMIT = 5
+INDEX_DIR = '../data/local_index'
+
+
+def percentiles(latencies):
+    """p50 / p99 in milliseconds."""
+    ms = np.array(latencies) * 1000
+    return np.percentile(ms, 50), np.percentile(ms, 99)
+
+
+def time_calls(fn, queries):
+    """Latency of ``fn(vector)`` for every query vector."""
+    latencies = []
+    for vector in queries:
+        start = time.perf_counter()
+        fn(vector)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def benchmark_local_search():
+    """Compare local exact search with the remote Qdrant path."""
+    print(" BENCHMARK: local exact search")
+
+    with open('../data/processed_data.pkl', 'rb') as f:
+        records = EmbeddedRecords.from_dataframe(pickle.load(f))
+    print(f"\n Loaded {len(records)} records")
+
+    index = LocalIndex.build(records, INDEX_DIR)
+
+    rng = np.random.default_rng(0)
+    rows = rng.integers(0, len(records), NUM_QUERIES)
+    queries = records.vectors[rows] + rng.normal(0, 0.05, records.vectors[rows].shape)
+    queries = queries.astype(np.float32)
+    church = Filter(must=[FieldCondition(key="category", match=MatchValue(value="Church"))])
+
+    results = {}
+    results['local'] = time_calls(
+        lambda v: index.search_vectors(v, limit=LIMIT), queries)
+    results['local (filtered)'] = time_calls(
+        lambda v: index.search_vectors(v, limit=LIMIT, query_filter=church), queries)
+
+    start = time.perf_counter()
+    index.search_vectors(queries, limit=LIMIT)
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    if Config.QDRANT_URL:
+        uploader = QdrantUploader(
+            url=Config.QDRANT_URL,
+            api_key=Config.QDRANT_API_KEY,
+            collection_name=Config.COLLECTION_NAME,
+            vector_size=Config.VECTOR_SIZE
+        )
+
+        def remote(vector, query_filter=None):
+            return uploader.client.query_points(
+                collection_name=Config.COLLECTION_NAME,
+                query=vector.tolist(),
+                query_filter=query_filter,
+                limit=LIMIT,
+                with_payload=True
+            )
+
+        results['qdrant'] = time_calls(remote, queries)
+        results['qdrant (filtered)'] = time_calls(lambda v: remote(v, church), queries)
+    else:
+        print("\n QDRANT_URL not set - skipping the remote path")
+
+    print(f"\n Latency per query ({NUM_QUERIES} queries, top-{LIMIT}):")
+    for name, latencies in results.items():
+        p50, p99 = percentiles(latencies)
+        print(f"   {name:<18} p50 {p50:7.2f} ms   p99 {p99:7.2f} ms")
+    print(f"\n Local batch of {NUM_QUERIES} queries: {batch_ms:.2f} ms total")
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_local_search()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,95 @@
+# BENCHMARK: one point per record vs one point per translation pair
+"""
+Builds the same synthetic bilingual corpus twice: one point per EN/RU
+record, and one point per translation pair with ``en``/``ru`` named
+vectors. Reports point count, stored payload size, how many distinct
+attractions fill the top 10, and search latency.
+
+Needs a Qdrant server; by default a local one
+(docker run -p 6333:6333 qdrant/qdrant). Set BENCH_QDRANT_URL to use
+another. The benchmark collections are deleted at the end.
+"""
+
+import json
+import logging
+import os
+import time
+import numpy as np
+from collection_stats import iter_points
+from qdrant_uploader import QdrantUploader
+from searcher import AttractionSearcher
+from synthetic_corpus import BASE_SIZE, synthetic_records
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+QDRANT_URL = os.getenv('BENCH_QDRANT_URL', 'http://localhost:6333')
+QDRANT_API_KEY = os.getenv('BENCH_QDRANT_API_KEY')
+SCALE = int(os.getenv('BENCH_SCALE', '10'))
+NUM_QUERIES = 200
+LIMIT = 10
+
+
+def build(name: str, data, paired: bool) -> AttractionSearcher:
+    """Create and fill one benchmark collection; return a searcher on it."""
+    uploader = QdrantUploader(url=QDRANT_URL, api_key=QDRANT_API_KEY,
+                              collection_name=name, vector_size=384, paired=paired)
+    uploader.create_collection(recreate=True)
+    uploader.upload_data(data, batch_size=256)
+    return AttractionSearcher(collection_name=name, client=uploader.client, paired=paired)
+
+
+def benchmark_paired_points():
+    """Compare per-record and paired collections on the same corpus."""
+    print(" BENCHMARK: paired points")
+    data = synthetic_records(BASE_SIZE * SCALE)
+    print(f"   Corpus: {SCALE}x = {len(data)} records")
+
+    searchers = {
+        'per record': build('bench_records', data, paired=False),
+        'paired': build('bench_pairs', data, paired=True),
+    }
+
+    # stored vectors with noise as queries, so no model is needed
+    rng = np.random.default_rng(1)
+    rows = rng.choice(len(data), NUM_QUERIES, replace=False)
+    queries = data.vectors[rows] + rng.normal(0, 0.05, (NUM_QUERIES, data.vectors.shape[1]))
+    queries = queries.astype(np.float32)
+
+    try:
+        print(f"\n {'collection':<12} {'points':>8} {'payload MB':>11} "
+              f"{'sites/top' + str(LIMIT):>12} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, searcher in searchers.items():
+            points = searcher.client.count(searcher.collection_name, exact=True).count
+            payload_bytes = sum(len(json.dumps(p.payload, ensure_ascii=False).encode('utf-8'))
+                                for p in iter_points(searcher.client, searcher.collection_name))
+
+            # bypass the model: hand the searcher precomputed query vectors
+            searcher.encode_queries = lambda texts: queries[[int(t) for t in texts]]
+            sites, ms = [], []
+            for i in range(NUM_QUERIES):
+                start = time.perf_counter()
+                hits = searcher.search(str(i), limit=LIMIT, with_payload=['photo_name'])
+                ms.append((time.perf_counter() - start) * 1000)
+                sites.append(len({hit.payload['photo_name'] for hit in hits}))
+
+            print(f" {name:<12} {points:>8} {payload_bytes / 1e6:>11.2f} "
+                  f"{np.mean(sites):>12.1f} {np.percentile(ms, 50):>8.2f} "
+                  f"{np.percentile(ms, 99):>8.2f}")
+    finally:
+        for searcher in searchers.values():
+            searcher.client.delete_collection(searcher.collection_name)
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_paired_points()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,93 @@
+# BENCHMARK: payload projection
+"""
+Response size and latency of top-k searches with full payloads vs projected
+payloads (heavy text fields excluded, or only the fields a result card needs).
+Query vectors are taken from stored points, so no model is loaded.
+"""
+
+import json
+import logging
+import pickle
+import time
+import numpy as np
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PayloadSelectorExclude, VectorParams
+from config import Config
+from embedded_records import EmbeddedRecords
+from qdrant_uploader import HEAVY_FIELDS, QdrantUploader
+from searcher import CARD_FIELDS
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+NUM_QUERIES = 50
+LIMITS = [5, 10, 20]
+PROJECTIONS = {
+    'full payload': True,
+    'no heavy fields': PayloadSelectorExclude(exclude=list(HEAVY_FIELDS)),
+    'card fields': CARD_FIELDS,
+}
+
+
+def local_collection() -> QdrantClient:
+    """In-memory collection from processed_data.pkl (sizes only, no network)."""
+    with open('../data/processed_data.pkl', 'rb') as f:
+        df = pickle.load(f)
+
+    client = QdrantClient(':memory:')
+    client.create_collection(
+        collection_name=Config.COLLECTION_NAME,
+        vectors_config=VectorParams(size=Config.VECTOR_SIZE, distance=Distance.COSINE)
+    )
+    client.upload_points(Config.COLLECTION_NAME,
+                         points=QdrantUploader._iter_points([EmbeddedRecords.from_dataframe(df)]))
+    return client
+
+
+def benchmark_payload_projection():
+    """Measure payload bytes and latency per projection and top-k."""
+    print(" BENCHMARK: payload projection")
+
+    if Config.QDRANT_URL:
+        client = QdrantClient(url=Config.QDRANT_URL, api_key=Config.QDRANT_API_KEY, timeout=60)
+    else:
+        print("\n QDRANT_URL not set - using an in-memory collection (latency is not comparable)")
+        client = local_collection()
+
+    points, _ = client.scroll(Config.COLLECTION_NAME, limit=NUM_QUERIES,
+                              with_payload=False, with_vectors=True)
+    queries = [p.vector for p in points]
+    print(f"\n {len(queries)} query vectors")
+
+    print(f"\n {'projection':<16} {'top-k':>5} {'payload KB':>11} {'p50 ms':>8} {'p99 ms':>8}")
+    for limit in LIMITS:
+        for name, with_payload in PROJECTIONS.items():
+            sizes, latencies = [], []
+            for vector in queries:
+                start = time.perf_counter()
+                hits = client.query_points(
+                    collection_name=Config.COLLECTION_NAME,
+                    query=vector,
+                    limit=limit,
+                    with_payload=with_payload
+                ).points
+                latencies.append((time.perf_counter() - start) * 1000)
+                sizes.append(len(json.dumps([h.payload for h in hits],
+                                            ensure_ascii=False).encode('utf-8')))
+
+            print(f" {name:<16} {limit:>5} {np.mean(sizes) / 1024:>11.1f} "
+                  f"{np.percentile(latencies, 50):>8.2f} {np.percentile(latencies, 99):>8.2f}")
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_payload_projection()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,71 @@
+# BENCHMARK: import time and cold start
+"""
+Measures what a short-lived worker pays on spin-up: module import time,
+EmbeddingsGenerator construction, model load + first encode, and a warm encode.
+Every step runs in a fresh interpreter.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RUNS = 3
+
+STEPS = {
+    'import config': "import config",
+    'import embeddings': "import embeddings",
+    'construct generator': (
+        "from config import Config\n"
+        "from embeddings import EmbeddingsGenerator\n"
+        "EmbeddingsGenerator(Config.EMBEDDING_MODEL, device='cpu')"
+    ),
+    'first encode (cold)': (
+        "from config import Config\n"
+        "from embeddings import EmbeddingsGenerator\n"
+        "EmbeddingsGenerator(Config.EMBEDDING_MODEL, device='cpu').encode_texts(['test'], show_progress=False)"
+    ),
+}
+
+
+def run_step(code: str) -> float:
+    """Run code in a fresh interpreter and return wall time in seconds."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                   stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def benchmark_startup():
+    """Time each startup step in fresh processes."""
+    print(" BENCHMARK: import time and cold start")
+
+    baseline = min(run_step("pass") for _ in range(RUNS))
+    print(f"\n Bare interpreter: {baseline * 1000:.0f} ms")
+
+    for name, code in STEPS.items():
+        best = min(run_step(code) for _ in range(RUNS))
+        print(f"   {name:<22} {(best - baseline) * 1000:>8.0f} ms")
+
+    # warm encode, measured inside one process after warmup()
+    sys.path.insert(0, str(ROOT))
+    from config import Config
+    from embeddings import EmbeddingsGenerator
+
+    embedder = EmbeddingsGenerator(Config.EMBEDDING_MODEL, device='cpu')
+    embedder.warmup()
+    start = time.perf_counter()
+    embedder.encode_texts(['test'], show_progress=False)
+    print(f"   {'warm encode':<22} {(time.perf_counter() - start) * 1000:>8.1f} ms")
+
+    print("\n Benchmark completed!")
+
+
+if __name__ == "__main__":
+    try:
+        benchmark_startup()
+    except Exception as e:
+        print(f"\nBENCHMARK FAILED: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,88 @@
+# BENCHMARK BASELINE: save and compare offline benchmark results
+"""
+Saves the offline benchmark suite's results as a baseline JSON and
+compares later runs against it.
+
+    python tests/benchmarks/baseline.py save       # writes baseline.json
+    python tests/benchmarks/baseline.py compare    # fails on a >10% slowdown
+
+Timings depend on the machine, so save the baseline on the box that runs
+the comparison. BENCH_SCALES applies to both runs; only benchmarks present
+in both files are compared.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+BENCH_DIR = Path(__file__).resolve().parent
+BASELINE_FILE = BENCH_DIR / 'baseline.json'
+
+
+def run_suite(json_path: Path) -> Dict[str, float]:
+    """Run the benchmark suite; return mean seconds per benchmark name."""
+    subprocess.run([sys.executable, '-m', 'pytest', str(BENCH_DIR), '-q',
+                    f"--benchmark-json={json_path}"], check=True)
+    with open(json_path) as f:
+        return means(json.load(f))
+
+
+def means(report: dict) -> Dict[str, float]:
+    """Benchmark name -> mean seconds from a pytest-benchmark JSON report."""
+    return {bench['name']: bench['stats']['mean'] for bench in report['benchmarks']}
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float],
+            threshold: float) -> bool:
+    """Print the change of every shared benchmark; False if any slowed down too much."""
+    ok = True
+    print(f"\n {'benchmark':<36} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name in sorted(set(baseline) & set(current)):
+        change = current[name] / baseline[name] - 1
+        flag = '  SLOWER' if change > threshold else ''
+        ok = ok and not flag
+        print(f" {name:<36} {baseline[name] * 1000:>8.2f}ms "
+              f"{current[name] * 1000:>8.2f}ms {change:>+7.1%}{flag}")
+
+    missing = sorted(set(baseline) - set(current))
+    if missing:
+        print(f"\n Not run this time: {len(missing)} baseline benchmarks")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('action', choices=['save', 'compare'])
+    parser.add_argument('--baseline', default=str(BASELINE_FILE))
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="allowed slowdown of the mean (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    if args.action == 'save':
+        run_suite(Path(args.baseline))
+        print(f"\n Baseline saved to {args.baseline} "
+              f"(scales: {os.getenv('BENCH_SCALES', 'default')})")
+        return
+
+    with open(args.baseline) as f:
+        baseline = means(json.load(f))
+    with tempfile.TemporaryDirectory() as tmp:
+        current = run_suite(Path(tmp) / 'current.json')
+
+    if not compare(baseline, current, args.threshold):
+        print(f"\n Benchmarks slower than the baseline by more than {args.threshold:.0%}")
+        sys.exit(1)
+    print("\n No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except subprocess.CalledProcessError as e:
+        print(f"\nBENCHMARK FAILED: suite exited with {e.returncode}")
+        sys.exit(e.returncode)
@@ -0,0 +1,87 @@
+# offline benchmark fixtures
+"""
+Fixtures for the offline benchmark suite: synthetic corpora at several
+scales, a stub embedding model and an in-process Qdrant client.
+Nothing here touches the HF Hub, Qdrant Cloud or Cloudinary.
+"""
+
+import os
+import sys
+import zlib
+from pathlib import Path
+import numpy as np
+import pytest
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(TESTS_DIR.parent), str(TESTS_DIR)]
+
+from embeddings import EmbeddingsGenerator  # noqa: E402
+from synthetic_corpus import BASE_SIZE, synthetic_records  # noqa: E402
+
+# corpus scales to run, as multiples of the real dataset; 100x needs several
+# GB of RAM for the in-process collections, so it is opt-in (BENCH_SCALES=1,10,100)
+SCALES = [float(s) for s in os.getenv('BENCH_SCALES', '1,10').split(',')]
+DIM = 384
+
+
+class StubModel:
+    """
+    Stand-in for a SentenceTransformer: deterministic vectors derived from a
+    CRC of the text, at a fraction of the model's cost. Benchmarks built on
+    it measure the pipeline around the model, not inference.
+    """
+
+    max_seq_length = 128
+
+    def __init__(self, dim: int = DIM):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dim
+
+    def tokenizer(self, texts, truncation=True, max_length=None):
+        limit = max_length or self.max_seq_length
+        return {'input_ids': [text.split()[:limit] for text in texts]}
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False, convert_to_numpy=True):
+        if isinstance(texts, str):
+            texts = [texts]
+        seeds = [zlib.crc32(text.encode('utf-8')) for text in texts]
+        return np.stack([np.random.default_rng(seed).standard_normal(self.dim)
+                         for seed in seeds]).astype(np.float32)
+
+
+def stub_embedder(**kwargs) -> EmbeddingsGenerator:
+    """EmbeddingsGenerator running on ``StubModel`` (no download, CPU only)."""
+    embedder = EmbeddingsGenerator('stub', device='cpu', **kwargs)
+    embedder._device = 'cpu'
+    embedder._model = StubModel()
+    return embedder
+
+
+@pytest.fixture(scope='session')
+def embedder() -> EmbeddingsGenerator:
+    return stub_embedder()
+
+
+@pytest.fixture(scope='session', params=SCALES, ids=lambda s: f"{s:g}x")
+def corpus(request):
+    """Synthetic ``EmbeddedRecords`` at each scale (built once per scale)."""
+    return synthetic_records(int(BASE_SIZE * request.param), dim=DIM)
+
+
+@pytest.fixture(scope='session')
+def raw_rows(corpus):
+    """Corpus as raw dataset rows, the input of the loader's normalization."""
+    rows = corpus.payloads.drop(columns=['combined_text', 'has_processed_image',
+                                         'image_url']).to_dict('records')
+    for row in rows:
+        row['language'] = row['language'].lower()
+        row['image'] = None
+    return rows
+
+
+@pytest.fixture(scope='session')
+def queries():
+    """Fixed set of query vectors, shared by all search benchmarks."""
+    return synthetic_records(64, dim=DIM, seed=1).vectors
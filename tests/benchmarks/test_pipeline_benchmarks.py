@@ -0,0 +1,145 @@
+# offline pipeline benchmarks
+"""
+pytest-benchmark suite for every stage of the pipeline, on synthetic
+corpora at 1x and 10x the real dataset (BENCH_SCALES=1,10,100 adds 100x).
+
+Run from the repository root:
+    python tests/benchmarks/baseline.py save
+and compare a later run against the saved baseline:
+    python tests/benchmarks/baseline.py compare
+"""
+
+import pyarrow as pa
+import pytest
+from qdrant_client import QdrantClient
+from data_loader import GeorgianAttractionsDataLoader
+from local_index import LocalIndex
+from qdrant_uploader import QdrantUploader
+from searcher import AttractionFilter, AttractionSearcher
+from sparse_vectors import SparseEncoder
+from conftest import DIM, StubModel
+
+COLLECTION = 'bench'
+
+
+def fresh_uploader(hybrid: bool = False) -> QdrantUploader:
+    """Uploader on an empty in-process collection."""
+    uploader = QdrantUploader(url=None, api_key=None, collection_name=COLLECTION,
+                              vector_size=DIM, client=QdrantClient(':memory:'), hybrid=hybrid)
+    uploader.create_collection(recreate=True)
+    return uploader
+
+
+@pytest.fixture(scope='module')
+def loaded(corpus):
+    """In-process collection holding the corpus (shared by search benchmarks)."""
+    uploader = fresh_uploader()
+    uploader.upload_data(corpus, batch_size=256)
+    return uploader
+
+
+def stub_searcher(client: QdrantClient, hybrid: bool = False) -> AttractionSearcher:
+    searcher = AttractionSearcher(collection_name=COLLECTION, client=client,
+                                  cache_size=0, hybrid=hybrid)
+    searcher.embedder._device = 'cpu'
+    searcher.embedder._model = StubModel()
+    return searcher
+
+
+@pytest.fixture(scope='module')
+def searcher(loaded):
+    return stub_searcher(loaded.client)
+
+
+@pytest.fixture(scope='module')
+def hybrid_searcher(corpus):
+    """Searcher on an in-process hybrid (dense + sparse) collection."""
+    uploader = fresh_uploader(hybrid=True)
+    uploader.upload_data(corpus, batch_size=256)
+    return stub_searcher(uploader.client, hybrid=True)
+
+
+def test_normalize_records(benchmark, raw_rows):
+    """Row-by-row normalization (``load``)."""
+    result = benchmark(lambda: [GeorgianAttractionsDataLoader._normalize_record(row, i)
+                                for i, row in enumerate(raw_rows)])
+    assert len(result) == len(raw_rows)
+
+
+def test_normalize_table(benchmark, raw_rows):
+    """Columnar Arrow normalization (``load_columnar``)."""
+    table = pa.Table.from_pylist(raw_rows)
+    result = benchmark(GeorgianAttractionsDataLoader._normalize_table, table)
+    assert result.num_rows == len(raw_rows)
+
+
+def test_combined_text(benchmark, embedder, corpus):
+    records = corpus.payloads.to_dict('records')
+    texts = benchmark(lambda: [embedder.create_combined_text(r) for r in records])
+    assert len(texts) == len(records)
+
+
+def test_encode(benchmark, embedder, corpus):
+    """Batching and copying around the (stub) model."""
+    texts = corpus.payloads['combined_text'].tolist()
+    vectors = benchmark.pedantic(embedder.encode_texts, args=(texts,),
+                                 kwargs={'batch_size': 64, 'show_progress': False},
+                                 rounds=3)
+    assert vectors.shape == (len(texts), DIM)
+
+
+def test_upload_data(benchmark, corpus):
+    """Point building and upsert into an empty in-process collection."""
+    def setup():
+        return (fresh_uploader(),), {}
+
+    def upload(uploader):
+        uploader.upload_data(corpus, batch_size=256)
+        return uploader
+
+    uploader = benchmark.pedantic(upload, setup=setup, rounds=1)
+    assert uploader.client.count(COLLECTION).count == len(corpus)
+
+
+def test_paired_points(benchmark, corpus):
+    """Grouping EN/RU translations into one point per pair."""
+    points = benchmark(lambda: list(QdrantUploader._iter_paired_points([corpus])))
+    assert len(points) == (len(corpus) + 1) // 2
+
+
+def test_search(benchmark, searcher):
+    """One query end to end: (stub) encoding, query_points, payloads."""
+    hits = benchmark(searcher.search, "ancient churches", limit=10)
+    assert len(hits) == 10
+
+
+def test_search_filtered(benchmark, searcher):
+    query_filter = AttractionFilter(category='Church', language='EN')
+    texts = [f"query {i}" for i in range(16)]
+    hits = benchmark(searcher.search_batch, texts, limit=10, query_filter=query_filter)
+    assert len(hits) == len(texts)
+
+
+def test_search_batch(benchmark, searcher):
+    texts = [f"query {i}" for i in range(64)]
+    hits = benchmark(searcher.search_batch, texts, limit=10)
+    assert len(hits) == len(texts)
+
+
+def test_sparse_encode(benchmark, corpus):
+    """BM25 document vectors for every ``combined_text``."""
+    texts = corpus.payloads['combined_text'].tolist()
+    vectors = benchmark(SparseEncoder().fit(texts).encode_documents, texts)
+    assert len(vectors) == len(texts)
+
+
+def test_search_hybrid(benchmark, hybrid_searcher):
+    """Dense + sparse prefetch with RRF fusion in one request."""
+    hits = benchmark(hybrid_searcher.search_hybrid, "Tbilisi Church 12", limit=10)
+    assert len(hits) == 10
+
+
+def test_local_index_search(benchmark, corpus, queries, tmp_path_factory):
+    index = LocalIndex.build(corpus, tmp_path_factory.mktemp('index'))
+    hits = benchmark(index.search_vectors, queries, limit=10)
+    assert len(hits) == len(queries)
@@ -0,0 +1,101 @@
+# EVALUATION: search quality vs exact ground truth
+"""
+Recall@k, MRR and latency of Qdrant search for several search-time
+configurations, against exact nearest neighbours computed with NumPy over
+the vectors stored in the collection.
+
+Two query sets are used: the multilingual text queries from the search tests,
+and stored vectors with noise added (many queries, no model cost).
+"""
+
+import logging
+import numpy as np
+from collection_profiles import search_params
+from config import Config
+from search_eval import SearchEvaluator
+from searcher import AttractionSearcher
+from translation_pairs import vector_name
+
+# setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+K = 10
+NUM_NOISY_QUERIES = 200
+
+# queries from test_qdrant_search.py and test_full_rag.py, plus a few more
+TEXT_QUERIES = [
+    "пляжи в Батуми",
+    "ancient churches in Georgia",
+    "горы и природа",
+    "museums in Tbilisi",
+    "wine tasting",
+    "Borjomi National Park",
+    "пляжи Батуми",
+    "churches",
+    "lakes",
+    "Svetitskhoveli",
+    "крепости и замки",
+    "waterfalls and canyons",
+]
+
+CONFIGS = {
+    'server default': search_params(),
+    'hnsw_ef=16': search_params(hnsw_ef=16),
+    'hnsw_ef=32': search_params(hnsw_ef=32),
+    'hnsw_ef=64': search_params(hnsw_ef=64),
+    'hnsw_ef=128': search_params(hnsw_ef=128),
+    'hnsw_ef=256': search_params(hnsw_ef=256),
+    'exact (full scan)': search_params(exact=True),
+}
+
+
+def evaluate_search():
+    """Evaluate every configuration on both query sets."""
+    print(" Evaluation: search quality")
+    Config.validate_qdrant()
+
+    searcher = AttractionSearcher(
+        url=Config.QDRANT_URL,
+        api_key=Config.QDRANT_API_KEY,
+        collection_name=Config.COLLECTION_NAME,
+        model_name=Config.EMBEDDING_MODEL,
+        backend=Config.EMBEDDING_BACKEND,
+        hybrid=Config.HYBRID_SEARCH,
+        paired=Config.PAIR_TRANSLATIONS
+    )
+    # paired collections: evaluate the English vectors
+    using = vector_name('EN') if Config.PAIR_TRANSLATIONS else searcher.vector_name
+    evaluator = SearchEvaluator(searcher.client, Config.COLLECTION_NAME, using=using)
+    evaluator.load_corpus()
+    if not len(evaluator.ids):
+        print(" Collection is empty, nothing to evaluate")
+        return
+
+    print(f"\n Text queries ({len(TEXT_QUERIES)}):")
+    text_vectors = searcher.encode_queries(TEXT_QUERIES)
+    report = evaluator.evaluate(text_vectors, CONFIGS, k=K)
+    evaluator.print_report(report, k=K)
+
+    # small collections: one query per point at most
+    num_noisy = min(NUM_NOISY_QUERIES, len(evaluator.vectors))
+    print(f"\n Noisy corpus queries ({num_noisy}):")
+    rng = np.random.default_rng(0)
+    rows = rng.choice(len(evaluator.vectors), num_noisy, replace=False)
+    noisy = evaluator.vectors[rows] + rng.normal(0, 0.05, (num_noisy,
+                                                           evaluator.vectors.shape[1]))
+    report = evaluator.evaluate(noisy.astype(np.float32), CONFIGS, k=K)
+    evaluator.print_report(report, k=K)
+
+    print("\n Evaluation completed!")
+
+
+if __name__ == "__main__":
+    try:
+        evaluate_search()
+    except Exception as e:
+        print(f"\nEVALUATION FAILED: {e}")
+        import traceback
+        traceback.print_exc()
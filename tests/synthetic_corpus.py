@@ -0,0 +1,98 @@
+# synthetic corpus
+"""
+Synthetic attraction records for benchmarks that must not touch the HF Hub.
+
+Records have the same columns as the processed dataset. Every attraction
+appears twice, as an EN and an RU record sharing ``photo_name``, like the
+real bilingual corpus. Vectors cluster by category, and an RU vector lies
+close to its EN counterpart, so filters and nearest neighbours behave
+roughly like real embeddings.
+"""
+
+import numpy as np
+import pandas as pd
+from embedded_records import EmbeddedRecords
+
+# size of the real dataset; scale=10 means 10x this many records
+BASE_SIZE = 1715
+
+CATEGORIES = ['Church', 'Monastery', 'Museum', 'Fortress', 'Park', 'Lake', 'Waterfall',
+              'Cave', 'Beach', 'Mountain', 'Canyon', 'Historical Site', 'Resort', 'Winery']
+LOCATIONS = ['Tbilisi', 'Batumi', 'Kutaisi', 'Mtskheta', 'Borjomi', 'Kakheti', 'Svaneti',
+             'Kazbegi', 'Imereti', 'Samegrelo', 'Guria', 'Racha', 'Tusheti', 'Adjara']
+TAGS = ['history', 'nature', 'architecture', 'hiking', 'religion', 'unesco', 'wine',
+        'family', 'views', 'sea', 'mountains', 'culture', 'medieval', 'photography']
+WORDS = ['ancient', 'beautiful', 'famous', 'located', 'century', 'valley', 'river',
+         'stone', 'walls', 'tourists', 'visit', 'view', 'old', 'city', 'region', 'built']
+
+
+def _text(rng: np.random.Generator, words: int) -> str:
+    return ' '.join(rng.choice(WORDS, words)).capitalize() + '.'
+
+
+def synthetic_records(n: int, dim: int = 384, seed: int = 0,
+                      start: int = 0) -> EmbeddedRecords:
+    """
+    Generate ``n`` records (``n // 2`` EN/RU pairs, rounded up).
+
+    Parameters:
+    n : int
+        Number of records
+    dim : int
+        Vector size
+    seed : int
+        Random seed; the same seed gives the same records
+    start : int
+        First record ID (lets chunks of one corpus have unique IDs)
+    """
+    rng = np.random.default_rng(seed + start)
+    centroids = np.random.default_rng(seed).normal(size=(len(CATEGORIES), dim))
+
+    pairs = (n + 1) // 2
+    category = (rng.zipf(1.6, pairs) - 1) % len(CATEGORIES)
+    location = rng.integers(0, len(LOCATIONS), pairs)
+    has_image = rng.random(pairs) < 0.9
+
+    base = centroids[category] + rng.normal(0, 1.0, (pairs, dim))
+    vectors = np.repeat(base, 2, axis=0)
+    vectors[1::2] += rng.normal(0, 0.3, (pairs, dim))
+    vectors = vectors[:n]
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    rows = []
+    for i in range(n):
+        pair = i // 2
+        language = 'EN' if i % 2 == 0 else 'RU'
+        name = f"{LOCATIONS[location[pair]]} {CATEGORIES[category[pair]]} {start // 2 + pair}"
+        description = _text(rng, int(rng.integers(40, 120)))
+        tags = list(rng.choice(TAGS, int(rng.integers(1, 5)), replace=False))
+        rows.append({
+            'id': str(start + i),
+            'name': name if language == 'EN' else name + ' (RU)',
+            'description': description,
+            'location': LOCATIONS[location[pair]],
+            'category': CATEGORIES[category[pair]],
+            'tags': tags,
+            'language': language,
+            'photo_name': f"photo_{start // 2 + pair}.jpg",
+            'photo_author': 'Synthetic',
+            'license': 'CC BY-SA 4.0',
+            'has_processed_image': bool(has_image[pair]),
+            'image_url': None,
+            'combined_text': (f"Name: {name} | Description: {description} | "
+                              f"Category: {CATEGORIES[category[pair]]} | "
+                              f"Location: {LOCATIONS[location[pair]]} | Tags: {', '.join(tags)}"),
+        })
+
+    return EmbeddedRecords(vectors.astype(np.float32), pd.DataFrame(rows))
+
+
+def iter_synthetic(scale: float = 1, chunk_size: int = 10000, dim: int = 384,
+                   seed: int = 0):
+    """Yield a ``scale`` x ``BASE_SIZE`` corpus in chunks (for ``upload_stream``)."""
+    total = int(BASE_SIZE * scale)
+    # even chunk size keeps EN/RU pairs in one chunk
+    chunk_size += chunk_size % 2
+    for start in range(0, total, chunk_size):
+        yield synthetic_records(min(chunk_size, total - start), dim=dim, seed=seed,
+                                start=start)
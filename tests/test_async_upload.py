@@ -0,0 +1,152 @@
+# TEST: async Qdrant upload
+"""
+Runs the async uploader against an in-process Qdrant stand-in (":memory:")
+that adds per-request latency and periodic transient failures, and checks
+that every point arrives, failures are retried and no more than
+``max_in_flight`` upserts run at once. The sequential upsert loop is timed
+for comparison only. Runs offline, no credentials needed.
+"""
+
+import asyncio
+import logging
+import time
+import numpy as np
+import pandas as pd
+from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client.http.exceptions import ResponseHandlingException
+from qdrant_client.models import Distance, PointStruct, VectorParams
+from async_qdrant_uploader import AsyncQdrantUploader
+from embedded_records import EmbeddedRecords
+from qdrant_uploader import build_payloads
+
+# setup logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+COLLECTION = 'async_upload_test'
+VECTOR_SIZE = 384
+N_RECORDS = 2000
+LATENCY = 0.05          # seconds per upsert request
+FAIL_EVERY = 4          # every 4th upsert request fails transiently
+MAX_IN_FLIGHT = 8
+
+
+class SlowAsyncQdrant(AsyncQdrantClient):
+    """In-memory async Qdrant with simulated network latency and failures."""
+
+    def __init__(self, latency: float, fail_every: int):
+        super().__init__(':memory:')
+        self.latency = latency
+        self.fail_every = fail_every
+        self.requests = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def upsert(self, *args, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            self.requests += 1
+            failing = self.fail_every and self.requests % self.fail_every == 0
+            await asyncio.sleep(self.latency)
+            if failing:
+                self.failures += 1
+                raise ResponseHandlingException(ConnectionError("simulated failure"))
+            return await super().upsert(*args, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+def make_records(n: int) -> EmbeddedRecords:
+    """Synthetic records with random vectors."""
+    rng = np.random.default_rng(0)
+    payloads = pd.DataFrame({
+        'id': [str(i) for i in range(n)],
+        'name': [f"Attraction {i}" for i in range(n)],
+        'description': ["Synthetic description"] * n,
+        'location': ["Tbilisi"] * n,
+        'category': ["Church"] * n,
+        'language': ["EN"] * n,
+        'tags': [["test"]] * n,
+        'photo_name': [""] * n,
+        'photo_author': [""] * n,
+        'license': [""] * n,
+        'has_processed_image': [False] * n,
+        'image_url': [None] * n,
+        'combined_text': ["Name: test"] * n,
+    })
+    return EmbeddedRecords(rng.standard_normal((n, VECTOR_SIZE), dtype=np.float32), payloads)
+
+
+def sequential_upload(data: EmbeddedRecords, batch_size: int = 100) -> float:
+    """The original synchronous loop: one blocking upsert after another."""
+    client = QdrantClient(':memory:')
+    client.create_collection(COLLECTION, vectors_config=VectorParams(
+        size=VECTOR_SIZE, distance=Distance.COSINE))
+
+    payloads = build_payloads(data.payloads)
+    start = time.perf_counter()
+    for i in range(0, len(data), batch_size):
+        time.sleep(LATENCY)
+        client.upsert(COLLECTION, points=[
+            PointStruct(id=j, vector=data.vectors[j].tolist(), payload=payloads[j])
+            for j in range(i, min(i + batch_size, len(data)))
+        ])
+    return time.perf_counter() - start
+
+
+async def async_upload(data: EmbeddedRecords, fail_every: int):
+    """Upload through AsyncQdrantUploader against the stand-in."""
+    client = SlowAsyncQdrant(LATENCY, fail_every)
+    uploader = AsyncQdrantUploader(None, None, COLLECTION, VECTOR_SIZE,
+                                   max_in_flight=MAX_IN_FLIGHT, base_delay=0.01, max_delay=0.2,
+                                   target_latency=0.2, client=client)
+    await uploader.create_collection()
+
+    start = time.perf_counter()
+    uploaded = await uploader.upload_data(data, batch_size=100)
+    elapsed = time.perf_counter() - start
+
+    count = (await client.count(COLLECTION, exact=True)).count
+    await uploader.close()
+    return {'uploaded': uploaded, 'count': count, 'elapsed': elapsed,
+            'failed': uploader.failed_ids, 'retried': client.failures,
+            'max_in_flight': client.max_in_flight, 'batch_size': uploader.batch_size,
+            'batch_bounds': (uploader.min_batch_size, uploader.max_batch_size)}
+
+
+def test_async_upload():
+    """Async upload writes every point, retries failures and bounds concurrency."""
+    print(" TEST: async Qdrant upload")
+    data = make_records(N_RECORDS)
+
+    sync_time = sequential_upload(data)
+    print(f"\n Sequential loop: {sync_time:.2f}s ({N_RECORDS / sync_time:.0f} points/s)")
+
+    result = asyncio.run(async_upload(data, FAIL_EVERY))
+    print(f" Async uploader: {result['elapsed']:.2f}s "
+          f"({N_RECORDS / result['elapsed']:.0f} points/s), "
+          f"{result['retried']} simulated failures retried")
+    print(f"   Speedup: {sync_time / result['elapsed']:.1f}x (informational)")
+    print(f"   Peak upserts in flight: {result['max_in_flight']}")
+
+    assert not result['failed']
+    assert result['uploaded'] == result['count'] == N_RECORDS
+    assert result['retried'] > 0
+    assert 1 < result['max_in_flight'] <= MAX_IN_FLIGHT
+    low, high = result['batch_bounds']
+    assert low <= result['batch_size'] <= high
+
+    print("\n Test passed!")
+
+
+if __name__ == "__main__":
+    try:
+        test_async_upload()
+    except Exception as e:
+        print(f"\nTEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
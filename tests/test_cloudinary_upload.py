@@ -32,6 +32,7 @@ def test_cloudinary_upload():
         print("   CLOUDINARY_API_SECRET=your_api_secret")
         return
 
+    Config.validate_cloudinary()
     print(f"\nCloudinary configured")
     print(f"   Cloud: {Config.CLOUDINARY_CLOUD_NAME}")
 
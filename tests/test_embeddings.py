@@ -30,8 +30,12 @@ def test_embeddings():
     # create embeddings generator
     embedder = EmbeddingsGenerator(
         model_name=Config.EMBEDDING_MODEL,
-        device=Config.DEVICE
+        device=Config.DEVICE,
+        cache_dir=Config.EMBEDDING_CACHE_DIR,
+        num_workers=Config.ENCODING_WORKERS,
+        backend=Config.EMBEDDING_BACKEND
     )
+    embedder.warmup()
 
     # generate embeddings
     df = embedder.generate(records, batch_size=Config.BATCH_SIZE)
@@ -4,22 +4,29 @@
 Test complete RAG pipeline: Query -> Search -> Text + Image
 """
 
-from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
 from config import Config
-import torch
+from searcher import AttractionSearcher
+from translation_pairs import localize
 from PIL import Image
 import requests
 from io import BytesIO
 
 print(" Test: full rag pipeline")
+Config.validate_qdrant()
 
 # 1. setup
 print("\n Setting up...")
-device = 'cuda' if torch.cuda.is_available() else 'cpu'
-embedder = SentenceTransformer(Config.EMBEDDING_MODEL, device=device)
-client = QdrantClient(url=Config.QDRANT_URL, api_key=Config.QDRANT_API_KEY)
-print(f" Model loaded on {device}")
+searcher = AttractionSearcher(
+    url=Config.QDRANT_URL,
+    api_key=Config.QDRANT_API_KEY,
+    collection_name=Config.COLLECTION_NAME,
+    model_name=Config.EMBEDDING_MODEL,
+    backend=Config.EMBEDDING_BACKEND,
+    hybrid=Config.HYBRID_SEARCH,
+    paired=Config.PAIR_TRANSLATIONS
+)
+searcher.embedder.warmup()
+print(f" Model loaded on {searcher.embedder.device}")
 print(f" Connected to Qdrant")
 
 # 2. test queries
@@ -37,17 +44,16 @@ for query in test_queries:
 
     # Step 1: create embedding
     print("\n Step 1: Creating query embedding...")
-    query_vector = embedder.encode(query).tolist()
+    query_vector = searcher.encode_queries([query])[0]
     print(f" Vector created (size: {len(query_vector)})")
 
-    # Step 2: search in Qdrant
+    # Step 2: search in Qdrant (query vector comes from the cache);
+    # hybrid collections fuse dense and keyword results in the same request
     print("\n Step 2: Searching in Qdrant...")
-    results = client.search(
-        collection_name=Config.COLLECTION_NAME,
-        query_vector=query_vector,
-        limit=3,
-        with_payload=True
-    )
+    if Config.HYBRID_SEARCH:
+        results = searcher.search_hybrid(query, limit=3)
+    else:
+        results = searcher.search(query, limit=3)
     print(f" Found {len(results)} results")
 
     # Step 3: display results
@@ -55,16 +61,18 @@ for query in test_queries:
 
     for i, result in enumerate(results, 1):
         print(f"Result #{i} (Score: {result.score:.4f})")
+        # paired collections store text per language; show the English one
+        payload = localize(result.payload)
 
         # text data
-        print(f" Name: {result.payload['name']}")
-        print(f" Location: {result.payload['location']}")
-        print(f" Category: {result.payload['category']}")
-        print(f" Language: {result.payload['language']}")
-        print(f" Description: {result.payload['description'][:200]}...")
+        print(f" Name: {payload['name']}")
+        print(f" Location: {payload['location']}")
+        print(f" Category: {payload['category']}")
+        print(f" Language: {payload['language']}")
+        print(f" Description: {payload['description'][:200]}...")
 
         # image
-        image_url = result.payload.get('image_url')
+        image_url = payload.get('image_url')
         if image_url:
             print(f"\n  Image URL: {image_url}")
 
@@ -81,6 +89,7 @@ for query in test_queries:
         else:
             print(f"\n No image available")
 
+print(f"\n Query cache: {searcher.cache_stats()}")
 print(" Test completed")
 print("   1. Query -> Embedding ")
 print("   2. Search in Qdrant ")
@@ -0,0 +1,112 @@
+# TEST: image preprocessing and rendition upload
+"""
+Runs ImagePreprocessor and CloudinaryUploader.upload_preprocessed on a
+small in-memory dataset, with the Cloudinary upload call replaced by a
+recorder. Runs offline, no credentials needed.
+"""
+
+import json
+import logging
+import tempfile
+from io import BytesIO
+from pathlib import Path
+import cloudinary.uploader
+from datasets import Dataset, Features, Value
+from datasets import Image as ImageFeature
+from PIL import Image
+import cloudinary_uploader
+import image_preprocessor
+from cloudinary_uploader import CloudinaryUploader
+from image_preprocessor import ImagePreprocessor
+
+# setup logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+def png_bytes(color: str, size=(2000, 1000)) -> bytes:
+    """Encoded test image."""
+    buffer = BytesIO()
+    Image.new('RGB', size, color).save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def make_dataset() -> Dataset:
+    """EN/RU records sharing one photo, one record with another photo, one without."""
+    shared, other = png_bytes('red'), png_bytes('blue')
+    images = [{'bytes': shared, 'path': None}, {'bytes': shared, 'path': None},
+              {'bytes': other, 'path': None}, None]
+    return Dataset.from_dict(
+        {'id': ['1', '2', '3', '4'], 'image': images},
+        features=Features({'id': Value('string'), 'image': ImageFeature()})
+    )
+
+
+def test_image_preprocessor():
+    """Shared photos are rendered and uploaded once; manifests do not mix."""
+    print(" TEST: image preprocessing")
+    dataset = make_dataset()
+    # both modules load the dataset by name; serve the in-memory one instead
+    image_preprocessor.load_dataset = lambda name, split: dataset
+    cloudinary_uploader.load_dataset = lambda name, split: dataset
+
+    uploads = []
+
+    def fake_upload(data, public_id, folder, resource_type):
+        uploads.append(public_id)
+        return {'secure_url': f"https://cdn.test/{public_id}"}
+
+    cloudinary.uploader.upload = fake_upload
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        preprocessor = ImagePreprocessor(cache_dir=str(tmp / 'cache'), max_size=800,
+                                         thumb_size=100, num_workers=2)
+
+        hashes = preprocessor.process('test')
+        assert set(hashes) == {'1', '2', '3'}
+        assert hashes['1'] == hashes['2'] != hashes['3']
+
+        full, thumb = preprocessor.renditions(hashes['1'])
+        assert max(Image.open(full).size) == 800
+        assert max(Image.open(thumb).size) == 100
+
+        uploader = CloudinaryUploader('test', 'key', 'secret')
+        image_urls, thumbnail_urls = uploader.upload_preprocessed(
+            'test', preprocessor,
+            output_file=str(tmp / 'image_urls.json'),
+            thumbnails_file=str(tmp / 'thumbnail_urls.json')
+        )
+        print(f"\n Uploaded: {uploads}")
+        assert len(uploads) == 4
+        assert image_urls['1'] == image_urls['2'] != image_urls['3']
+        assert set(thumbnail_urls) == {'1', '2', '3'}
+        assert (tmp / 'renditions.jsonl').exists()
+
+        # rerun: everything is cached and already uploaded
+        uploads.clear()
+        preprocessor.process('test')
+        uploader.upload_preprocessed('test', preprocessor,
+                                     output_file=str(tmp / 'image_urls.json'),
+                                     thumbnails_file=str(tmp / 'thumbnail_urls.json'))
+        assert not uploads
+
+        # per-record upload afterwards keeps its own, record-keyed manifest
+        uploader.upload_images('test', output_file=str(tmp / 'image_urls.json'))
+        assert sorted(uploads) == ['georgian_attractions/1', 'georgian_attractions/2',
+                                   'georgian_attractions/3']
+        with open(tmp / 'image_urls.json') as f:
+            assert set(json.load(f)) == {'1', '2', '3'}
+
+    print("\n Test passed!")
+
+
+if __name__ == "__main__":
+    try:
+        test_image_preprocessor()
+    except Exception as e:
+        print(f"\nTEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
@@ -56,9 +56,39 @@ def test_data_loader():
     return records
 
 
+def test_streaming_loader():
+    """Test that streamed batches match the eager loader."""
+    print(" TEST: streaming data loader")
+    loader = GeorgianAttractionsDataLoader(Config.DATASET_NAME)
+
+    print("\n Streaming sample (10 records, batches of 4)")
+    batches = list(loader.iter_batches(batch_size=4, sample_size=10))
+    print(f"   Batch sizes: {[len(b) for b in batches]}")
+
+    streamed = [rec for batch in batches for rec in batch]
+    eager = loader.load(sample_size=10)
+
+    assert [r['id'] for r in streamed] == [r['id'] for r in eager]
+    print("\n Test passed!")
+
+
+def test_columnar_loader():
+    """Test that the columnar path produces the same records as load()."""
+    print(" TEST: columnar data loader")
+    loader = GeorgianAttractionsDataLoader(Config.DATASET_NAME)
+
+    eager = loader.load(sample_size=50)
+    columnar = loader.load_columnar(sample_size=50, num_proc=2)
+
+    assert eager == columnar
+    print("\n Test passed!")
+
+
 if __name__ == "__main__":
     try:
         records = test_data_loader()
+        test_streaming_loader()
+        test_columnar_loader()
 
         # ask to continue
         print("\n" + "="*70)
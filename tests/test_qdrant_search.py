@@ -4,19 +4,26 @@
 Testing the search in the Qdrant database
 """
 
-from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
+from collection_stats import CollectionStats
 from config import Config
-import torch
+from searcher import AttractionSearcher
+from translation_pairs import localize
 
 print(" Test: Qdrant search")
+Config.validate_qdrant()
 
 
 print("\n1Connecting to Qdrant...")
-client = QdrantClient(
+searcher = AttractionSearcher(
     url=Config.QDRANT_URL,
-    api_key=Config.QDRANT_API_KEY
+    api_key=Config.QDRANT_API_KEY,
+    collection_name=Config.COLLECTION_NAME,
+    model_name=Config.EMBEDDING_MODEL,
+    backend=Config.EMBEDDING_BACKEND,
+    hybrid=Config.HYBRID_SEARCH,
+    paired=Config.PAIR_TRANSLATIONS
 )
+client = searcher.client
 
 
 collection_info = client.get_collection(Config.COLLECTION_NAME)
@@ -26,9 +33,8 @@ print(f"   Points: {collection_info.points_count}")
 
 
 print("\n Loading embedding model...")
-device = 'cuda' if torch.cuda.is_available() else 'cpu'
-embedder = SentenceTransformer(Config.EMBEDDING_MODEL, device=device)
-print(f" Model loaded on {device}")
+searcher.embedder.warmup()
+print(f" Model loaded on {searcher.embedder.device}")
 
 
 test_queries = [
@@ -41,66 +47,29 @@ test_queries = [
 
 print("\n Testing search...")
 
-for query in test_queries:
-    print(f"\n Query: '{query}'")
-    # create an embedding request
-    query_vector = embedder.encode(query).tolist()
-
-    
-    results = client.search(
-        collection_name=Config.COLLECTION_NAME,
-        query_vector=query_vector,
-        limit=3,  
-        with_payload=True
-    )
+# one encode call and one request for all queries
+batch_results = searcher.search_batch(test_queries, limit=3)
 
+for query, results in zip(test_queries, batch_results):
+    print(f"\n Query: '{query}'")
 
     for i, result in enumerate(results, 1):
-        print(f"\n{i}. {result.payload['name']}")
+        payload = localize(result.payload)
+        print(f"\n{i}. {payload['name']}")
         print(f"   Score: {result.score:.4f}")
-        print(f"   Category: {result.payload['category']}")
-        print(f"   Location: {result.payload['location']}")
-        print(f"   Language: {result.payload['language']}")
-        print(f"   Has image: {result.payload['has_processed_image']}")
-        print(f"   Description: {result.payload['description'][:150]}...")
+        print(f"   Category: {payload['category']}")
+        print(f"   Location: {payload['location']}")
+        print(f"   Language: {payload['language']}")
+        print(f"   Has image: {payload['has_processed_image']}")
+        print(f"   Description: {payload['description'][:150]}...")
 
 print(" Search test completed!")
 
 
-print("\n Scrolling through all records for statistics...")
-
-from collections import Counter
-
-categories = []
-languages = []
-with_images = 0
-
-
-scroll_result = client.scroll(
-    collection_name=Config.COLLECTION_NAME,
-    limit=10000,
-    with_payload=True
-)
-
-for point in scroll_result[0]:
-    categories.append(point.payload['category'])
-    languages.append(point.payload['language'])
-    if point.payload['has_processed_image']:
-        with_images += 1
-
-print("\n Database Statistics:")
-print(f"   Total records: {len(scroll_result[0])}")
-print(f"\n Categories:")
-for cat, count in Counter(categories).most_common():
-    print(f"   - {cat}: {count}")
-
-print(f"\n Languages:")
-for lang, count in Counter(languages).most_common():
-    print(f"   - {lang}: {count}")
+print("\n Collecting statistics (server-side counts and facets)...")
 
-print(f"\n Images:")
-print(f"   - With images: {with_images}")
-print(f"   - Without images: {len(scroll_result[0]) - with_images}")
+stats = CollectionStats(client, Config.COLLECTION_NAME)
+CollectionStats.print_summary(stats.summary())
 
 
-print(" All tests passed!")
+print(" All tests passed!")
\ No newline at end of file
@@ -21,6 +21,7 @@ def test_upload():
     """Upload data to Qdrant."""
 
     print(" Test: Qdrant")
+    Config.validate_qdrant()
 
     # load processed data
     print("\n Loading processed data...")
@@ -34,15 +35,24 @@ def test_upload():
         url=Config.QDRANT_URL,
         api_key=Config.QDRANT_API_KEY,
         collection_name=Config.COLLECTION_NAME,
-        vector_size=Config.VECTOR_SIZE
+        vector_size=Config.VECTOR_SIZE,
+        skip_fields=Config.PAYLOAD_SKIP_FIELDS,
+        on_disk_payload=Config.ON_DISK_PAYLOAD,
+        profile=Config.COLLECTION_PROFILE,
+        hybrid=Config.HYBRID_SEARCH,
+        paired=Config.PAIR_TRANSLATIONS
     )
 
     # create collection
     recreate = input("Recreate collection if exists? (yes/no): ")
     uploader.create_collection(recreate=(recreate.lower() == 'yes'))
 
-    # upload data
-    uploader.upload_data(df, batch_size=100)
+    # upload data (incremental sync touches only new/changed/deleted records)
+    sync = input("Incremental sync instead of full upload? (yes/no): ")
+    if sync.lower() == 'yes':
+        uploader.sync(df, batch_size=100)
+    else:
+        uploader.upload_data(df, batch_size=100)
 
     print(" Qdrant base created successfully!")
     print(f"\n Summary:")
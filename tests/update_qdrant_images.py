@@ -5,9 +5,9 @@ Updates Qdrant records with Cloudinary image URLs.
 
 import json
 import logging
-from qdrant_client import QdrantClient
-from tqdm.auto import tqdm
+from qdrant_client.models import FieldCondition, Filter, MatchValue
 from config import Config
+from qdrant_uploader import QdrantUploader
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +21,7 @@ def update_qdrant_with_images():
     """Update Qdrant records with image URLs from Cloudinary."""
 
     print("Update Qdrant records with image URLs")
+    Config.validate_qdrant()
 
     # load image URLs
     print("\n Loading image URLs...")
@@ -33,59 +34,55 @@ def update_qdrant_with_images():
         print("   Run: python3 test_cloudinary_upload.py first")
         return
 
+    # thumbnails are only produced by the preprocessing stage
+    try:
+        with open('../data/thumbnail_urls.json', 'r') as f:
+            thumbnail_urls = json.load(f)
+        print(f" Loaded {len(thumbnail_urls)} thumbnail URLs")
+    except FileNotFoundError:
+        thumbnail_urls = {}
+
     # connect to Qdrant
-    print("\n Connecting to Qdrant...")
-    client = QdrantClient(
+    uploader = QdrantUploader(
         url=Config.QDRANT_URL,
-        api_key=Config.QDRANT_API_KEY
+        api_key=Config.QDRANT_API_KEY,
+        collection_name=Config.COLLECTION_NAME,
+        vector_size=Config.VECTOR_SIZE
     )
-    print(" Connected to Qdrant")
 
     # get current collection info
-    collection_info = client.get_collection(Config.COLLECTION_NAME)
+    collection_info = uploader.client.get_collection(Config.COLLECTION_NAME)
     print(f"   Collection: {Config.COLLECTION_NAME}")
     print(f"   Points: {collection_info.points_count}")
 
-    # update records
+    # update records (batched, record IDs resolved to point IDs)
     print("\n Updating records with image URLs...")
+    updates = {record_id: {"image_url": image_url} for record_id, image_url in image_urls.items()}
+    for record_id, thumbnail_url in thumbnail_urls.items():
+        updates.setdefault(record_id, {})["thumbnail_url"] = thumbnail_url
+    result = uploader.update_payloads(updates)
 
-    updated = 0
-    failed = 0
-
-    for record_id, image_url in tqdm(image_urls.items(), desc="Updating"):
-        try:
-            # update payload with image_url
-            client.set_payload(
-                collection_name=Config.COLLECTION_NAME,
-                payload={"image_url": image_url},
-                points=[int(record_id)]
-            )
-            updated += 1
-
-        except Exception as e:
-            logger.error(f"Failed to update {record_id}: {e}")
-            failed += 1
-
-    print(f"\n Update cpmleted!")
-    print(f"   Updated: {updated}")
-    print(f"   Failed: {failed}")
-    print(f"   Success rate: {updated/(updated+failed)*100:.1f}%")
+    total = result['updated'] + result['failed']
+    print(f"   Success rate: {result['updated'] / (total if total else 1) * 100:.1f}%")
+    for record_ids, error in result['failed_chunks'][:5]:
+        print(f"   - chunk {record_ids[0]}..{record_ids[-1]}: {error[:100]}")
 
     # verify with sample
     print("\n Verifying update...")
     sample_id = list(image_urls.keys())[0]
 
-    result = client.retrieve(
+    points, _ = uploader.client.scroll(
         collection_name=Config.COLLECTION_NAME,
-        ids=[int(sample_id)],
+        scroll_filter=Filter(must=[FieldCondition(key="id", match=MatchValue(value=str(sample_id)))]),
+        limit=1,
         with_payload=True
     )
 
-    if result and result[0].payload.get('image_url'):
+    if points and points[0].payload.get('image_url'):
         print(f" Verification successful!")
         print(f"   Sample ID: {sample_id}")
-        print(f"   Name: {result[0].payload['name']}")
-        print(f"   Image URL: {result[0].payload['image_url'][:80]}...")
+        print(f"   Name: {points[0].payload['name']}")
+        print(f"   Image URL: {points[0].payload['image_url'][:80]}...")
     else:
         print(f"  Verification failed - no image_url in payload")
 
@@ -0,0 +1,101 @@
+# translation pairs
+"""
+Groups EN/RU translations of one attraction into a single point.
+
+The dataset holds most attractions twice, once per language, with the same
+photo. A paired point carries one named vector per language, text fields
+keyed by language and the shared fields (location, category, image...) once.
+"""
+
+from typing import Any, Dict, List
+import pandas as pd
+
+# languages of the corpus; each gets a named vector in paired collections
+LANGUAGES = ('EN', 'RU')
+
+# payload fields that differ between translations, stored as {language: text}
+TEXT_FIELDS = ('name', 'description', 'combined_text')
+
+
+def vector_name(language: str) -> str:
+    """Named vector of a language in paired collections ('EN' -> 'en')."""
+    return language.lower()
+
+
+def pair_keys(frame: pd.DataFrame) -> pd.Series:
+    """
+    Group key of every record: its ``photo_name``, or its own ``id`` when it
+    has no photo or its photo already has a record in that language.
+    """
+    ids = 'id:' + frame['id'].astype(str)
+    photos = frame['photo_name'].fillna('').astype(str).str.strip()
+    keys = ('photo:' + photos).where(photos != '', ids)
+
+    # the same photo reused by two records of one language: keep them apart
+    clash = pd.DataFrame({'key': keys, 'language': frame['language']}).duplicated()
+    return keys.where(~clash, ids)
+
+
+def group_pairs(frame: pd.DataFrame) -> List[List[int]]:
+    """
+    Row positions of each group, in order of first appearance.
+
+    Raises ValueError for records in a language outside ``LANGUAGES``.
+    """
+    unknown = set(frame['language']) - set(LANGUAGES)
+    if unknown:
+        raise ValueError(f"Cannot pair languages {sorted(unknown)}, only {LANGUAGES}")
+
+    keys = pair_keys(frame).to_numpy()
+    groups = pd.Series(range(len(frame))).groupby(keys, sort=False)
+    return [rows.tolist() for _, rows in groups]
+
+
+def merge_payloads(payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    One payload for a group of translation payloads (from ``build_payloads``).
+
+    ``id`` and ``language`` become lists (so ``MatchValue`` filters on either
+    still match), ``TEXT_FIELDS`` become ``{language: text}``, and the other
+    fields are taken from the first translation, with an image URL from any
+    and the union of all tags.
+    """
+    payloads = sorted(payloads, key=lambda p: LANGUAGES.index(p['language']))
+    merged = {key: value for key, value in payloads[0].items() if key != 'content_hash'}
+
+    merged['id'] = [p['id'] for p in payloads]
+    merged['language'] = [p['language'] for p in payloads]
+    for field in TEXT_FIELDS:
+        if field in merged:
+            merged[field] = {p['language']: p[field] for p in payloads}
+
+    if 'tags' in merged:
+        merged['tags'] = list(dict.fromkeys(t for p in payloads for t in p['tags']))
+    # either field may have been left out by ``skip_fields``
+    if 'has_processed_image' in merged:
+        merged['has_processed_image'] = any(p.get('has_processed_image') for p in payloads)
+    if 'image_url' in merged:
+        merged['image_url'] = next((p['image_url'] for p in payloads if p.get('image_url')),
+                                   None)
+    return merged
+
+
+def localize(payload: Dict[str, Any], language: str = 'EN') -> Dict[str, Any]:
+    """
+    Flat, per-record view of a payload for display.
+
+    Language-keyed fields resolve to ``language`` (or the other translation
+    when it is missing). Per-record payloads are returned unchanged.
+    """
+    if not isinstance(payload.get('language'), list):
+        return payload
+
+    flat = dict(payload)
+    available = payload['language']
+    chosen = language if language in available else available[0]
+    flat['language'] = chosen
+    flat['id'] = payload['id'][available.index(chosen)]
+    for field in TEXT_FIELDS:
+        if isinstance(payload.get(field), dict):
+            flat[field] = payload[field].get(chosen, '')
+    return flat